@@ -0,0 +1,5 @@
+-- CreateIndex
+CREATE INDEX "DerivedMapping_org_systems_confidence_idx" ON "DerivedMapping"("organisationId", "sourceSystemId", "targetSystemId", "confidence");
+
+-- CreateIndex
+CREATE INDEX "MappingEvent_field_pair_idx" ON "MappingEvent"("organisationId", "sourceSystemId", "sourceEntityName", "sourceFieldName", "targetSystemId", "targetEntityName", "targetFieldName");
@@ -200,6 +200,27 @@ describe('bulkRoutes', () => {
     });
   });
 
+  it('clear_mapping updates each mapping once and reports unknown ids', async () => {
+    const response = await postJson(context!.baseUrl, '/api/projects/project-1/mappings/bulk', {
+      operation: 'clear_mapping',
+      mappingIds: ['fm-1', 'fm-2', 'fm-1', 'fm-missing'],
+    });
+
+    expect(response.status).toBe(200);
+    expect(response.body).toMatchObject({
+      applied: 2,
+      skipped: 1,
+      errors: [{ mappingId: 'fm-missing', reason: 'mapping_not_found' }],
+    });
+
+    const state = context!.store.getState();
+    for (const id of ['fm-1', 'fm-2']) {
+      const mapping = state.fieldMappings.find((candidate) => candidate.id === id);
+      expect(mapping?.status).toBe('rejected');
+      expect(mapping?.confidence).toBe(0);
+    }
+  });
+
   it('returns 400 when mappingIds exceed 200', async () => {
     const mappingIds = Array.from({ length: 201 }, (_value, index) => `fm-${index}`);
 
@@ -0,0 +1,84 @@
+import { describe, expect, it } from 'vitest';
+import { ConnectorMetadataCache } from '../services/connectorMetadataCache.js';
+
+describe('ConnectorMetadataCache', () => {
+  it('keys on credentials and object set without exposing secrets', () => {
+    const a = ConnectorMetadataCache.key('salesforce', { password: 'hunter2', username: 'u' }, 'schema', ['Contact', 'Account']);
+    const b = ConnectorMetadataCache.key('salesforce', { username: 'u', password: 'hunter2' }, 'schema', ['Account', 'Contact']);
+    const c = ConnectorMetadataCache.key('salesforce', { username: 'u', password: 'other' }, 'schema', ['Account', 'Contact']);
+
+    expect(a).toBe(b);
+    expect(a).not.toBe(c);
+    expect(a).not.toContain('hunter2');
+  });
+
+  it('shares one load between concurrent misses and caches the result', async () => {
+    const cache = new ConnectorMetadataCache({ ttlMs: 60_000 });
+    let loads = 0;
+    const loader = async () => {
+      loads += 1;
+      await new Promise((resolve) => setTimeout(resolve, 5));
+      return ['Account'];
+    };
+
+    const [first, second] = await Promise.all([
+      cache.getOrLoad('k', loader),
+      cache.getOrLoad('k', loader),
+    ]);
+    const third = await cache.getOrLoad('k', loader);
+
+    expect(first).toEqual(['Account']);
+    expect(second).toBe(first);
+    expect(third).toBe(first);
+    expect(loads).toBe(1);
+  });
+
+  it('does not cache failed loads', async () => {
+    const cache = new ConnectorMetadataCache({ ttlMs: 60_000 });
+    await expect(cache.getOrLoad('k', async () => {
+      throw new Error('login failed');
+    })).rejects.toThrow('login failed');
+
+    await expect(cache.getOrLoad('k', async () => 'ok')).resolves.toBe('ok');
+  });
+
+  it('does not cache results rejected by shouldCache', async () => {
+    const cache = new ConnectorMetadataCache({ ttlMs: 60_000 });
+    let mode = 'mock';
+    const loader = async () => ({ mode });
+    const isLive = (value: { mode: string }) => value.mode === 'live';
+
+    await expect(cache.getOrLoad('k', loader, isLive)).resolves.toEqual({ mode: 'mock' });
+    mode = 'live';
+    await expect(cache.getOrLoad('k', loader, isLive)).resolves.toEqual({ mode: 'live' });
+    mode = 'mock';
+    await expect(cache.getOrLoad('k', loader, isLive)).resolves.toEqual({ mode: 'live' });
+  });
+
+  it('reloads after an entry is deleted', async () => {
+    const cache = new ConnectorMetadataCache({ ttlMs: 60_000 });
+    let loads = 0;
+    const loader = async () => {
+      loads += 1;
+      return loads;
+    };
+
+    await cache.getOrLoad('k', loader);
+    cache.delete('k');
+
+    await expect(cache.getOrLoad('k', loader)).resolves.toBe(2);
+  });
+
+  it('starts a fresh load when deleted while a load is in flight', async () => {
+    const cache = new ConnectorMetadataCache({ ttlMs: 60_000 });
+    let releaseStale: (value: string) => void = () => undefined;
+    const stale = cache.getOrLoad('k', () => new Promise<string>((resolve) => { releaseStale = resolve; }));
+
+    cache.delete('k');
+    await expect(cache.getOrLoad('k', async () => 'fresh')).resolves.toBe('fresh');
+
+    releaseStale('stale');
+    await expect(stale).resolves.toBe('stale');
+    await expect(cache.getOrLoad('k', async () => 'unused')).resolves.toBe('fresh');
+  });
+});
@@ -0,0 +1,95 @@
+import { describe, expect, it } from 'vitest';
+import type { IConnector } from '../../../packages/connectors/IConnector.js';
+import { ConnectorPool } from '../services/connectorPool.js';
+
+function fakeConnector(
+  onConnect: () => void,
+  listObjects: () => Promise<string[]>,
+  mode: () => 'live' | 'mock' = () => 'live',
+): IConnector {
+  return {
+    connect: async () => onConnect(),
+    listObjects,
+    getSystemInfo: async () => ({ mode: mode() }),
+  } as unknown as IConnector;
+}
+
+describe('ConnectorPool', () => {
+  it('connects once and reuses the instance for the same credentials', async () => {
+    let connects = 0;
+    const pool = new ConnectorPool({
+      createConnector: () => fakeConnector(() => { connects += 1; }, async () => ['Account']),
+    });
+
+    await pool.withConnector('salesforce', { username: 'u' }, (c) => c.listObjects());
+    await pool.withConnector('salesforce', { username: 'u' }, (c) => c.listObjects());
+    await pool.withConnector('salesforce', { username: 'other' }, (c) => c.listObjects());
+
+    expect(connects).toBe(2);
+    expect(pool.size).toBe(2);
+  });
+
+  it('evicts the instance when an operation fails', async () => {
+    let connects = 0;
+    let fail = true;
+    const pool = new ConnectorPool({
+      createConnector: () => fakeConnector(() => { connects += 1; }, async () => {
+        if (fail) throw new Error('session expired');
+        return ['Account'];
+      }),
+    });
+
+    await expect(pool.withConnector('sap', {}, (c) => c.listObjects())).rejects.toThrow('session expired');
+    fail = false;
+    await expect(pool.withConnector('sap', {}, (c) => c.listObjects())).resolves.toEqual(['Account']);
+    expect(connects).toBe(2);
+  });
+
+  it('does not keep an instance that fell back to mock mode despite credentials', async () => {
+    let connects = 0;
+    let mode: 'live' | 'mock' = 'mock';
+    const pool = new ConnectorPool({
+      createConnector: () => fakeConnector(() => { connects += 1; }, async () => ['Account'], () => mode),
+    });
+
+    await expect(pool.withConnector('sap', { username: 'u' }, (c) => c.listObjects())).resolves.toEqual(['Account']);
+    expect(pool.size).toBe(0);
+
+    mode = 'live';
+    await pool.withConnector('sap', { username: 'u' }, (c) => c.listObjects());
+    await pool.withConnector('sap', { username: 'u' }, (c) => c.listObjects());
+    expect(connects).toBe(2);
+    expect(pool.size).toBe(1);
+  });
+
+  it('keeps mock instances when no credentials were supplied', async () => {
+    let connects = 0;
+    const pool = new ConnectorPool({
+      createConnector: () => fakeConnector(() => { connects += 1; }, async () => [], () => 'mock'),
+    });
+
+    await pool.withConnector('sap', {}, (c) => c.listObjects());
+    await pool.withConnector('sap', {}, (c) => c.listObjects());
+    expect(connects).toBe(1);
+  });
+
+  it('reconnects after the idle ttl', async () => {
+    let now = 0;
+    let connects = 0;
+    const pool = new ConnectorPool({
+      idleTtlMs: 1_000,
+      now: () => now,
+      createConnector: () => fakeConnector(() => { connects += 1; }, async () => []),
+    });
+
+    await pool.withConnector('sap', {}, (c) => c.listObjects());
+    now += 999;
+    await pool.withConnector('sap', {}, (c) => c.listObjects());
+    now += 999;
+    await pool.withConnector('sap', {}, (c) => c.listObjects());
+    now += 1_000;
+    await pool.withConnector('sap', {}, (c) => c.listObjects());
+
+    expect(connects).toBe(2);
+  });
+});
@@ -3,6 +3,7 @@ import type { AddressInfo } from 'node:net';
 import express from 'express';
 import { afterEach, beforeEach, describe, expect, it } from 'vitest';
 import type { DbStore } from '../db/dbStore.js';
+import '../../../packages/connectors/registerConnectors.js';
 import { setupConnectorRoutes } from '../routes/connectorRoutes.js';
 
 interface HttpResult {
@@ -170,3 +171,55 @@ describe('POST /api/connectors/custom', () => {
     }
   });
 });
+
+describe('POST /api/connectors/test-batch', () => {
+  const originalRequireAuth = process.env.REQUIRE_AUTH;
+  const originalDatabaseUrl = process.env.DATABASE_URL;
+
+  beforeEach(() => {
+    process.env.REQUIRE_AUTH = 'false';
+    process.env.DATABASE_URL = '';
+  });
+
+  afterEach(() => {
+    process.env.REQUIRE_AUTH = originalRequireAuth;
+    if (originalDatabaseUrl) process.env.DATABASE_URL = originalDatabaseUrl;
+    else delete process.env.DATABASE_URL;
+  });
+
+  it('probes each connector and reports per-entry results in request order', async () => {
+    const { server, baseUrl } = createTestServer();
+
+    try {
+      const response = await postJson(baseUrl, '/api/connectors/test-batch', {
+        connections: [
+          { connectorId: 'jackhenry-silverlake' },
+          { connectorId: 'does-not-exist' },
+        ],
+      });
+
+      expect(response.status).toBe(200);
+      const results = (response.body as { results: Array<Record<string, unknown>> }).results;
+      expect(results).toHaveLength(2);
+      expect(results[0]).toMatchObject({ connectorId: 'jackhenry-silverlake', connected: true });
+      expect(results[1]).toMatchObject({
+        connectorId: 'does-not-exist',
+        connected: false,
+        error: { code: 'CONNECTOR_NOT_FOUND' },
+      });
+    } finally {
+      await closeServer(server);
+    }
+  });
+
+  it('returns 400 when connections is empty', async () => {
+    const { server, baseUrl } = createTestServer();
+
+    try {
+      const response = await postJson(baseUrl, '/api/connectors/test-batch', { connections: [] });
+      expect(response.status).toBe(400);
+    } finally {
+      await closeServer(server);
+    }
+  });
+});
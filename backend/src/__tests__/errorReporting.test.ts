@@ -10,7 +10,7 @@ function createTempReportFile(): string {
 }
 
 describe('ErrorReportingService', () => {
-  it('captures reports and persists them to disk', () => {
+  it('captures reports and persists them to disk', async () => {
     const filePath = createTempReportFile();
     const service = new ErrorReportingService(filePath);
 
@@ -25,6 +25,7 @@ describe('ErrorReportingService', () => {
     expect(captured.id).toBeTruthy();
     expect(service.list({ limit: 10 })).toHaveLength(1);
 
+    await service.flush();
     const reloaded = new ErrorReportingService(filePath);
     const reports = reloaded.list({ limit: 10 });
     expect(reports).toHaveLength(1);
@@ -32,6 +33,19 @@ describe('ErrorReportingService', () => {
     expect(reports[0].context?.projectId).toBe('p1');
   });
 
+  it('writes the latest reports after a burst of captures', async () => {
+    const filePath = createTempReportFile();
+    const service = new ErrorReportingService(filePath);
+
+    for (let index = 0; index < 5; index += 1) {
+      service.capture({ source: 'api', code: `E${index}`, message: 'burst' });
+    }
+    await service.flush();
+
+    const reloaded = new ErrorReportingService(filePath);
+    expect(reloaded.list({ limit: 10 }).map((report) => report.code)).toEqual(['E4', 'E3', 'E2', 'E1', 'E0']);
+  });
+
   it('truncates oversized metadata payloads', () => {
     const filePath = createTempReportFile();
     const service = new ErrorReportingService(filePath);
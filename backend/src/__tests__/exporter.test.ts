@@ -10,7 +10,14 @@ import type {
   System,
   ValidationReport,
 } from '../types.js';
-import { buildJsonExport, buildWorkatoExport, type BuildInput } from '../services/exporter.js';
+import {
+  buildCsvExport,
+  csvExportETag,
+  buildJsonExport,
+  buildWorkatoExport,
+  streamCsvExport,
+  type BuildInput,
+} from '../services/exporter.js';
 
 function makeBuildInput(): BuildInput {
   const project: MappingProject = {
@@ -177,6 +184,40 @@ describe('exporter load order', () => {
   });
 });
 
+describe('exporter csv streaming', () => {
+  it('yields the header then row batches that concatenate to the buffered export', () => {
+    const input = makeBuildInput();
+    const chunks = [...streamCsvExport(input, 2)];
+
+    expect(chunks).toHaveLength(3);
+    expect(chunks[0].startsWith('project,sourceEntity,sourceField')).toBe(true);
+    expect(chunks[1].split('\n').filter(Boolean)).toHaveLength(2);
+    expect(chunks[2].split('\n').filter(Boolean)).toHaveLength(1);
+    expect(chunks.join('')).toBe(buildCsvExport(input));
+    expect(buildCsvExport(input).split('\n')).toHaveLength(4);
+  });
+
+  it('derives a stable csv ETag that changes when a mapping changes', () => {
+    const input = makeBuildInput();
+    const etag = csvExportETag(input);
+
+    expect(etag).toMatch(/^"[\w-]+"$/);
+    expect(csvExportETag(makeBuildInput())).toBe(etag);
+
+    input.fieldMappings[0] = { ...input.fieldMappings[0], status: 'accepted' };
+    const statusEtag = csvExportETag(input);
+    expect(statusEtag).not.toBe(etag);
+
+    input.fieldMappings[0] = { ...input.fieldMappings[0], rationale: 'Edited rationale' };
+    const rationaleEtag = csvExportETag(input);
+    expect(rationaleEtag).not.toBe(statusEtag);
+
+    const targetFieldId = input.fieldMappings[0].targetFieldId;
+    input.fields = input.fields.map((field) => (field.id === targetFieldId ? { ...field, name: 'Renamed__c' } : field));
+    expect(csvExportETag(input)).not.toBe(rationaleEtag);
+  });
+});
+
 describe('exporter validationRuleSafety', () => {
   it('includes validationRuleSafety in the canonical JSON export', () => {
     const project: MappingProject = {
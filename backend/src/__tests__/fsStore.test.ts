@@ -75,3 +75,36 @@ describe('FsStore system inference', () => {
     expect(sourceSystem?.type).toBe('jackhenry');
   });
 });
+
+describe('FsStore project-scoped state', () => {
+  it('returns only the project systems, schema and mappings', () => {
+    const dir = fs.mkdtempSync(path.join(os.tmpdir(), 'automapper-fsstore-'));
+    tempDirs.push(dir);
+
+    const store = new FsStore(dir);
+    const project = store.createProject('Scoped Project', undefined, 'RiskClam', 'Salesforce');
+    const other = store.createProject('Other Project', undefined, 'SAP', 'Salesforce');
+
+    store.replaceSystemSchema(
+      project.sourceSystemId,
+      [{ id: 'scoped-entity', systemId: project.sourceSystemId, name: 'Loan' }],
+      [{ id: 'scoped-field', entityId: 'scoped-entity', name: 'AMT_LOAN', dataType: 'decimal' }],
+      [],
+    );
+    store.replaceSystemSchema(
+      other.sourceSystemId,
+      [{ id: 'other-entity', systemId: other.sourceSystemId, name: 'Customer' }],
+      [{ id: 'other-field', entityId: 'other-entity', name: 'KUNNR', dataType: 'string' }],
+      [],
+    );
+
+    const scoped = store.getProjectState(project);
+
+    expect(scoped.projects.map((candidate) => candidate.id)).toEqual([project.id]);
+    expect(scoped.systems.map((system) => system.id).sort()).toEqual(
+      [project.sourceSystemId, project.targetSystemId].sort(),
+    );
+    expect(scoped.entities.map((entity) => entity.id)).toEqual(['scoped-entity']);
+    expect(scoped.fields.map((field) => field.id)).toEqual(['scoped-field']);
+  });
+});
@@ -79,6 +79,34 @@ function createMockPrisma() {
           rows.sort((left, right) => right.createdAt.getTime() - left.createdAt.getTime());
           return typeof args.take === 'number' ? rows.slice(0, args.take) : rows;
         },
+        async groupBy(args: {
+          by: Array<'provider' | 'success'>;
+          where?: { userId?: string; createdAt?: { gte: Date } };
+        }) {
+          const groups = new Map<string, {
+            provider: string;
+            success: boolean;
+            _count: { _all: number };
+            _sum: { tokensUsed: number | null };
+          }>();
+          for (const row of usageRows) {
+            if (args.where?.userId && row.userId !== args.where.userId) continue;
+            if (args.where?.createdAt?.gte && row.createdAt < args.where.createdAt.gte) continue;
+            const key = `${row.provider}:${row.success}`;
+            const group = groups.get(key) ?? {
+              provider: row.provider,
+              success: row.success,
+              _count: { _all: 0 },
+              _sum: { tokensUsed: null },
+            };
+            group._count._all += 1;
+            if (typeof row.tokensUsed === 'number') {
+              group._sum.tokensUsed = (group._sum.tokensUsed ?? 0) + row.tokensUsed;
+            }
+            groups.set(key, group);
+          }
+          return [...groups.values()];
+        },
       },
     },
   };
@@ -34,15 +34,16 @@ vi.mock('../agents/OrchestratorAgent.js', () => ({
   },
 }));
 
-vi.mock('../services/llmSettingsStore.js', () => ({
-  llmSettingsStore: {
+vi.mock('../services/llmSettingsStore.js', () => {
+  const store = {
     getRuntimeConfig: vi.fn(async () => ({
       useDefault: true,
       paused: false,
     })),
     captureUsage: vi.fn(async () => undefined),
-  },
-}));
+  };
+  return { getLLMSettingsStore: () => store };
+});
 
 interface SseEvent {
   type?: string;
@@ -0,0 +1,89 @@
+import { describe, expect, it } from 'vitest';
+import {
+  buildSalesforceSchema,
+  describeSalesforceObjects,
+  SALESFORCE_COMPOSITE_BATCH_LIMIT,
+  SALESFORCE_DESCRIBE_CACHE_TTL_MS,
+} from '../../../packages/connectors/salesforceDescribe.js';
+
+function fakeConn(failing: Set<string> = new Set()) {
+  const calls: string[][] = [];
+  const conn = {
+    version: '60.0',
+    requestPost: async (_url: string, body: { batchRequests: Array<{ url: string }> }) => {
+      const names = body.batchRequests.map((request) => decodeURIComponent(request.url.split('/')[2]));
+      calls.push(names);
+      return {
+        hasErrors: names.some((name) => failing.has(name)),
+        results: names.map((name) => (failing.has(name)
+          ? { statusCode: 404, result: [{ errorCode: 'NOT_FOUND', message: `${name} not found` }] }
+          : { statusCode: 200, result: { name, label: name, fields: [] } })),
+      };
+    },
+  };
+  return { conn: conn as never, calls };
+}
+
+describe('describeSalesforceObjects', () => {
+  it('batches describes into composite calls and keeps input order', async () => {
+    const names = Array.from({ length: SALESFORCE_COMPOSITE_BATCH_LIMIT + 3 }, (_, i) => `Object${i}__c`);
+    const { conn, calls } = fakeConn();
+
+    const described = await describeSalesforceObjects<{ name: string }>(conn, names);
+
+    expect(calls.map((batch) => batch.length)).toEqual([SALESFORCE_COMPOSITE_BATCH_LIMIT, 3]);
+    expect(described.map((desc) => desc.name)).toEqual(names);
+  });
+
+  it('throws when a subrequest fails', async () => {
+    const { conn } = fakeConn(new Set(['Missing__c']));
+
+    await expect(describeSalesforceObjects(conn, ['Account', 'Missing__c']))
+      .rejects.toThrow('Salesforce describe failed for Missing__c: Missing__c not found');
+  });
+
+  it('reuses cached describes on the same connection until they expire', async () => {
+    const { conn, calls } = fakeConn();
+    let now = 1_000;
+
+    await describeSalesforceObjects(conn, ['Account', 'Contact'], { now: () => now });
+    const described = await describeSalesforceObjects<{ name: string }>(conn, ['Contact', 'Case'], { now: () => now });
+    now += SALESFORCE_DESCRIBE_CACHE_TTL_MS;
+    await describeSalesforceObjects(conn, ['Account'], { now: () => now });
+
+    expect(described.map((desc) => desc.name)).toEqual(['Contact', 'Case']);
+    expect(calls).toEqual([['Account', 'Contact'], ['Case'], ['Account']]);
+  });
+});
+
+describe('buildSalesforceSchema', () => {
+  it('maps describe fields and resolves lookups between described objects', () => {
+    const schema = buildSalesforceSchema({
+      systemId: 'sys-1',
+      objectNames: ['Account', 'Contact'],
+      describes: [
+        { name: 'Account', label: 'Account', fields: [{ name: 'Id', type: 'id', nillable: false }] },
+        {
+          name: 'Contact',
+          label: 'Contact',
+          fields: [
+            { name: 'AccountId', type: 'reference', nillable: true, referenceTo: ['Account'] },
+            { name: 'OwnerId', type: 'reference', nillable: false, referenceTo: ['User'] },
+          ],
+        },
+      ],
+      validationRuleIndex: new Map(),
+    });
+
+    const [account, contact] = schema.entities;
+    expect(schema.fields.map((field) => [field.name, field.isKey, field.required])).toEqual([
+      ['Id', true, true],
+      ['AccountId', false, false],
+      ['OwnerId', false, true],
+    ]);
+    expect(schema.relationships).toEqual([
+      { fromEntityId: contact.id, toEntityId: account.id, type: 'lookup', viaField: 'AccountId' },
+      { fromEntityId: contact.id, toEntityId: contact.id, type: 'lookup', viaField: 'OwnerId' },
+    ]);
+  });
+});
@@ -1,4 +1,4 @@
-import { describe, expect, it } from 'vitest';
+import { describe, expect, it, vi } from 'vitest';
 import {
   buildValidationRuleIndex,
   loadSalesforceValidationRuleIndex,
@@ -62,6 +62,27 @@ describe('salesforceValidationRules', () => {
     expect(index.get('Account')?.get('OwnerId')).toHaveLength(1);
   });
 
+  it('uses records from a query started before the describes finished', async () => {
+    const query = vi.fn(async () => {
+      throw new Error('should not re-query');
+    });
+    const index = await loadSalesforceValidationRuleIndex({
+      conn: { tooling: { query } } as never,
+      objectFieldNames: new Map([
+        ['Opportunity', ['StageName', 'Amount']],
+      ]),
+      pendingRecords: Promise.resolve([{
+        ValidationName: 'Amount_Required',
+        ErrorConditionFormula: 'ISBLANK(Amount)',
+        EntityDefinition: { QualifiedApiName: 'Opportunity' },
+      }]),
+    });
+
+    expect(query).not.toHaveBeenCalled();
+    expect(index.get('Opportunity')?.get('Amount')?.[0]?.name).toBe('Amount_Required');
+    expect(index.get('Opportunity')?.get('StageName')).toBeUndefined();
+  });
+
   it('marks validation rules unavailable when the tooling query fails', async () => {
     const index = await loadSalesforceValidationRuleIndex({
       conn: {
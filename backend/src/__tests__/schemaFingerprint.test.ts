@@ -6,6 +6,7 @@ import {
   buildSchemaFingerprint,
   computeSchemaFingerprint,
   detectSchemaDrift,
+  hasSchemaChanged,
 } from '../services/schemaFingerprint.js';
 
 const project: MappingProject = {
@@ -59,6 +60,22 @@ describe('schema fingerprint', () => {
 
     expect(computeSchemaFingerprint(original, entityIds)).not.toBe(computeSchemaFingerprint(changed, entityIds));
   });
+
+  it('reports no change when both side hashes match the latest version', () => {
+    const fields = makeFields();
+    const latestVersion: StoredExportVersionRecord = {
+      id: 'version-1',
+      projectId: project.id,
+      version: 1,
+      exportedAt: '2026-03-27T00:00:00.000Z',
+      schemaFingerprint: buildSchemaFingerprint(project, entities, fields, '2026-03-27T00:00:00.000Z'),
+      fieldsSnapshot: buildFieldsSnapshot(project, entities, fields),
+    };
+
+    expect(hasSchemaChanged(undefined, buildSchemaFingerprint(project, entities, fields))).toBe(false);
+    expect(hasSchemaChanged(latestVersion, buildSchemaFingerprint(project, entities, [...fields].reverse()))).toBe(false);
+    expect(hasSchemaChanged(latestVersion, buildSchemaFingerprint(project, entities, makeFields({ target: [] })))).toBe(true);
+  });
 });
 
 describe('schema drift classification', () => {
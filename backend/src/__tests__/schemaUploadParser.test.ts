@@ -28,6 +28,13 @@ describe('parseUploadedSchema', () => {
     expect(parsed.fields.map((f) => f.name)).toEqual(expect.arrayContaining(['AccountId', 'AccountName', 'Balance']));
   });
 
+  it('never produces empty field names from blank CSV header cells', () => {
+    const csv = `id,  ,name,\n1,x,Acme,\n2,y,Beta,`;
+    const parsed = parseUploadedSchema(csv, 'accounts.csv', SYSTEM_ID);
+    expect(parsed.fields.map((f) => f.name)).toEqual(['id', 'Field2', 'name', 'Field4']);
+    expect(parsed.fields.every((f) => f.name && f.label)).toBe(true);
+  });
+
   it('infers schema from JSON array of records', () => {
     const json = JSON.stringify([
       { id: '1', email: 'a@example.com', active: true },
@@ -0,0 +1,29 @@
+import { describe, expect, it } from 'vitest';
+import { TtlCache } from '../utils/ttlCache.js';
+
+describe('TtlCache', () => {
+  it('expires entries after the ttl', () => {
+    let now = 1_000;
+    const cache = new TtlCache<string, number>({ ttlMs: 100, maxEntries: 10, now: () => now });
+
+    cache.set('a', 1);
+    expect(cache.get('a')).toBe(1);
+
+    now += 100;
+    expect(cache.get('a')).toBeUndefined();
+    expect(cache.size).toBe(0);
+  });
+
+  it('evicts the least recently used entry when full', () => {
+    const cache = new TtlCache<string, number>({ ttlMs: 60_000, maxEntries: 2 });
+
+    cache.set('a', 1);
+    cache.set('b', 2);
+    expect(cache.get('a')).toBe(1);
+    cache.set('c', 3);
+
+    expect(cache.get('b')).toBeUndefined();
+    expect(cache.get('a')).toBe(1);
+    expect(cache.get('c')).toBe(3);
+  });
+});
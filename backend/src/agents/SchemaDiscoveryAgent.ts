@@ -14,7 +14,12 @@ import { AgentBase } from './AgentBase.js';
 import type { AgentContext, AgentResult, AgentStep } from './types.js';
 import type { ConnectorField } from '../../../packages/connectors/IConnector.js';
 import type { Field } from '../types.js';
-import { buildFieldsSnapshot, buildSchemaFingerprint, detectSchemaDrift } from '../services/schemaFingerprint.js';
+import {
+  buildFieldsSnapshot,
+  buildSchemaFingerprint,
+  detectSchemaDrift,
+  hasSchemaChanged,
+} from '../services/schemaFingerprint.js';
 
 /** Semantic purpose classification for a field */
 export type FieldPurpose =
@@ -105,36 +110,25 @@ export class SchemaDiscoveryAgent extends AgentBase {
     }
 
     const currentFields = fields.map((field) => ({ ...field })) as Field[];
-    const currentSnapshot = buildFieldsSnapshot(
-      {
-        id: context.projectId,
-        name: '',
-        sourceSystemId: context.sourceEntities[0]?.systemId ?? '',
-        targetSystemId: context.targetEntities[0]?.systemId ?? '',
-        createdAt: '',
-        updatedAt: '',
-      },
-      [...context.sourceEntities, ...context.targetEntities],
-      currentFields,
-    );
-    const currentFingerprint = buildSchemaFingerprint(
-      {
-        id: context.projectId,
-        name: '',
-        sourceSystemId: context.sourceEntities[0]?.systemId ?? '',
-        targetSystemId: context.targetEntities[0]?.systemId ?? '',
-        createdAt: '',
-        updatedAt: '',
-      },
-      [...context.sourceEntities, ...context.targetEntities],
-      currentFields,
-    );
-    const drift = detectSchemaDrift(
-      context.latestExportVersion,
-      currentFingerprint,
-      currentSnapshot,
-      [...context.sourceEntities, ...context.targetEntities],
-    );
+    const snapshotProject = {
+      id: context.projectId,
+      name: '',
+      sourceSystemId: context.sourceEntities[0]?.systemId ?? '',
+      targetSystemId: context.targetEntities[0]?.systemId ?? '',
+      createdAt: '',
+      updatedAt: '',
+    };
+    const scopedEntities = [...context.sourceEntities, ...context.targetEntities];
+    const currentFingerprint = buildSchemaFingerprint(snapshotProject, scopedEntities, currentFields);
+    // Only build the normalized snapshot and walk fields when a side's hash moved.
+    const drift = hasSchemaChanged(context.latestExportVersion, currentFingerprint)
+      ? detectSchemaDrift(
+        context.latestExportVersion,
+        currentFingerprint,
+        buildFieldsSnapshot(snapshotProject, scopedEntities, currentFields),
+        scopedEntities,
+      )
+      : null;
 
     if (drift) {
       this.info(
@@ -1,5 +1,15 @@
 import { v4 as uuidv4 } from 'uuid';
-import type { Prisma, PrismaClient } from '@prisma/client';
+import type {
+  Entity as EntityRow,
+  EntityMapping as EntityMappingRow,
+  Field as FieldRow,
+  FieldMapping as FieldMappingRow,
+  MappingProject as MappingProjectRow,
+  Prisma,
+  PrismaClient,
+  Relationship as RelationshipRow,
+  System as SystemRow,
+} from '@prisma/client';
 import type {
   AppState,
   Entity,
@@ -181,6 +191,44 @@ export class DbStore {
         this.prisma.fieldMapping.findMany(),
       ]);
 
+    return this.toAppState(systems, entities, fields, relationships, projects, entityMappings, fieldMappings);
+  }
+
+  /**
+   * Same shape as getState(), restricted to one project: its two systems, their
+   * schema, and the project's own mappings. Per-project routes use this instead
+   * of reading every system and mapping in the database.
+   */
+  async getProjectState(project: MappingProject): Promise<AppState> {
+    const systemIds = [project.sourceSystemId, project.targetSystemId];
+    const [systems, entities, fields, entityMappings, fieldMappings] = await Promise.all([
+      this.prisma.system.findMany({ where: { id: { in: systemIds } } }),
+      this.prisma.entity.findMany({ where: { systemId: { in: systemIds } } }),
+      this.prisma.field.findMany({ where: { entity: { systemId: { in: systemIds } } } }),
+      this.prisma.entityMapping.findMany({ where: { projectId: project.id } }),
+      this.prisma.fieldMapping.findMany({ where: { entityMapping: { projectId: project.id } } }),
+    ]);
+    const relationships = entities.length
+      ? await this.prisma.relationship.findMany({
+        where: { fromEntityId: { in: entities.map((entity) => entity.id) } },
+      })
+      : [];
+
+    return {
+      ...this.toAppState(systems, entities, fields, relationships, [], entityMappings, fieldMappings),
+      projects: [project],
+    };
+  }
+
+  private toAppState(
+    systems: SystemRow[],
+    entities: EntityRow[],
+    fields: FieldRow[],
+    relationships: RelationshipRow[],
+    projects: MappingProjectRow[],
+    entityMappings: EntityMappingRow[],
+    fieldMappings: FieldMappingRow[],
+  ): AppState {
     return {
       systems: systems.map(toSystem),
       entities: entities.map(toEntity),
@@ -536,23 +584,28 @@ export class DbStore {
   }
 
   async patchProjectMember(projectId: string, userId: string, role: UserRole): Promise<ProjectMember> {
-    const existing = await this.prisma.projectMember.findUnique({
-      where: { projectId_userId: { projectId, userId } },
-    });
-    if (!existing) {
-      throw new AppError(404, 'PROJECT_MEMBER_NOT_FOUND', 'Project member not found');
+    try {
+      const updated = await this.prisma.projectMember.update({
+        where: { projectId_userId: { projectId, userId } },
+        data: { role },
+      });
+      return {
+        userId: updated.userId,
+        email: updated.email,
+        role: updated.role as UserRole,
+        addedAt: updated.addedAt.toISOString(),
+      };
+    } catch (error) {
+      // P2025: no row matched, so the member does not exist.
+      if (
+        error instanceof Error
+        && 'code' in error
+        && (error as { code?: string }).code === 'P2025'
+      ) {
+        throw new AppError(404, 'PROJECT_MEMBER_NOT_FOUND', 'Project member not found');
+      }
+      throw error;
     }
-
-    const updated = await this.prisma.projectMember.update({
-      where: { projectId_userId: { projectId, userId } },
-      data: { role },
-    });
-    return {
-      userId: updated.userId,
-      email: updated.email,
-      role: updated.role as UserRole,
-      addedAt: updated.addedAt.toISOString(),
-    };
   }
 
   async removeProjectMember(projectId: string, userId: string): Promise<void> {
@@ -740,6 +793,32 @@ export class DbStore {
     }
   }
 
+  /**
+   * Apply one status/confidence patch to many field mappings in a single
+   * UPDATE. Returns the ids that were updated.
+   */
+  async patchFieldMappings(
+    fieldMappingIds: string[],
+    patch: Partial<Pick<FieldMapping, 'status' | 'confidence'>>,
+  ): Promise<string[]> {
+    if (!fieldMappingIds.length) return [];
+    const { count } = await this.prisma.fieldMapping.updateMany({
+      where: { id: { in: fieldMappingIds } },
+      data: {
+        ...(patch.status !== undefined && { status: patch.status }),
+        ...(patch.confidence !== undefined && { confidence: patch.confidence }),
+      },
+    });
+    if (count === fieldMappingIds.length) return fieldMappingIds;
+
+    // Some rows vanished since the caller read them; report only the survivors.
+    const remaining = await this.prisma.fieldMapping.findMany({
+      where: { id: { in: fieldMappingIds } },
+      select: { id: true },
+    });
+    return remaining.map((mapping) => mapping.id);
+  }
+
   async patchField(
     fieldId: string,
     patch: Partial<Pick<Field, 'required' | 'complianceTags'>>,
@@ -757,6 +836,25 @@ export class DbStore {
       return undefined;
     }
   }
+
+  /**
+   * Append a compliance tag in the UPDATE itself rather than writing back an
+   * array read earlier, so concurrent tag edits on the same field don't
+   * overwrite each other. The "not already tagged" check is part of the same
+   * statement, so concurrent adds of one tag can't append it twice.
+   */
+  async addFieldComplianceTag(fieldId: string, tag: string): Promise<Field | undefined> {
+    try {
+      await this.prisma.field.updateMany({
+        where: { id: fieldId, NOT: { complianceTags: { has: tag } } },
+        data: { complianceTags: { push: tag } },
+      });
+      const updated = await this.prisma.field.findUnique({ where: { id: fieldId } });
+      return updated ? toField(updated) : undefined;
+    } catch {
+      return undefined;
+    }
+  }
 }
 
 function inferSystemType(name: string, fieldNames: string[] = []): System['type'] {
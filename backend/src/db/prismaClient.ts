@@ -2,8 +2,36 @@ import { PrismaClient } from '@prisma/client';
 
 const globalForPrisma = globalThis as unknown as { prisma: PrismaClient };
 
+/**
+ * Prisma sizes its connection pool from the `connection_limit` and
+ * `pool_timeout` parameters on the datasource URL. DATABASE_POOL_SIZE and
+ * DATABASE_POOL_TIMEOUT_S set them without hand-editing DATABASE_URL; values
+ * already present on the URL win.
+ */
+function resolveDatasourceUrl(): string | undefined {
+  const raw = process.env.DATABASE_URL?.trim();
+  if (!raw) return undefined;
+
+  let url: URL;
+  try {
+    url = new URL(raw);
+  } catch {
+    return raw;
+  }
+
+  const poolSize = Number(process.env.DATABASE_POOL_SIZE);
+  if (Number.isInteger(poolSize) && poolSize > 0 && !url.searchParams.has('connection_limit')) {
+    url.searchParams.set('connection_limit', String(poolSize));
+  }
+  const poolTimeout = Number(process.env.DATABASE_POOL_TIMEOUT_S);
+  if (Number.isInteger(poolTimeout) && poolTimeout >= 0 && !url.searchParams.has('pool_timeout')) {
+    url.searchParams.set('pool_timeout', String(poolTimeout));
+  }
+  return url.toString();
+}
+
 export const prisma: PrismaClient =
-  globalForPrisma.prisma ?? new PrismaClient({ log: ['error', 'warn'] });
+  globalForPrisma.prisma ?? new PrismaClient({ log: ['error', 'warn'], datasourceUrl: resolveDatasourceUrl() });
 
 if (process.env.NODE_ENV !== 'production') {
   globalForPrisma.prisma = prisma;
@@ -5,6 +5,9 @@ import cors from 'cors';
 import cookieParser from 'cookie-parser';
 import multer from 'multer';
 import { randomUUID } from 'node:crypto';
+import { Readable } from 'node:stream';
+import { pipeline } from 'node:stream/promises';
+import { constants as zlibConstants, createGzip } from 'node:zlib';
 import { DbStore } from './db/dbStore.js';
 import { prisma } from './db/prismaClient.js';
 import {
@@ -18,7 +21,16 @@ import { parseSapSchema } from './services/sapParser.js';
 import { fetchSalesforceSchema } from '../../packages/connectors/salesforce.js';
 import { suggestMappings } from './services/mapper.js';
 import { validateMappings } from './services/validator.js';
-import { buildExport, EXPORT_FORMATS, type ExportFormat } from './services/exporter.js';
+import {
+  buildExport,
+  csvExportETag,
+  EXPORT_FORMATS,
+  exportContentDisposition,
+  exportFilename,
+  streamCsvExport,
+  type BuildInput,
+  type ExportFormat,
+} from './services/exporter.js';
 import { runAgentRefinement, type RefinementStep } from './services/agentRefiner.js';
 import {
   buildMappingConflicts,
@@ -39,7 +51,7 @@ import { createBulkRouter } from './routes/bulkRoutes.js';
 import { authMiddleware } from './auth/authMiddleware.js';
 import { requireRole } from './middleware/requireRole.js';
 import { runWithLLMRuntimeContext } from './services/llmRuntimeContext.js';
-import { llmSettingsStore } from './services/llmSettingsStore.js';
+import { getLLMSettingsStore } from './services/llmSettingsStore.js';
 import {
   augmentSalesforceSchemaForRiskClam,
   isRiskClamSourceSystem,
@@ -64,11 +76,15 @@ import type { AppState, FieldMapping, MappingProject, SchemaFingerprint } from '
 import { getOneToManyPatternCandidates, getSchemaIntelligencePatternCandidates, isOneToManyFieldName } from './services/schemaIntelligencePatterns.js';
 import { defaultRegistry } from '../../packages/connectors/ConnectorRegistry.js';
 import { buildFieldsSnapshot } from './services/schemaFingerprint.js';
+import { defaultMetadataCache } from './services/connectorMetadataCache.js';
+import { defaultConnectorPool } from './services/connectorPool.js';
+import { flushErrorReportingService } from './services/errorReporting.js';
 // Register all built-in connectors into the defaultRegistry (side-effect import)
 import '../../packages/connectors/registerConnectors.js';
 
 const app = express();
-const upload = multer();
+// Cap in-memory uploads so a single oversized schema file cannot exhaust the heap
+const upload = multer({ limits: { fileSize: 8 * 1024 * 1024, files: 1 } });
 const port = Number(process.env.PORT || 4000);
 const store: DbStore | FsStore = process.env.DATABASE_URL
   ? new DbStore(prisma)
@@ -106,7 +122,13 @@ app.use((req, res, next) => {
   next();
 });
 
-app.get('/api/health', (_req, res) => res.json({ ok: true }));
+// Constant bodies are serialized once at startup; liveness probes hit these often.
+const HEALTH_BODY = JSON.stringify({ ok: true });
+const EXPORT_FORMATS_BODY = JSON.stringify({ formats: EXPORT_FORMATS });
+
+app.get('/api/health', (_req, res) => {
+  res.type('application/json').send(HEALTH_BODY);
+});
 
 function sendError(
   req: Request,
@@ -162,6 +184,41 @@ function getProjectScopedState(state: AppState, project: MappingProject) {
   };
 }
 
+function groupBy<T>(items: readonly T[], keyOf: (item: T) => string): Map<string, T[]> {
+  const groups = new Map<string, T[]>();
+  for (const item of items) {
+    const key = keyOf(item);
+    const group = groups.get(key);
+    if (group) group.push(item);
+    else groups.set(key, [item]);
+  }
+  return groups;
+}
+
+/**
+ * Index the full state once so per-project views come from lookups instead of
+ * re-filtering every table for each project (used by the project list).
+ */
+function createProjectStateSlicer(state: AppState): (project: MappingProject) => AppState {
+  const entitiesBySystemId = groupBy(state.entities, (entity) => entity.systemId);
+  const fieldsByEntityId = groupBy(state.fields, (field) => field.entityId);
+  const entityMappingsByProjectId = groupBy(state.entityMappings, (mapping) => mapping.projectId);
+  const fieldMappingsByEntityMappingId = groupBy(state.fieldMappings, (mapping) => mapping.entityMappingId);
+
+  return (project) => {
+    const systemIds = [...new Set([project.sourceSystemId, project.targetSystemId])];
+    const entities = systemIds.flatMap((systemId) => entitiesBySystemId.get(systemId) ?? []);
+    const entityMappings = entityMappingsByProjectId.get(project.id) ?? [];
+    return {
+      ...state,
+      entities,
+      fields: entities.flatMap((entity) => fieldsByEntityId.get(entity.id) ?? []),
+      entityMappings,
+      fieldMappings: entityMappings.flatMap((mapping) => fieldMappingsByEntityMappingId.get(mapping.id) ?? []),
+    };
+  };
+}
+
 function buildProjectPreflight(
   project: MappingProject,
   state: AppState,
@@ -227,6 +284,15 @@ function buildProjectPreflight(
   };
 }
 
+// Checked in order: the first entry whose pattern appears in the system name wins.
+const CONNECTOR_NAME_PATTERNS: ReadonlyArray<{ patterns: readonly string[]; displayName: string }> = [
+  { patterns: ['core director', 'coredirector'], displayName: 'Jack Henry Core Director' },
+  { patterns: ['silverlake'], displayName: 'Jack Henry SilverLake' },
+  { patterns: ['symitar'], displayName: 'Jack Henry Symitar (Episys)' },
+  { patterns: ['salesforce'], displayName: 'Salesforce CRM' },
+  { patterns: ['sap'], displayName: 'SAP S/4HANA' },
+];
+
 function resolveConnectorName(system?: { name: string; type: string } | undefined): string | undefined {
   if (!system) return undefined;
 
@@ -236,11 +302,8 @@ function resolveConnectorName(system?: { name: string; type: string } | undefine
   }
 
   const normalized = system.name.trim().toLowerCase();
-  if (normalized.includes('core director') || normalized.includes('coredirector')) return 'Jack Henry Core Director';
-  if (normalized.includes('silverlake')) return 'Jack Henry SilverLake';
-  if (normalized.includes('symitar')) return 'Jack Henry Symitar (Episys)';
-  if (normalized.includes('salesforce')) return 'Salesforce CRM';
-  if (normalized.includes('sap')) return 'SAP S/4HANA';
+  const matched = CONNECTOR_NAME_PATTERNS.find(({ patterns }) => patterns.some((p) => normalized.includes(p)));
+  if (matched) return matched.displayName;
 
   const fallbackConnectorId = defaultRegistry.resolveSystemType(system.type);
   const fallbackMeta = fallbackConnectorId ? defaultRegistry.getMeta(fallbackConnectorId) : undefined;
@@ -266,7 +329,7 @@ async function withLLMContext<T>(
   handler: () => Promise<T>,
 ): Promise<T> {
   const userId = req.user?.userId ?? 'demo-admin';
-  const runtimeConfig = await llmSettingsStore.getRuntimeConfig(userId);
+  const runtimeConfig = await getLLMSettingsStore().getRuntimeConfig(userId);
   return runWithLLMRuntimeContext(
     {
       llmConfig: runtimeConfig,
@@ -277,7 +340,7 @@ async function withLLMContext<T>(
       },
       onUsage: (capture, meta) => {
         if (!meta?.userId) return;
-        void llmSettingsStore.captureUsage(meta.userId, capture, {
+        void getLLMSettingsStore().captureUsage(meta.userId, capture, {
           projectId: meta.projectId,
           requestId: meta.requestId,
         });
@@ -371,12 +434,14 @@ app.get('/api/projects', async (req, res) => {
     visibleProjects = state.projects.filter((project) => visibleIds.has(project.id));
   }
 
+  const sliceProjectState = createProjectStateSlicer(state);
   const projects = visibleProjects
     .map((project) => {
-      const scoped = getProjectScopedState(state, project);
+      const projectState = sliceProjectState(project);
+      const scoped = getProjectScopedState(projectState, project);
       const sourceSystem = systemsById.get(project.sourceSystemId);
       const targetSystem = systemsById.get(project.targetSystemId);
-      const preflight = buildProjectPreflight(project, state, scoped.fieldMappings);
+      const preflight = buildProjectPreflight(project, projectState, scoped.fieldMappings);
       return {
         project,
         sourceSystem,
@@ -860,7 +925,7 @@ app.post('/api/projects/:id/one-to-many-resolutions', async (req, res) => {
     return;
   }
 
-  const state = await store.getState();
+  const state = await store.getProjectState(project);
   const scoped = getProjectScopedState(state, project);
   const mappingById = new Map(scoped.fieldMappings.map((mapping) => [mapping.id, mapping]));
   const fieldById = new Map(scoped.scopedFields.map((field) => [field.id, field]));
@@ -914,7 +979,7 @@ app.post('/api/projects/:id/one-to-many-resolutions', async (req, res) => {
   }
 
   const updatedProject = await store.updateProjectResolvedOneToManyMappings(project.id, nextResolvedMappings);
-  const updatedState = await store.getState();
+  const updatedState = await store.getProjectState(project);
   const refreshedProject = updatedProject ?? (await store.getProject(project.id));
   if (!refreshedProject) {
     sendError(req, res, 500, 'PROJECT_UPDATE_FAILED', 'Failed to persist one-to-many resolutions');
@@ -935,7 +1000,7 @@ app.get('/api/projects/:id/preflight', async (req, res) => {
     return;
   }
 
-  const state = await store.getState();
+  const state = await store.getProjectState(project);
   const scoped = getProjectScopedState(state, project);
   res.json(buildProjectPreflight(project, state, scoped.fieldMappings));
 });
@@ -947,7 +1012,7 @@ app.get('/api/projects/:id/conflicts', async (req, res) => {
     return;
   }
 
-  const state = await store.getState();
+  const state = await store.getProjectState(project);
   const scoped = getProjectScopedState(state, project);
   const conflicts = buildMappingConflicts(scoped.fieldMappings, scoped.scopedFields, state.entities);
   res.json({ conflicts, total: conflicts.length });
@@ -972,7 +1037,7 @@ app.post('/api/projects/:id/conflicts/:conflictId/resolve', async (req, res) =>
     return;
   }
 
-  const state = await store.getState();
+  const state = await store.getProjectState(project);
   const scoped = getProjectScopedState(state, project);
   const competing = scoped.fieldMappings.filter(
     (mapping) => mapping.targetFieldId === targetFieldId && isActiveFieldMapping(mapping),
@@ -1021,7 +1086,7 @@ app.post('/api/projects/:id/conflicts/:conflictId/resolve', async (req, res) =>
   }
   await store.updateProjectTimestamp(project.id);
 
-  const updatedState = await store.getState();
+  const updatedState = await store.getProjectState(project);
   const updatedScoped = getProjectScopedState(updatedState, project);
   const unresolvedConflicts = countUnresolvedConflicts(updatedScoped.fieldMappings);
   const updatedStatuses = updatedScoped.fieldMappings
@@ -1056,7 +1121,7 @@ app.post('/api/projects/:id/conflicts/:conflictId/resolve', async (req, res) =>
 // GET /api/projects/:id/export?format=json|yaml|csv|dataweave|boomi|workato
 // Also accepts GET /api/projects/:id/export/formats to list available formats
 app.get('/api/projects/:id/export/formats', (_req, res) => {
-  res.json({ formats: EXPORT_FORMATS });
+  res.type('application/json').send(EXPORT_FORMATS_BODY);
 });
 
 app.get('/api/projects/:id/versions', async (req, res) => {
@@ -1086,7 +1151,7 @@ app.get('/api/projects/:id/export', requireRole('approver'), async (req, res) =>
     return;
   }
 
-  const state = await store.getState();
+  const state = await store.getProjectState(project);
   const scoped = getProjectScopedState(state, project);
   const entityMappings = state.entityMappings.filter((e) => e.projectId === project.id);
   const entityMappingIds = new Set(entityMappings.map((e) => e.id));
@@ -1102,7 +1167,7 @@ app.get('/api/projects/:id/export', requireRole('approver'), async (req, res) =>
     (s) => s.id === project.sourceSystemId || s.id === project.targetSystemId,
   );
 
-  const result = buildExport(format, {
+  const exportInput: BuildInput = {
     project,
     systems: projectSystems,
     entityMappings,
@@ -1111,7 +1176,54 @@ app.get('/api/projects/:id/export', requireRole('approver'), async (req, res) =>
     fields: state.fields,
     relationships: state.relationships,
     validation,
-  });
+  };
+
+  // CSV is streamed in row batches so large projects never sit fully in memory
+  if (format === 'csv') {
+    // Streaming bypasses Express's body-hash ETag, so set a strong one up front.
+    // Mapping names repeat heavily, so gzip the stream when the client allows it;
+    // the compressed variant gets its own validator.
+    const useGzip = req.acceptsEncodings('gzip', 'identity') === 'gzip';
+    const etag = csvExportETag(exportInput);
+    res.setHeader('ETag', useGzip ? `${etag.slice(0, -1)}-gzip"` : etag);
+    res.setHeader('Vary', 'Accept-Encoding');
+    res.setHeader('Cache-Control', 'private, no-cache');
+    if (req.fresh) {
+      res.status(304).end();
+      return;
+    }
+
+    writeAuditEntrySafe({
+      projectId: project.id,
+      actor: toAuditActor(req),
+      action: 'project_exported',
+      targetType: 'project',
+      targetId: project.id,
+      after: {
+        format,
+      },
+    });
+
+    res.setHeader('Content-Type', EXPORT_FORMATS.csv.mime);
+    res.setHeader('Content-Disposition', exportContentDisposition(exportFilename(format, exportInput)));
+
+    // pipeline applies backpressure between batches and tears everything down
+    // if the client disconnects mid-export.
+    const rows = Readable.from(streamCsvExport(exportInput));
+    try {
+      if (useGzip) {
+        res.setHeader('Content-Encoding', 'gzip');
+        await pipeline(rows, createGzip({ level: zlibConstants.Z_BEST_SPEED }), res);
+      } else {
+        await pipeline(rows, res);
+      }
+    } catch {
+      // Client went away (or the response was destroyed); nothing left to send.
+    }
+    return;
+  }
+
+  const result = buildExport(format, exportInput);
 
   if (format === 'json' && typeof result.content === 'object') {
     const schemaFingerprint = (result.content as {
@@ -1144,11 +1256,11 @@ app.get('/api/projects/:id/export', requireRole('approver'), async (req, res) =>
 
   // For JSON/Workato: send as JSON object; for all others: send as text with file download
   if (typeof result.content === 'object') {
-    res.setHeader('Content-Disposition', `attachment; filename="${result.filename}"`);
+    res.setHeader('Content-Disposition', exportContentDisposition(result.filename));
     res.json(result.content);
   } else {
     res.setHeader('Content-Type', result.mime);
-    res.setHeader('Content-Disposition', `attachment; filename="${result.filename}"`);
+    res.setHeader('Content-Disposition', exportContentDisposition(result.filename));
     res.send(result.content);
   }
 });
@@ -1217,7 +1329,7 @@ app.post('/api/projects/:id/agent-refine', async (req, res) => {
     return;
   }
 
-  const state = await store.getState();
+  const state = await store.getProjectState(project);
   const entityMappings = state.entityMappings.filter((e) => e.projectId === project.id);
   const entityMappingIds = new Set(entityMappings.map((e) => e.id));
   const fieldMappings = state.fieldMappings.filter((f) => entityMappingIds.has(f.entityMappingId));
@@ -1282,6 +1394,11 @@ app.post('/api/projects/:id/agent-refine', async (req, res) => {
 });
 
 app.use((err: unknown, _req: Request, res: Response, _next: NextFunction) => {
+  if (err instanceof multer.MulterError) {
+    const status = err.code === 'LIMIT_FILE_SIZE' ? 413 : 400;
+    sendError(_req, res, status, 'UPLOAD_REJECTED', err.message);
+    return;
+  }
   const message = err instanceof Error ? err.message : 'Internal server error';
   captureException('backend', err, {
     code: 'INTERNAL_ERROR',
@@ -1303,6 +1420,30 @@ process.on('uncaughtException', (err) => {
   captureException('runtime', err, { code: 'UNCAUGHT_EXCEPTION', severity: 'fatal' });
 });
 
-app.listen(port, () => {
+const server = app.listen(port, () => {
   console.log(`Auto Mapper backend running on http://localhost:${port}`);
 });
+
+// ─── Graceful shutdown ───────────────────────────────────────────────────────
+// Stop accepting connections, let in-flight requests finish, then release
+// pooled connectors and the Prisma connection pool before exiting.
+let shuttingDown = false;
+function shutdown(signal: NodeJS.Signals): void {
+  if (shuttingDown) return;
+  shuttingDown = true;
+  console.log(`Received ${signal}, shutting down`);
+  const forceExit = setTimeout(() => process.exit(1), 10_000);
+  forceExit.unref();
+  server.close(() => {
+    defaultConnectorPool.clear();
+    defaultMetadataCache.clear();
+    const disconnect = (process.env.DATABASE_URL ? prisma.$disconnect() : Promise.resolve())
+      .catch((error: unknown) => console.error('Prisma disconnect failed', error));
+    const flush = flushErrorReportingService()
+      .catch((error: unknown) => console.error('Error report flush failed', error));
+    Promise.all([disconnect, flush]).finally(() => process.exit(0));
+  });
+}
+
+process.once('SIGTERM', shutdown);
+process.once('SIGINT', shutdown);
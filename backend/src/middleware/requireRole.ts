@@ -18,6 +18,19 @@ function normalizeRole(role: string | null | undefined): UserRole | null {
   return null;
 }
 
+let fileMemberStore: { dataDir: string; store: FsStore } | null = null;
+
+// listProjectMembers reads members.json from disk on every call, so one
+// FsStore per data dir is enough; constructing it per request re-parsed the
+// whole db.json just to check a role.
+function getFileMemberStore(): FsStore {
+  const dataDir = process.env.DATA_DIR || './data';
+  if (!fileMemberStore || fileMemberStore.dataDir !== dataDir) {
+    fileMemberStore = { dataDir, store: new FsStore(dataDir) };
+  }
+  return fileMemberStore.store;
+}
+
 async function resolveProjectRole(projectId: string, userId: string): Promise<UserRole | null> {
   if (process.env.DATABASE_URL?.trim()) {
     const [member, project] = await Promise.all([
@@ -38,8 +51,7 @@ async function resolveProjectRole(projectId: string, userId: string): Promise<Us
     return null;
   }
 
-  const store = new FsStore(process.env.DATA_DIR || './data');
-  const member = store.listProjectMembers(projectId).find((candidate) => candidate.userId === userId);
+  const member = getFileMemberStore().listProjectMembers(projectId).find((candidate) => candidate.userId === userId);
   return member?.role ?? null;
 }
 
@@ -15,10 +15,11 @@ import { authMiddleware } from '../auth/authMiddleware.js';
 import type { SystemType } from '../types.js';
 import { captureException, sendHttpError } from '../utils/httpErrors.js';
 import { runWithLLMRuntimeContext } from '../services/llmRuntimeContext.js';
-import { llmSettingsStore } from '../services/llmSettingsStore.js';
+import { getLLMSettingsStore } from '../services/llmSettingsStore.js';
+import { TtlCache } from '../utils/ttlCache.js';
 
-/** Compliance reports keyed by projectId — persisted in memory per server lifetime */
-const complianceCache = new Map<string, unknown>();
+/** Latest compliance report per projectId — in memory, bounded so long-lived servers don't grow without limit */
+const complianceCache = new TtlCache<string, unknown>({ ttlMs: 24 * 60 * 60 * 1000, maxEntries: 500 });
 const HEARTBEAT_INTERVAL_MS = 5000;
 const DB_CALL_TIMEOUT_MS = 8000;
 
@@ -47,7 +48,7 @@ async function withLLMContext<T>(
   handler: () => Promise<T>,
 ): Promise<T> {
   const userId = req.user?.userId ?? 'demo-admin';
-  const runtimeConfig = await llmSettingsStore.getRuntimeConfig(userId);
+  const runtimeConfig = await getLLMSettingsStore().getRuntimeConfig(userId);
   return runWithLLMRuntimeContext(
     {
       llmConfig: runtimeConfig,
@@ -58,7 +59,7 @@ async function withLLMContext<T>(
       },
       onUsage: (capture, meta) => {
         if (!meta?.userId) return;
-        void llmSettingsStore.captureUsage(meta.userId, capture, {
+        void getLLMSettingsStore().captureUsage(meta.userId, capture, {
           projectId: meta.projectId,
           requestId: meta.requestId,
         });
@@ -10,6 +10,7 @@ import { sendHttpError } from '../utils/httpErrors.js';
 
 const LOGIN_WINDOW_MS = 15 * 60 * 1000;
 const LOGIN_MAX_ATTEMPTS = 5;
+const LOGIN_TRACKED_IPS_MAX = 10_000;
 
 interface AuthUserRecord {
   id: string;
@@ -89,11 +90,28 @@ function isLoginRateLimited(ip: string): { limited: boolean; retryAfterSeconds:
   };
 }
 
+// Entries are only pruned when the same IP comes back. Map order is each IP's
+// last-failure order (markLoginFailure re-inserts), so expired IPs sit at the
+// front: drop those, then, while a flood of distinct IPs keeps the map over
+// the cap, the least recently failed ones. Stops at the first entry it keeps,
+// so a failed login never scans the whole map.
+function evictLoginAttempts(now: number): void {
+  for (const [ip, attempts] of loginAttemptsByIp) {
+    const newest = attempts[attempts.length - 1] ?? 0;
+    if (now - newest <= LOGIN_WINDOW_MS && loginAttemptsByIp.size <= LOGIN_TRACKED_IPS_MAX) break;
+    loginAttemptsByIp.delete(ip);
+  }
+}
+
 function markLoginFailure(ip: string): void {
   const now = Date.now();
   const attempts = pruneAndReadAttempts(ip, now);
   attempts.push(now);
+  loginAttemptsByIp.delete(ip);
   loginAttemptsByIp.set(ip, attempts);
+  if (loginAttemptsByIp.size > LOGIN_TRACKED_IPS_MAX) {
+    evictLoginAttempts(now);
+  }
 }
 
 function clearLoginFailures(ip: string): void {
@@ -60,12 +60,24 @@ interface BulkStore {
     fieldMappingId: string,
     patch: Partial<Pick<FieldMapping, 'status' | 'confidence' | 'rationale' | 'targetFieldId' | 'sourceFieldId' | 'transform'>>,
   ) => FieldMapping | undefined | Promise<FieldMapping | undefined>;
+  patchFieldMappings?: (
+    fieldMappingIds: string[],
+    patch: Partial<Pick<FieldMapping, 'status' | 'confidence'>>,
+  ) => string[] | Promise<string[]>;
   patchField?: (
     fieldId: string,
     patch: Partial<Pick<Field, 'required' | 'complianceTags'>>,
   ) => Field | undefined | Promise<Field | undefined>;
+  addFieldComplianceTag?: (fieldId: string, tag: string) => Field | undefined | Promise<Field | undefined>;
 }
 
+/** Operations that set the same status/confidence on every selected mapping. */
+const STATUS_PATCHES: Partial<Record<BulkOperation, Partial<Pick<FieldMapping, 'status' | 'confidence'>>>> = {
+  accept_suggestion: { status: 'accepted' },
+  reject_suggestion: { status: 'rejected' },
+  clear_mapping: { status: 'rejected', confidence: 0 },
+};
+
 function sendError(
   req: Request,
   res: Response,
@@ -100,14 +112,14 @@ function scopeProjectMappings(state: AppState, projectId: string): {
   };
 }
 
-async function writeBulkAudit(
+function writeBulkAudit(
   store: BulkStore,
   req: Request,
   projectId: string,
   operation: BulkOperation,
   result: BulkOperationResult,
   requestedCount: number,
-): Promise<void> {
+): void {
   if (store instanceof FsStore) {
     store.appendAuditEntry(materializeAuditEntry({
       projectId,
@@ -130,28 +142,27 @@ async function writeBulkAudit(
     return;
   }
   if (!process.env.DATABASE_URL) return;
-  try {
-    await writeAuditEntry({
-      projectId,
-      actor: {
-        userId: req.user?.userId ?? 'unknown',
-        email: req.user?.email ?? 'unknown',
-        role: req.user?.role ?? 'unknown',
-      },
-      action: actionForBulkOperation(operation),
-      targetType: 'field_mapping',
-      targetId: randomUUID(),
-      after: {
-        operation,
-        requestedCount,
-        applied: result.applied,
-        skipped: result.skipped,
-        errorCount: result.errors.length,
-      },
-    });
-  } catch (error) {
+  // The audit row is not part of the response; don't hold the request on it.
+  void writeAuditEntry({
+    projectId,
+    actor: {
+      userId: req.user?.userId ?? 'unknown',
+      email: req.user?.email ?? 'unknown',
+      role: req.user?.role ?? 'unknown',
+    },
+    action: actionForBulkOperation(operation),
+    targetType: 'field_mapping',
+    targetId: randomUUID(),
+    after: {
+      operation,
+      requestedCount,
+      applied: result.applied,
+      skipped: result.skipped,
+      errorCount: result.errors.length,
+    },
+  }).catch((error) => {
     console.error('[bulk] Failed to write audit entry:', error);
-  }
+  });
 }
 
 export function createBulkRouter(store: BulkStore) {
@@ -181,6 +192,47 @@ export function createBulkRouter(store: BulkStore) {
     const { projectMappingsById, fieldById } = scopeProjectMappings(state, projectId);
     const result: BulkOperationResult = { applied: 0, skipped: 0, errors: [] };
 
+    // Status-only operations write every eligible mapping in one store call
+    // instead of one update per mapping.
+    const statusPatch = STATUS_PATCHES[operation];
+    if (statusPatch && store.patchFieldMappings) {
+      const pending: string[] = [];
+      const queued = new Set<string>();
+      for (const mappingId of mappingIds) {
+        const mapping = projectMappingsById.get(mappingId);
+        if (!mapping) {
+          result.errors.push({ mappingId, reason: 'mapping_not_found' });
+          continue;
+        }
+        const alreadyApplied = mapping.status === statusPatch.status
+          && (statusPatch.confidence === undefined || mapping.confidence === statusPatch.confidence);
+        if (alreadyApplied || queued.has(mappingId)) {
+          result.skipped += 1;
+          continue;
+        }
+        queued.add(mappingId);
+        pending.push(mappingId);
+      }
+
+      let updatedIds = new Set<string>();
+      try {
+        updatedIds = new Set(await Promise.resolve(store.patchFieldMappings(pending, statusPatch)));
+      } catch {
+        // Reported per mapping below.
+      }
+      for (const mappingId of pending) {
+        if (updatedIds.has(mappingId)) {
+          result.applied += 1;
+        } else {
+          result.errors.push({ mappingId, reason: 'patch_failed' });
+        }
+      }
+
+      writeBulkAudit(store, req, projectId, operation, result, mappingIds.length);
+      res.json(result);
+      return;
+    }
+
     for (const mappingId of mappingIds) {
       const mapping = projectMappingsById.get(mappingId);
       if (!mapping) {
@@ -276,7 +328,9 @@ export function createBulkRouter(store: BulkStore) {
             continue;
           }
           const patchedField = await Promise.resolve(
-            store.patchField(targetField.id, { complianceTags: [...existingTags, requestedTag] }),
+            store.addFieldComplianceTag
+              ? store.addFieldComplianceTag(targetField.id, requestedTag)
+              : store.patchField(targetField.id, { complianceTags: [...existingTags, requestedTag] }),
           );
           if (!patchedField) {
             result.errors.push({ mappingId, reason: 'patch_failed' });
@@ -310,7 +364,7 @@ export function createBulkRouter(store: BulkStore) {
       }
     }
 
-    await writeBulkAudit(store, req, projectId, operation, result, mappingIds.length);
+    writeBulkAudit(store, req, projectId, operation, result, mappingIds.length);
     res.json(result);
   });
 
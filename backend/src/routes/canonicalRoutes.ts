@@ -2,6 +2,15 @@ import type { Express, Request, Response } from 'express';
 import { prisma } from '../db/prismaClient.js';
 import { authMiddleware } from '../auth/authMiddleware.js';
 import { sendHttpError } from '../utils/httpErrors.js';
+import { TtlCache } from '../utils/ttlCache.js';
+
+/**
+ * Serialized canonical catalog responses. The catalog is seeded out of band and
+ * never written by the API, so short TTLs bound staleness after a reseed.
+ */
+const CANONICAL_DOMAINS_CACHE_KEY = 'domains';
+const canonicalDomainsCache = new TtlCache<string, string>({ ttlMs: 5 * 60_000, maxEntries: 1 });
+const canonicalFieldsCache = new TtlCache<string, string>({ ttlMs: 60_000, maxEntries: 200 });
 
 interface CanonicalTransitiveMapping {
   sourceEntity: string;
@@ -26,15 +35,21 @@ export async function buildCanonicalTransitiveMappings(
         },
       },
     },
-    include: {
+    // Select only what the transitive mapping reads; Field rows carry wide
+    // picklist/validation-rule/connector metadata columns never used here.
+    select: {
+      confidence: true,
       field: {
-        include: {
-          entity: true,
+        select: {
+          name: true,
+          entity: { select: { name: true } },
         },
       },
       canonicalField: {
-        include: {
-          domain: true,
+        select: {
+          conceptName: true,
+          complianceTags: true,
+          domain: { select: { name: true } },
           fieldMappings: {
             where: {
               field: {
@@ -43,10 +58,12 @@ export async function buildCanonicalTransitiveMappings(
                 },
               },
             },
-            include: {
+            select: {
+              confidence: true,
               field: {
-                include: {
-                  entity: true,
+                select: {
+                  name: true,
+                  entity: { select: { name: true } },
                 },
               },
             },
@@ -89,6 +106,12 @@ function sendError(
 
 export function setupCanonicalRoutes(app: Express): void {
   app.get('/api/canonical/domains', authMiddleware, async (req: Request, res: Response) => {
+    const cached = canonicalDomainsCache.get(CANONICAL_DOMAINS_CACHE_KEY);
+    if (cached) {
+      res.type('application/json').send(cached);
+      return;
+    }
+
     const domains = await prisma.canonicalDomain.findMany({
       orderBy: { name: 'asc' },
       include: {
@@ -98,7 +121,7 @@ export function setupCanonicalRoutes(app: Express): void {
       },
     });
 
-    res.json({
+    const body = JSON.stringify({
       domains: domains.map((domain) => ({
         id: domain.id,
         name: domain.name,
@@ -106,9 +129,17 @@ export function setupCanonicalRoutes(app: Express): void {
         fieldCount: domain._count.canonicalFields,
       })),
     });
+    canonicalDomainsCache.set(CANONICAL_DOMAINS_CACHE_KEY, body);
+    res.type('application/json').send(body);
   });
 
   app.get('/api/canonical/domains/:domainId/fields', authMiddleware, async (req: Request, res: Response) => {
+    const cached = canonicalFieldsCache.get(req.params.domainId);
+    if (cached) {
+      res.type('application/json').send(cached);
+      return;
+    }
+
     const domain = await prisma.canonicalDomain.findUnique({ where: { id: req.params.domainId } });
     if (!domain) {
       sendError(req, res, 404, 'CANONICAL_DOMAIN_NOT_FOUND', 'Canonical domain not found');
@@ -128,7 +159,9 @@ export function setupCanonicalRoutes(app: Express): void {
       },
     });
 
-    res.json({ fields });
+    const body = JSON.stringify({ fields });
+    canonicalFieldsCache.set(req.params.domainId, body);
+    res.type('application/json').send(body);
   });
 
   app.get('/api/systems/:systemId/canonical-map', authMiddleware, async (req: Request, res: Response) => {
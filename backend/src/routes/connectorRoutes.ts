@@ -20,11 +20,15 @@ import { prisma } from '../db/prismaClient.js';
 import { defaultRegistry } from '../../../packages/connectors/ConnectorRegistry.js';
 import type { ConnectorCredentials } from '../../../packages/connectors/IConnector.js';
 import { normalizeConnectorCredentials } from '../../../packages/connectors/credentialNormalizer.js';
+import { mapWithConcurrency, METADATA_FETCH_CONCURRENCY } from '../../../packages/connectors/utils/concurrency.js';
 import { authMiddleware } from '../auth/authMiddleware.js';
+import { ConnectorMetadataCache, defaultMetadataCache } from '../services/connectorMetadataCache.js';
+import { defaultConnectorPool } from '../services/connectorPool.js';
 import { defaultSessionStore } from '../services/connectorSessionStore.js';
 import { parseUploadedSchema } from '../services/schemaUploadParser.js';
 import type { DataType, MappingProject, System } from '../types.js';
 import { sendHttpError } from '../utils/httpErrors.js';
+import { TtlCache } from '../utils/ttlCache.js';
 
 function sendError(
   req: Request,
@@ -140,6 +144,17 @@ const customConnectorStore = new Map<
   StoredCustomConnector
 >();
 
+/**
+ * Validated custom connectors by id for the Postgres store. Definitions are
+ * never edited after creation and ids are random, so cached hits and misses
+ * stay correct; the TTL only bounds memory. Saves the per-request row read and
+ * entity re-normalization on every connector call.
+ */
+const customConnectorCache = new TtlCache<string, StoredCustomConnector | null>({
+  ttlMs: 10 * 60_000,
+  maxEntries: 500,
+});
+
 function isPostgresCustomConnectorStoreEnabled(): boolean {
   return Boolean(process.env.DATABASE_URL);
 }
@@ -176,11 +191,20 @@ function loadCustomConnectorStoreFromDisk(): void {
   }
 }
 
-function persistCustomConnectorStoreToDisk(): void {
-  const dirPath = path.dirname(customConnectorStorePath);
-  fs.mkdirSync(dirPath, { recursive: true });
+let customConnectorPersistQueue: Promise<void> = Promise.resolve();
+
+/**
+ * Writes the custom connector store without blocking the event loop.
+ * Writes are chained so overlapping saves land on disk in request order.
+ */
+function persistCustomConnectorStoreToDisk(): Promise<void> {
   const payload = JSON.stringify(Array.from(customConnectorStore.values()), null, 2);
-  fs.writeFileSync(customConnectorStorePath, payload, 'utf8');
+  const write = customConnectorPersistQueue.then(async () => {
+    await fs.promises.mkdir(path.dirname(customConnectorStorePath), { recursive: true });
+    await fs.promises.writeFile(customConnectorStorePath, payload, 'utf8');
+  });
+  customConnectorPersistQueue = write.catch(() => undefined);
+  return write;
 }
 
 loadCustomConnectorStoreFromDisk();
@@ -313,8 +337,11 @@ async function listCustomConnectors(): Promise<StoredCustomConnector[]> {
   });
 
   return rows
-    .map((row) =>
-      toStoredCustomConnector({
+    .map((row) => {
+      // Reuse the normalized definition when this id has been seen before.
+      const cached = customConnectorCache.get(row.id);
+      if (cached !== undefined) return cached;
+      const connector = toStoredCustomConnector({
         id: row.id,
         name: row.name,
         vendor: row.vendor,
@@ -323,8 +350,10 @@ async function listCustomConnectors(): Promise<StoredCustomConnector[]> {
         entityNames: row.entityNames,
         entities: row.entities,
         connectionConfig: row.connectionConfig,
-      }),
-    )
+      });
+      customConnectorCache.set(row.id, connector);
+      return connector;
+    })
     .filter((row): row is StoredCustomConnector => Boolean(row));
 }
 
@@ -334,6 +363,9 @@ async function getCustomConnector(connectorId: string): Promise<StoredCustomConn
   }
   await ensureCustomConnectorBackfill();
 
+  const cached = customConnectorCache.get(connectorId);
+  if (cached !== undefined) return cached;
+
   const row = await prisma.customConnector.findUnique({
     where: { id: connectorId },
     select: {
@@ -347,18 +379,20 @@ async function getCustomConnector(connectorId: string): Promise<StoredCustomConn
       connectionConfig: true,
     },
   });
-  if (!row) return null;
-
-  return toStoredCustomConnector({
-    id: row.id,
-    name: row.name,
-    vendor: row.vendor,
-    category: row.category,
-    description: row.description,
-    entityNames: row.entityNames,
-    entities: row.entities,
-    connectionConfig: row.connectionConfig,
-  });
+  const connector = row
+    ? toStoredCustomConnector({
+      id: row.id,
+      name: row.name,
+      vendor: row.vendor,
+      category: row.category,
+      description: row.description,
+      entityNames: row.entityNames,
+      entities: row.entities,
+      connectionConfig: row.connectionConfig,
+    })
+    : null;
+  customConnectorCache.set(connectorId, connector);
+  return connector;
 }
 
 async function saveCustomConnector(
@@ -367,7 +401,7 @@ async function saveCustomConnector(
 ): Promise<void> {
   if (!isPostgresCustomConnectorStoreEnabled()) {
     customConnectorStore.set(connector.definition.id, connector);
-    persistCustomConnectorStoreToDisk();
+    await persistCustomConnectorStoreToDisk();
     return;
   }
   await ensureCustomConnectorBackfill();
@@ -388,6 +422,7 @@ async function saveCustomConnector(
       createdByUserId: createdByUserId ?? null,
     },
   });
+  customConnectorCache.set(connector.definition.id, connector);
 }
 
 let customConnectorBackfillPromise: Promise<void> | null = null;
@@ -449,6 +484,70 @@ function defaultSalesforceObjectsForProject(
   return SALESFORCE_STANDARD_OBJECTS;
 }
 
+type ConnectorProbeOutcome =
+  | { ok: true; body: Record<string, unknown> }
+  | { ok: false; status: number; code: string; message: string };
+
+const CONNECTOR_TEST_BATCH_MAX = 20;
+
+/**
+ * Connect to a connector and run its health probe. Shared by the single and
+ * batch test routes; never throws — failures come back as an error outcome.
+ */
+async function probeConnector(
+  id: string,
+  body: Record<string, unknown>,
+  userId?: string,
+): Promise<ConnectorProbeOutcome> {
+  let customConnector: StoredCustomConnector | null = null;
+  try {
+    customConnector = await getCustomConnector(id);
+  } catch (error: unknown) {
+    const message = error instanceof Error ? error.message : 'Could not load custom connector';
+    return { ok: false, status: 500, code: 'CONNECTOR_PERSISTENCE_ERROR', message };
+  }
+  if (!defaultRegistry.has(id) && !customConnector) {
+    return { ok: false, status: 404, code: 'CONNECTOR_NOT_FOUND', message: `No connector registered with id "${id}"` };
+  }
+
+  if (customConnector) {
+    return {
+      ok: true,
+      body: {
+        connected: true,
+        latencyMs: 0,
+        systemInfo: {
+          mode: 'uploaded',
+          displayName: customConnector.definition.name,
+          protocol: 'Custom',
+        },
+      },
+    };
+  }
+
+  try {
+    const credentials = normalizeConnectorCredentials(id, extractCredentials(body, userId, id));
+    const connector = defaultRegistry.instantiate(id, credentials);
+    await connector.connect(credentials);
+    const [result, info] = await Promise.all([
+      connector.testConnection(),
+      connector.getSystemInfo(),
+    ]);
+    if (hasCredentialValues(credentials) && info.mode !== 'live') {
+      return {
+        ok: false,
+        status: 502,
+        code: 'LIVE_CONNECTION_REQUIRED',
+        message: `Connector "${id}" did not establish a live connection with the provided credentials`,
+      };
+    }
+    return { ok: true, body: { ...result, systemInfo: info } };
+  } catch (error: unknown) {
+    const message = error instanceof Error ? error.message : 'Connection test failed';
+    return { ok: false, status: 502, code: 'CONNECTION_ERROR', message };
+  }
+}
+
 export function setupConnectorRoutes(app: Express, store: DbStore | FsStore): void {
   const upload = multer({ limits: { fileSize: 8 * 1024 * 1024 } });
   void ensureCustomConnectorBackfill();
@@ -553,58 +652,57 @@ export function setupConnectorRoutes(app: Express, store: DbStore | FsStore): vo
 
   // ─── POST /api/connectors/:id/test ────────────────────────────────────────
   app.post('/api/connectors/:id/test', async (req: Request, res: Response) => {
-    const { id } = req.params;
-    let customConnector: StoredCustomConnector | null = null;
-    try {
-      customConnector = await getCustomConnector(id);
-    } catch (error: unknown) {
-      const message = error instanceof Error ? error.message : 'Could not load custom connector';
-      sendError(req, res, 500, 'CONNECTOR_PERSISTENCE_ERROR', message);
-      return;
-    }
-    if (!defaultRegistry.has(id) && !customConnector) {
-      sendError(req, res, 404, 'CONNECTOR_NOT_FOUND', `No connector registered with id "${id}"`);
+    const outcome = await probeConnector(req.params.id, req.body as Record<string, unknown>, req.user?.userId);
+    if (!outcome.ok) {
+      sendError(req, res, outcome.status, outcome.code, outcome.message);
       return;
     }
+    res.json(outcome.body);
+  });
 
-    if (customConnector) {
-      res.json({
-        connected: true,
-        latencyMs: 0,
-        systemInfo: {
-          mode: 'uploaded',
-          displayName: customConnector.definition.name,
-          protocol: 'Custom',
-        },
-      });
+  // ─── POST /api/connectors/test-batch ──────────────────────────────────────
+  // Probe several connectors in one call (onboarding validates source and
+  // target together). Handshakes run concurrently, capped to avoid tripping
+  // auth-endpoint throttling; each entry reports its own success or error.
+  app.post('/api/connectors/test-batch', async (req: Request, res: Response) => {
+    const body = req.body as Record<string, unknown>;
+    const connections = Array.isArray(body.connections) ? body.connections : null;
+    if (!connections || connections.length === 0) {
+      sendError(req, res, 400, 'VALIDATION_ERROR', 'connections must be a non-empty array');
       return;
     }
-
-    try {
-      const userId = req.user?.userId;
-      const credentials = normalizeConnectorCredentials(
-        id,
-        extractCredentials(req.body as Record<string, unknown>, userId, id),
+    if (connections.length > CONNECTOR_TEST_BATCH_MAX) {
+      sendError(
+        req,
+        res,
+        400,
+        'VALIDATION_ERROR',
+        `connections may contain at most ${CONNECTOR_TEST_BATCH_MAX} entries`,
       );
-      const connector = defaultRegistry.instantiate(id, credentials);
-      await connector.connect(credentials);
-      const result = await connector.testConnection();
-      const info = await connector.getSystemInfo();
-      if (hasCredentialValues(credentials) && info.mode !== 'live') {
-        sendError(
-          req,
-          res,
-          502,
-          'LIVE_CONNECTION_REQUIRED',
-          `Connector "${id}" did not establish a live connection with the provided credentials`,
-        );
-        return;
-      }
-      res.json({ ...result, systemInfo: info });
-    } catch (error: unknown) {
-      const message = error instanceof Error ? error.message : 'Connection test failed';
-      sendError(req, res, 502, 'CONNECTION_ERROR', message);
+      return;
     }
+    const invalidIndex = connections.findIndex((entry) => (
+      !entry || typeof entry !== 'object' || Array.isArray(entry)
+      || typeof (entry as Record<string, unknown>).connectorId !== 'string'
+    ));
+    if (invalidIndex !== -1) {
+      sendError(req, res, 400, 'VALIDATION_ERROR', `connections[${invalidIndex}].connectorId is required`);
+      return;
+    }
+
+    const userId = req.user?.userId;
+    const results = await mapWithConcurrency(
+      connections as Array<Record<string, unknown>>,
+      METADATA_FETCH_CONCURRENCY,
+      async (entry) => {
+        const connectorId = entry.connectorId as string;
+        const outcome = await probeConnector(connectorId, entry, userId);
+        return outcome.ok
+          ? { connectorId, ...outcome.body }
+          : { connectorId, connected: false, error: { code: outcome.code, message: outcome.message } };
+      },
+    );
+    res.json({ results });
   });
 
   // ─── POST /api/connectors/:id/objects ────────────────────────────────────
@@ -638,11 +736,23 @@ export function setupConnectorRoutes(app: Express, store: DbStore | FsStore): vo
         id,
         extractCredentials(req.body as Record<string, unknown>, userId, id),
       );
-      const connector = defaultRegistry.instantiate(id, credentials);
-      await connector.connect(credentials);
-      const objects = await connector.listObjects();
-      const info = await connector.getSystemInfo();
-      if (hasCredentialValues(credentials) && info.mode !== 'live') {
+      const requiresLive = hasCredentialValues(credentials);
+      const cacheKey = ConnectorMetadataCache.key(id, credentials, 'objects');
+      const refresh = (req.body as Record<string, unknown>).refresh === true;
+      if (refresh) defaultMetadataCache.delete(cacheKey);
+      const { objects, info } = await defaultMetadataCache.getOrLoad(
+        cacheKey,
+        () => defaultConnectorPool.withConnector(id, credentials, async (connector) => {
+          if (refresh) connector.clearMetadataCache?.();
+          const [listed, systemInfo] = await Promise.all([
+            connector.listObjects(),
+            connector.getSystemInfo(),
+          ]);
+          return { objects: listed, info: systemInfo };
+        }),
+        (loaded) => !requiresLive || loaded.info.mode === 'live',
+      );
+      if (requiresLive && info.mode !== 'live') {
         sendError(
           req,
           res,
@@ -697,10 +807,25 @@ export function setupConnectorRoutes(app: Express, store: DbStore | FsStore): vo
         id,
         extractCredentials(body, userId, id),
       );
-      const connector = defaultRegistry.instantiate(id, credentials);
-      await connector.connect(credentials);
-      const schema = await connector.fetchSchema(objectNames);
-      if (hasCredentialValues(credentials) && schema.mode !== 'live') {
+      // Preview only — ingest below always fetches fresh so persisted entity ids stay unique.
+      // `refresh: true` also drops the connector's own describe cache.
+      const requiresLive = hasCredentialValues(credentials);
+      const cacheKey = ConnectorMetadataCache.key(id, credentials, 'schema', objectNames);
+      const refresh = body.refresh === true;
+      if (refresh) defaultMetadataCache.delete(cacheKey);
+      const schema = await defaultMetadataCache.getOrLoad(
+        cacheKey,
+        () => defaultConnectorPool.withConnector(
+          id,
+          credentials,
+          (connector) => {
+            if (refresh) connector.clearMetadataCache?.();
+            return connector.fetchSchema(objectNames);
+          },
+        ),
+        (loaded) => !requiresLive || loaded.mode === 'live',
+      );
+      if (requiresLive && schema.mode !== 'live') {
         sendError(
           req,
           res,
@@ -778,20 +903,26 @@ export function setupConnectorRoutes(app: Express, store: DbStore | FsStore): vo
     async (req: Request, res: Response) => {
       const { projectId, connectorId } = req.params;
 
-      const project = await store.getProject(projectId);
+      // Independent reads; run them together but keep the 404-before-500 order.
+      const [project, customConnectorLookup] = await Promise.all([
+        store.getProject(projectId),
+        getCustomConnector(connectorId).then(
+          (connector) => ({ connector, failed: false, error: undefined as unknown }),
+          (error: unknown) => ({ connector: null, failed: true, error }),
+        ),
+      ]);
       if (!project) {
         sendError(req, res, 404, 'PROJECT_NOT_FOUND', 'Project not found');
         return;
       }
 
-      let customConnector: StoredCustomConnector | null = null;
-      try {
-        customConnector = await getCustomConnector(connectorId);
-      } catch (error: unknown) {
+      if (customConnectorLookup.failed) {
+        const { error } = customConnectorLookup;
         const message = error instanceof Error ? error.message : 'Could not load custom connector';
         sendError(req, res, 500, 'CONNECTOR_PERSISTENCE_ERROR', message);
         return;
       }
+      const customConnector: StoredCustomConnector | null = customConnectorLookup.connector;
       if (!defaultRegistry.has(connectorId) && !customConnector) {
         sendError(
           req,
@@ -842,9 +973,14 @@ export function setupConnectorRoutes(app: Express, store: DbStore | FsStore): vo
           connectorId,
           extractCredentials(body, userId, connectorId),
         );
-        const connector = defaultRegistry.instantiate(connectorId, credentials);
-        await connector.connect(credentials);
-        const schema = await connector.fetchSchema(objectNames);
+        const schema = await defaultConnectorPool.withConnector(
+          connectorId,
+          credentials,
+          (connector) => {
+            if (body.refresh === true) connector.clearMetadataCache?.();
+            return connector.fetchSchema(objectNames);
+          },
+        );
         if (hasCredentialValues(credentials) && schema.mode !== 'live') {
           sendError(
             req,
@@ -1,7 +1,7 @@
 import type { Express, Request, Response } from 'express';
 import { z } from 'zod';
 import { authMiddleware } from '../auth/authMiddleware.js';
-import { errorReportingService } from '../services/errorReporting.js';
+import { getErrorReportingService } from '../services/errorReporting.js';
 import { sendHttpError } from '../utils/httpErrors.js';
 
 const SeveritySchema = z.enum(['fatal', 'error', 'warning', 'info']);
@@ -57,7 +57,7 @@ export function setupErrorReportingRoutes(app: Express): void {
 
     const data = parsed.data;
 
-    const report = errorReportingService.capture({
+    const report = getErrorReportingService().capture({
       severity: data.severity ?? 'error',
       source: data.source ?? 'frontend',
       code: data.code ?? 'FRONTEND_ERROR',
@@ -90,7 +90,7 @@ export function setupErrorReportingRoutes(app: Express): void {
       ? new Date(Date.now() - query.sinceHours * 60 * 60 * 1000).toISOString()
       : undefined;
 
-    const reports = errorReportingService.list({
+    const reports = getErrorReportingService().list({
       limit: query.limit,
       severity: query.severity,
       source: query.source,
@@ -109,7 +109,7 @@ export function setupErrorReportingRoutes(app: Express): void {
       return;
     }
 
-    const summary = errorReportingService.summary(parsed.data.windowHours ?? 24);
+    const summary = getErrorReportingService().summary(parsed.data.windowHours ?? 24);
     res.json({ summary });
   });
 }
@@ -2,7 +2,7 @@ import type { Express, Request, Response } from 'express';
 import { authMiddleware } from '../auth/authMiddleware.js';
 import { activeProvider } from '../agents/llm/LLMGateway.js';
 import { runWithLLMRuntimeContext } from '../services/llmRuntimeContext.js';
-import { llmSettingsStore, type LLMSettingsStore } from '../services/llmSettingsStore.js';
+import { getLLMSettingsStore, type LLMSettingsStore } from '../services/llmSettingsStore.js';
 import { sendHttpError } from '../utils/httpErrors.js';
 
 function sendError(
@@ -28,7 +28,7 @@ function isValidMode(value: unknown): value is 'default' | 'byol' {
   return value === 'default' || value === 'byol';
 }
 
-export function setupLLMRoutes(app: Express, settingsStore: LLMSettingsStore = llmSettingsStore): void {
+export function setupLLMRoutes(app: Express, settingsStore: LLMSettingsStore = getLLMSettingsStore()): void {
   app.get('/api/llm/config', authMiddleware, async (req: Request, res: Response) => {
     const userId = toUserId(req);
     const runtimeConfig = await settingsStore.getRuntimeConfig(userId);
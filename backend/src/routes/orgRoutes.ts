@@ -1,13 +1,14 @@
 import type { Express, Request, Response } from 'express';
 import { randomUUID } from 'node:crypto';
 import multer from 'multer';
+import type { Prisma } from '@prisma/client';
 import { z } from 'zod';
 import { prisma } from '../db/prismaClient.js';
 import { authMiddleware } from '../auth/authMiddleware.js';
 import { buildCanonicalTransitiveMappings } from './canonicalRoutes.js';
 import { sendHttpError } from '../utils/httpErrors.js';
 import { parseWorkbookFieldMappings } from '../services/mappingWorkbookParser.js';
-import type { AppState, MappingProject, SeedSummary } from '../types.js';
+import type { MappingProject, SeedSummary } from '../types.js';
 
 const TRANSFORM_TYPES = ['direct', 'concat', 'formatDate', 'lookup', 'static', 'regex', 'split', 'trim'] as const;
 const workbookUpload = multer({ limits: { fileSize: 12 * 1024 * 1024 } });
@@ -70,42 +71,111 @@ function similarityScore(a: string, b: string): number {
   return union ? intersection / union : 0;
 }
 
-async function resolveField(systemId: string, entityName: string, fieldName: string) {
-  return prisma.field.findFirst({
-    where: {
-      name: fieldName,
-      entity: {
-        systemId,
-        name: entityName,
-      },
-    },
-    include: {
-      entity: true,
-    },
+function fieldNameKey(entityName: string, fieldName: string): string {
+  return `${entityName}\u0000${fieldName}`;
+}
+
+/** First field wins per entity/field name, matching the old findFirst lookup. */
+function indexFieldsByEntityAndName<T extends { name: string; entity: { name: string } }>(fields: T[]): Map<string, T> {
+  const byName = new Map<string, T>();
+  for (const field of fields) {
+    const key = fieldNameKey(field.entity.name, field.name);
+    if (!byName.has(key)) byName.set(key, field);
+  }
+  return byName;
+}
+
+/**
+ * Load a system's fields with their entity attached. Querying from the entity
+ * side filters on the indexed Entity.systemId and then reads fields by
+ * entityId, instead of the `entityId IN (SELECT ...)` subquery Prisma emits for
+ * a relation filter on Field plus a second entity read for the include.
+ */
+async function loadSystemFields(systemId: string) {
+  const entities = await prisma.entity.findMany({
+    where: { systemId },
+    include: { fields: true },
   });
+  return entities.flatMap(({ fields, ...entity }) => fields.map((field) => ({ ...field, entity })));
 }
 
-async function ensureEntityMapping(projectId: string, sourceEntityId: string, targetEntityId: string) {
-  const existing = await prisma.entityMapping.findFirst({
-    where: {
-      projectId,
-      sourceEntityId,
-      targetEntityId,
-    },
+/** Name-only variant of loadSystemFields for the workbook field lookup. */
+async function loadSystemFieldNames(systemId: string): Promise<Array<{ name: string; entity: { name: string } }>> {
+  const entities = await prisma.entity.findMany({
+    where: { systemId },
+    select: { name: true, fields: { select: { name: true } } },
   });
+  return entities.flatMap((entity) => entity.fields.map((field) => ({ name: field.name, entity: { name: entity.name } })));
+}
 
-  if (existing) return existing;
+type SeedFieldMappingData = Pick<
+  Prisma.FieldMappingCreateManyInput,
+  'transform' | 'confidence' | 'rationale' | 'status' | 'seedSource'
+>;
+
+/**
+ * Accumulates seeded mappings against the project's existing rows so the seed
+ * route writes them with one createMany per table instead of a findFirst +
+ * create per mapping. Existing entity mappings are reused and existing field
+ * mappings are skipped, as before.
+ */
+function createSeedMappingWriter(
+  projectId: string,
+  existingEntityMappings: Array<{ id: string; sourceEntityId: string; targetEntityId: string }>,
+  existingFieldMappings: Array<{ entityMappingId: string; sourceFieldId: string; targetFieldId: string }>,
+) {
+  const entityMappingIds = new Map<string, string>();
+  for (const mapping of existingEntityMappings) {
+    const key = `${mapping.sourceEntityId}|${mapping.targetEntityId}`;
+    if (!entityMappingIds.has(key)) entityMappingIds.set(key, mapping.id);
+  }
+  const fieldMappingKeys = new Set(
+    existingFieldMappings.map((mapping) => `${mapping.entityMappingId}|${mapping.sourceFieldId}|${mapping.targetFieldId}`),
+  );
+  const newEntityMappings: Prisma.EntityMappingCreateManyInput[] = [];
+  const newFieldMappings: Prisma.FieldMappingCreateManyInput[] = [];
 
-  return prisma.entityMapping.create({
-    data: {
-      id: randomUUID(),
-      projectId,
-      sourceEntityId,
-      targetEntityId,
-      confidence: 0.85,
-      rationale: 'Seeded via learning loop',
+  return {
+    add(
+      sourceField: { id: string; entityId: string },
+      targetField: { id: string; entityId: string },
+      data: SeedFieldMappingData,
+    ): void {
+      const entityKey = `${sourceField.entityId}|${targetField.entityId}`;
+      let entityMappingId = entityMappingIds.get(entityKey);
+      if (!entityMappingId) {
+        entityMappingId = randomUUID();
+        entityMappingIds.set(entityKey, entityMappingId);
+        newEntityMappings.push({
+          id: entityMappingId,
+          projectId,
+          sourceEntityId: sourceField.entityId,
+          targetEntityId: targetField.entityId,
+          confidence: 0.85,
+          rationale: 'Seeded via learning loop',
+        });
+      }
+
+      const fieldKey = `${entityMappingId}|${sourceField.id}|${targetField.id}`;
+      if (fieldMappingKeys.has(fieldKey)) return;
+      fieldMappingKeys.add(fieldKey);
+      newFieldMappings.push({
+        id: randomUUID(),
+        entityMappingId,
+        sourceFieldId: sourceField.id,
+        targetFieldId: targetField.id,
+        ...data,
+      });
     },
-  });
+
+    async flush(): Promise<void> {
+      if (!newEntityMappings.length && !newFieldMappings.length) return;
+      await prisma.$transaction([
+        prisma.entityMapping.createMany({ data: newEntityMappings }),
+        prisma.fieldMapping.createMany({ data: newFieldMappings }),
+      ]);
+    },
+  };
 }
 
 async function loadUserOrg(userId: string): Promise<{ id: string; slug: string } | null> {
@@ -140,19 +210,16 @@ function isAdminRole(role: string): boolean {
   return normalized === 'ADMIN' || normalized === 'OWNER';
 }
 
-function getPreferredTransform(events: Array<{ transformType: string | null }>): string | null {
-  const counts = new Map<string, number>();
-  for (const event of events) {
-    if (!event.transformType) continue;
-    counts.set(event.transformType, (counts.get(event.transformType) ?? 0) + 1);
-  }
-
+function getPreferredTransform(
+  groups: Array<{ transformType: string | null; _count: { _all: number } }>,
+): string | null {
   let winner: string | null = null;
   let best = -1;
-  for (const [transform, count] of counts) {
-    if (count > best) {
-      best = count;
-      winner = transform;
+  for (const group of groups) {
+    if (!group.transformType) continue;
+    if (group._count._all > best) {
+      best = group._count._all;
+      winner = group.transformType;
     }
   }
 
@@ -208,7 +275,6 @@ function parseConfidence(input: unknown): number {
 
 interface SeedStoreAdapter {
   getProject(projectId: string): Promise<MappingProject | undefined> | MappingProject | undefined;
-  getState(): Promise<AppState> | AppState;
 }
 
 export function setupOrgRoutes(app: Express, store?: SeedStoreAdapter): void {
@@ -298,7 +364,10 @@ export function setupOrgRoutes(app: Express, store?: SeedStoreAdapter): void {
         },
       });
 
-      const acceptedEvents = await tx.mappingEvent.findMany({
+      // Count accepted transforms in the database; the event history for a
+      // popular pair grows without bound.
+      const acceptedTransforms = await tx.mappingEvent.groupBy({
+        by: ['transformType'],
         where: {
           organisationId: org.id,
           sourceSystemId: input.sourceSystemId,
@@ -308,11 +377,12 @@ export function setupOrgRoutes(app: Express, store?: SeedStoreAdapter): void {
           targetEntityName: input.targetEntityName,
           targetFieldName: input.targetFieldName,
           action: 'accepted',
+          transformType: { not: null },
         },
-        select: { transformType: true },
+        _count: { _all: true },
       });
 
-      const preferredTransform = getPreferredTransform(acceptedEvents);
+      const preferredTransform = getPreferredTransform(acceptedTransforms);
       const confidence = computeConfidence({
         acceptCount: derived.acceptCount,
         rejectCount: derived.rejectCount,
@@ -357,6 +427,8 @@ export function setupOrgRoutes(app: Express, store?: SeedStoreAdapter): void {
     const targetSystem = typeof req.query.targetSystem === 'string' ? req.query.targetSystem : undefined;
     const minConfidence = Number.parseFloat(typeof req.query.minConfidence === 'string' ? req.query.minConfidence : '0.60');
     const limit = Math.min(Number.parseInt(typeof req.query.limit === 'string' ? req.query.limit : '200', 10), 500);
+    const offset = Number.parseInt(typeof req.query.offset === 'string' ? req.query.offset : '0', 10);
+    const skip = Number.isFinite(offset) && offset > 0 ? offset : 0;
 
     const where = {
       organisationId: org.id,
@@ -368,13 +440,15 @@ export function setupOrgRoutes(app: Express, store?: SeedStoreAdapter): void {
     const [mappings, total] = await Promise.all([
       prisma.derivedMapping.findMany({
         where,
-        orderBy: { confidence: 'desc' },
+        // id breaks confidence ties so offset pages don't overlap or skip rows.
+        orderBy: [{ confidence: 'desc' }, { id: 'asc' }],
+        skip,
         take: Number.isFinite(limit) ? limit : 200,
       }),
       prisma.derivedMapping.count({ where }),
     ]);
 
-    res.json({ mappings, total });
+    res.json({ mappings, total, offset: skip });
   });
 
   app.post(
@@ -449,36 +523,8 @@ export function setupOrgRoutes(app: Express, store?: SeedStoreAdapter): void {
       }
 
       const [sourceFields, targetFields] = await Promise.all([
-        prisma.field.findMany({
-          where: {
-            entity: {
-              systemId: project.sourceSystemId,
-            },
-          },
-          select: {
-            name: true,
-            entity: {
-              select: {
-                name: true,
-              },
-            },
-          },
-        }),
-        prisma.field.findMany({
-          where: {
-            entity: {
-              systemId: project.targetSystemId,
-            },
-          },
-          select: {
-            name: true,
-            entity: {
-              select: {
-                name: true,
-              },
-            },
-          },
-        }),
+        loadSystemFieldNames(project.sourceSystemId),
+        loadSystemFieldNames(project.targetSystemId),
       ]);
 
       const sourceLookup = buildFieldLookupIndex(sourceFields);
@@ -608,7 +654,6 @@ export function setupOrgRoutes(app: Express, store?: SeedStoreAdapter): void {
         return;
       }
 
-      await Promise.resolve(store.getState());
       const summary: SeedSummary = {
         fromDerived: 0,
         fromCanonical: 0,
@@ -654,114 +699,86 @@ export function setupOrgRoutes(app: Express, store?: SeedStoreAdapter): void {
     const coveredSourceFieldIds = new Set<string>();
     const coveredTargetFieldIds = new Set<string>();
 
-    const derivedMappings = await prisma.derivedMapping.findMany({
-      where: {
-        organisationId: organisation.id,
-        sourceSystemId: project.sourceSystemId,
-        targetSystemId: project.targetSystemId,
-        confidence: { gte: 0.85 },
-      },
-      orderBy: { confidence: 'desc' },
-    });
+    // Both seed sources and both systems' fields are read-only lookups keyed by
+    // the system pair, so load them together. Fields are indexed by
+    // entity/field name up front instead of one findFirst per seeded mapping.
+    const [
+      derivedMappings,
+      canonicalMappings,
+      sourceFields,
+      targetFields,
+      existingEntityMappings,
+      existingFieldMappings,
+    ] = await Promise.all([
+      prisma.derivedMapping.findMany({
+        where: {
+          organisationId: organisation.id,
+          sourceSystemId: project.sourceSystemId,
+          targetSystemId: project.targetSystemId,
+          confidence: { gte: 0.85 },
+        },
+        orderBy: { confidence: 'desc' },
+      }),
+      buildCanonicalTransitiveMappings(project.sourceSystemId, project.targetSystemId),
+      loadSystemFields(project.sourceSystemId),
+      loadSystemFields(project.targetSystemId),
+      prisma.entityMapping.findMany({
+        where: { projectId: project.id },
+        select: { id: true, sourceEntityId: true, targetEntityId: true },
+        orderBy: { createdAt: 'asc' },
+      }),
+      prisma.fieldMapping.findMany({
+        where: { entityMapping: { projectId: project.id } },
+        select: { entityMappingId: true, sourceFieldId: true, targetFieldId: true },
+      }),
+    ]);
+    const seedWriter = createSeedMappingWriter(project.id, existingEntityMappings, existingFieldMappings);
+    const sourceFieldsByName = indexFieldsByEntityAndName(sourceFields);
+    const targetFieldsByName = indexFieldsByEntityAndName(targetFields);
 
     for (const derived of derivedMappings) {
-      const sourceField = await resolveField(project.sourceSystemId, derived.sourceEntityName, derived.sourceFieldName);
-      const targetField = await resolveField(project.targetSystemId, derived.targetEntityName, derived.targetFieldName);
+      const sourceField = sourceFieldsByName.get(fieldNameKey(derived.sourceEntityName, derived.sourceFieldName));
+      const targetField = targetFieldsByName.get(fieldNameKey(derived.targetEntityName, derived.targetFieldName));
       if (!sourceField || !targetField) continue;
       if (coveredTargetFieldIds.has(targetField.id)) continue;
 
-      const entityMapping = await ensureEntityMapping(project.id, sourceField.entityId, targetField.entityId);
-      const existing = await prisma.fieldMapping.findFirst({
-        where: {
-          entityMappingId: entityMapping.id,
-          sourceFieldId: sourceField.id,
-          targetFieldId: targetField.id,
+      seedWriter.add(sourceField, targetField, {
+        transform: {
+          type: (derived.preferredTransform && TRANSFORM_TYPES.includes(derived.preferredTransform as (typeof TRANSFORM_TYPES)[number]))
+            ? derived.preferredTransform
+            : 'direct',
+          config: {},
         },
+        confidence: derived.confidence,
+        rationale: 'Pre-seeded from historical accepted mappings',
+        status: 'accepted',
+        seedSource: 'derived',
       });
 
-      if (!existing) {
-        await prisma.fieldMapping.create({
-          data: {
-            id: randomUUID(),
-            entityMappingId: entityMapping.id,
-            sourceFieldId: sourceField.id,
-            targetFieldId: targetField.id,
-            transform: {
-              type: (derived.preferredTransform && TRANSFORM_TYPES.includes(derived.preferredTransform as (typeof TRANSFORM_TYPES)[number]))
-                ? derived.preferredTransform
-                : 'direct',
-              config: {},
-            },
-            confidence: derived.confidence,
-            rationale: 'Pre-seeded from historical accepted mappings',
-            status: 'accepted',
-            seedSource: 'derived',
-          },
-        });
-      }
-
       coveredSourceFieldIds.add(sourceField.id);
       coveredTargetFieldIds.add(targetField.id);
       summary.fromDerived += 1;
     }
 
-    const canonicalMappings = await buildCanonicalTransitiveMappings(project.sourceSystemId, project.targetSystemId);
-
     for (const canonical of canonicalMappings) {
-      const sourceField = await resolveField(project.sourceSystemId, canonical.sourceEntity, canonical.sourceField);
-      const targetField = await resolveField(project.targetSystemId, canonical.targetEntity, canonical.targetField);
+      const sourceField = sourceFieldsByName.get(fieldNameKey(canonical.sourceEntity, canonical.sourceField));
+      const targetField = targetFieldsByName.get(fieldNameKey(canonical.targetEntity, canonical.targetField));
       if (!sourceField || !targetField) continue;
       if (coveredTargetFieldIds.has(targetField.id)) continue;
 
-      const entityMapping = await ensureEntityMapping(project.id, sourceField.entityId, targetField.entityId);
-      const existing = await prisma.fieldMapping.findFirst({
-        where: {
-          entityMappingId: entityMapping.id,
-          sourceFieldId: sourceField.id,
-          targetFieldId: targetField.id,
-        },
+      seedWriter.add(sourceField, targetField, {
+        transform: { type: 'direct', config: {} },
+        confidence: canonical.confidence,
+        rationale: `Seeded from canonical concept ${canonical.canonicalConcept}`,
+        status: 'suggested',
+        seedSource: 'canonical',
       });
 
-      if (!existing) {
-        await prisma.fieldMapping.create({
-          data: {
-            id: randomUUID(),
-            entityMappingId: entityMapping.id,
-            sourceFieldId: sourceField.id,
-            targetFieldId: targetField.id,
-            transform: { type: 'direct', config: {} },
-            confidence: canonical.confidence,
-            rationale: `Seeded from canonical concept ${canonical.canonicalConcept}`,
-            status: 'suggested',
-            seedSource: 'canonical',
-          },
-        });
-      }
-
       coveredSourceFieldIds.add(sourceField.id);
       coveredTargetFieldIds.add(targetField.id);
       summary.fromCanonical += 1;
     }
 
-    const [sourceFields, targetFields] = await Promise.all([
-      prisma.field.findMany({
-        where: {
-          entity: {
-            systemId: project.sourceSystemId,
-          },
-        },
-        include: { entity: true },
-      }),
-      prisma.field.findMany({
-        where: {
-          entity: {
-            systemId: project.targetSystemId,
-          },
-        },
-        include: { entity: true },
-      }),
-    ]);
-
     for (const sourceField of sourceFields) {
       if (coveredSourceFieldIds.has(sourceField.id)) continue;
 
@@ -781,36 +798,20 @@ export function setupOrgRoutes(app: Express, store?: SeedStoreAdapter): void {
 
       if (!bestTarget || bestScore < 0.2) continue;
 
-      const entityMapping = await ensureEntityMapping(project.id, sourceField.entityId, bestTarget.entityId);
-      const existing = await prisma.fieldMapping.findFirst({
-        where: {
-          entityMappingId: entityMapping.id,
-          sourceFieldId: sourceField.id,
-          targetFieldId: bestTarget.id,
-        },
+      seedWriter.add(sourceField, bestTarget, {
+        transform: { type: 'direct', config: {} },
+        confidence: 0.45,
+        rationale: 'Seeded from AI fallback for uncovered fields',
+        status: 'suggested',
+        seedSource: 'agent',
       });
 
-      if (!existing) {
-        await prisma.fieldMapping.create({
-          data: {
-            id: randomUUID(),
-            entityMappingId: entityMapping.id,
-            sourceFieldId: sourceField.id,
-            targetFieldId: bestTarget.id,
-            transform: { type: 'direct', config: {} },
-            confidence: 0.45,
-            rationale: 'Seeded from AI fallback for uncovered fields',
-            status: 'suggested',
-            seedSource: 'agent',
-          },
-        });
-      }
-
       coveredSourceFieldIds.add(sourceField.id);
       coveredTargetFieldIds.add(bestTarget.id);
       summary.fromAgent += 1;
     }
 
+    await seedWriter.flush();
     summary.total = summary.fromDerived + summary.fromCanonical + summary.fromAgent;
 
     res.json({ summary });
@@ -0,0 +1,109 @@
+/**
+ * ConnectorMetadataCache — short-lived cache for connector metadata reads.
+ *
+ * Object lists and schema previews change rarely, but the connector routes
+ * re-authenticate and re-describe the remote system on every call. Results are
+ * cached for a short TTL keyed by connector id, a hash of the credentials (so
+ * tenants never share entries and raw secrets never sit in the key) and the
+ * request shape. Concurrent misses for the same key share one in-flight load.
+ */
+
+import { createHash } from 'node:crypto';
+import type { ConnectorCredentials } from '../../../packages/connectors/IConnector.js';
+import { TtlCache } from '../utils/ttlCache.js';
+
+const DEFAULT_TTL_MS = 120_000;
+const DEFAULT_MAX_ENTRIES = 200;
+
+export interface ConnectorMetadataCacheOptions {
+  ttlMs?: number;
+  maxEntries?: number;
+  now?: () => number;
+}
+
+export class ConnectorMetadataCache {
+  private readonly cache: TtlCache<string, unknown>;
+  private readonly inFlight = new Map<string, Promise<unknown>>();
+
+  constructor(options: ConnectorMetadataCacheOptions = {}) {
+    this.cache = new TtlCache<string, unknown>({
+      ttlMs: options.ttlMs ?? DEFAULT_TTL_MS,
+      maxEntries: options.maxEntries ?? DEFAULT_MAX_ENTRIES,
+      now: options.now,
+    });
+  }
+
+  /**
+   * Build a cache key for a connector read.
+   * @param connectorId - registered connector id
+   * @param credentials - normalized credentials; hashed, never stored
+   * @param operation - read being cached (e.g. 'objects', 'schema')
+   * @param objectNames - optional object filter; order-insensitive
+   */
+  static key(
+    connectorId: string,
+    credentials: ConnectorCredentials,
+    operation: string,
+    objectNames?: string[],
+  ): string {
+    const credentialEntries = Object.keys(credentials)
+      .sort()
+      .map((name) => [name, credentials[name]]);
+    const objects = objectNames && objectNames.length > 0 ? [...new Set(objectNames)].sort() : [];
+    const digest = createHash('sha256')
+      .update(JSON.stringify([credentialEntries, objects]))
+      .digest('base64url');
+    return `${connectorId}:${operation}:${digest}`;
+  }
+
+  /**
+   * Return the cached value for `key`, or run `loader` and cache its result.
+   * Failed loads are not cached, nor are results `shouldCache` rejects (e.g. a
+   * mock fallback returned for live credentials).
+   */
+  async getOrLoad<T>(
+    key: string,
+    loader: () => Promise<T>,
+    shouldCache: (value: T) => boolean = () => true,
+  ): Promise<T> {
+    const cached = this.cache.get(key);
+    if (cached !== undefined) return cached as T;
+
+    const pending = this.inFlight.get(key);
+    if (pending) return pending as Promise<T>;
+
+    // A load superseded by delete() still settles for its own callers, but
+    // must not overwrite the cache or the newer in-flight entry.
+    const load: Promise<T> = loader()
+      .then((value) => {
+        if (this.inFlight.get(key) === load && shouldCache(value)) this.cache.set(key, value);
+        return value;
+      })
+      .finally(() => {
+        if (this.inFlight.get(key) === load) this.inFlight.delete(key);
+      });
+    this.inFlight.set(key, load);
+    return load;
+  }
+
+  /**
+   * Drop the cached value for `key` and detach any load in flight, so the next
+   * getOrLoad runs its loader (and whatever refresh side effects it carries)
+   * instead of joining a load that may be serving stale describes.
+   */
+  delete(key: string): void {
+    this.cache.delete(key);
+    this.inFlight.delete(key);
+  }
+
+  clear(): void {
+    this.cache.clear();
+  }
+}
+
+/**
+ * Singleton instance used by the connector routes.
+ */
+export const defaultMetadataCache = new ConnectorMetadataCache({
+  ttlMs: Number(process.env.CONNECTOR_METADATA_CACHE_TTL_MS) || DEFAULT_TTL_MS,
+});
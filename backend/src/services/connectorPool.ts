@@ -0,0 +1,101 @@
+/**
+ * ConnectorPool — reuse connected connector instances across requests.
+ *
+ * Every connector route used to instantiate a connector and run connect()
+ * (an OAuth/SOAP login for live systems) before doing a single read. The pool
+ * keeps connected instances keyed by connector id + credential hash so that
+ * handshake is paid once per idle window. Instances idle longer than the TTL
+ * are dropped. An instance whose operation throws is evicted so the next
+ * request reconnects. So is one that was given credentials but is not live:
+ * connectors swallow login and session failures and fall back to mock mode,
+ * and pooling that instance would pin the fallback until restart.
+ */
+
+import { defaultRegistry } from '../../../packages/connectors/ConnectorRegistry.js';
+import type { ConnectorCredentials, IConnector } from '../../../packages/connectors/IConnector.js';
+import { TtlCache } from '../utils/ttlCache.js';
+import { ConnectorMetadataCache } from './connectorMetadataCache.js';
+
+const DEFAULT_IDLE_TTL_MS = 5 * 60_000;
+const DEFAULT_MAX_CONNECTIONS = 50;
+
+export interface ConnectorPoolOptions {
+  idleTtlMs?: number;
+  maxConnections?: number;
+  now?: () => number;
+  createConnector?: (connectorId: string, credentials: ConnectorCredentials) => IConnector;
+}
+
+function hasCredentialValues(credentials: ConnectorCredentials): boolean {
+  return Object.values(credentials).some((value) => typeof value === 'string' && value.trim().length > 0);
+}
+
+async function isLive(connector: IConnector): Promise<boolean> {
+  return (await connector.getSystemInfo()).mode === 'live';
+}
+
+export class ConnectorPool {
+  private readonly connections: TtlCache<string, Promise<IConnector>>;
+  private readonly createConnector: (connectorId: string, credentials: ConnectorCredentials) => IConnector;
+
+  constructor(options: ConnectorPoolOptions = {}) {
+    this.connections = new TtlCache<string, Promise<IConnector>>({
+      ttlMs: options.idleTtlMs ?? DEFAULT_IDLE_TTL_MS,
+      maxEntries: options.maxConnections ?? DEFAULT_MAX_CONNECTIONS,
+      now: options.now,
+    });
+    this.createConnector = options.createConnector
+      ?? ((connectorId, credentials) => defaultRegistry.instantiate(connectorId, credentials));
+  }
+
+  get size(): number {
+    return this.connections.size;
+  }
+
+  /**
+   * Run `fn` with a connected connector, reusing a pooled instance when one
+   * exists for the same connector id and credentials.
+   * @param connectorId - registered connector id
+   * @param credentials - normalized credentials passed to connect()
+   * @param fn - operation to run against the connected instance
+   */
+  async withConnector<T>(
+    connectorId: string,
+    credentials: ConnectorCredentials,
+    fn: (connector: IConnector) => Promise<T>,
+  ): Promise<T> {
+    const key = ConnectorMetadataCache.key(connectorId, credentials, 'connection');
+    let pending = this.connections.get(key);
+    if (!pending) {
+      const connector = this.createConnector(connectorId, credentials);
+      pending = connector.connect(credentials).then(() => connector);
+    }
+    // Re-set on every use so the TTL measures idle time, not age.
+    this.connections.set(key, pending);
+
+    // With credentials, a connector still in mock mode means connect() or the
+    // operation swallowed a login/session failure; don't hand it out again.
+    const requiresLive = hasCredentialValues(credentials);
+    try {
+      const connector = await pending;
+      if (requiresLive && !(await isLive(connector))) this.connections.delete(key);
+      const result = await fn(connector);
+      if (requiresLive && !(await isLive(connector))) this.connections.delete(key);
+      return result;
+    } catch (error) {
+      this.connections.delete(key);
+      throw error;
+    }
+  }
+
+  clear(): void {
+    this.connections.clear();
+  }
+}
+
+/**
+ * Singleton instance used by the connector routes.
+ */
+export const defaultConnectorPool = new ConnectorPool({
+  idleTtlMs: Number(process.env.CONNECTOR_IDLE_TTL_MS) || DEFAULT_IDLE_TTL_MS,
+});
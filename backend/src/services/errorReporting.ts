@@ -90,14 +90,27 @@ function toPlainObject(value: unknown): Record<string, unknown> | undefined {
   }
 }
 
-function truncateObject(value: Record<string, unknown> | undefined, maxBytes: number): Record<string, unknown> | undefined {
-  if (!value) return undefined;
-  const raw = JSON.stringify(value);
-  if (raw.length <= maxBytes) return value;
-  return {
-    truncated: true,
-    preview: raw.slice(0, maxBytes),
-  };
+/**
+ * Copy `value` into a plain JSON object, or a truncated preview when its
+ * serialized form exceeds `maxBytes`. One JSON.stringify serves as both the
+ * size check and the source of the copy.
+ */
+function toTruncatedPlainObject(value: unknown, maxBytes: number): Record<string, unknown> | undefined {
+  if (!value || typeof value !== 'object' || Array.isArray(value)) return undefined;
+  try {
+    const raw = JSON.stringify(value);
+    if (raw.length > maxBytes) {
+      return {
+        truncated: true,
+        preview: raw.slice(0, maxBytes),
+      };
+    }
+    const cloned = JSON.parse(raw) as unknown;
+    if (!cloned || typeof cloned !== 'object' || Array.isArray(cloned)) return undefined;
+    return cloned as Record<string, unknown>;
+  } catch {
+    return undefined;
+  }
 }
 
 function isValidSeverity(value: unknown): value is ErrorSeverity {
@@ -158,6 +171,8 @@ export class ErrorReportingService {
   private readonly filePath: string;
   private readonly maxReports: number;
   private reports: ErrorReport[] = [];
+  private pendingWrite: Promise<void> | null = null;
+  private dirty = false;
 
   constructor(filePath = resolveFilePath(), maxReports = DEFAULT_MAX_REPORTS) {
     this.filePath = filePath;
@@ -174,8 +189,8 @@ export class ErrorReportingService {
       code: clampText(input.code || 'UNKNOWN', MAX_CODE_LENGTH) ?? 'UNKNOWN',
       message: clampText(input.message, MAX_MESSAGE_LENGTH) ?? 'Unknown error',
       stack: clampText(input.stack, MAX_STACK_LENGTH),
-      context: truncateObject(toPlainObject(input.context), MAX_CONTEXT_BYTES) as ErrorReportContext | undefined,
-      metadata: truncateObject(toPlainObject(input.metadata), MAX_METADATA_BYTES),
+      context: toTruncatedPlainObject(input.context, MAX_CONTEXT_BYTES) as ErrorReportContext | undefined,
+      metadata: toTruncatedPlainObject(input.metadata, MAX_METADATA_BYTES),
     };
 
     this.reports.unshift(report);
@@ -191,16 +206,20 @@ export class ErrorReportingService {
     const limit = Math.min(Math.max(query.limit ?? 100, 1), 1000);
     const sinceMs = query.sinceIso ? Date.parse(query.sinceIso) : Number.NaN;
 
-    const filtered = this.reports.filter((report) => {
-      if (query.severity && report.severity !== query.severity) return false;
-      if (query.source && report.source !== query.source) return false;
-      if (query.projectId && report.context?.projectId !== query.projectId) return false;
-      if (query.requestId && report.context?.requestId !== query.requestId) return false;
-      if (!Number.isNaN(sinceMs) && Date.parse(report.timestamp) < sinceMs) return false;
-      return true;
-    });
+    // Reports are newest first: stop once the page is full instead of
+    // filtering the whole log and slicing the copy.
+    const matches: ErrorReport[] = [];
+    for (const report of this.reports) {
+      if (matches.length >= limit) break;
+      if (query.severity && report.severity !== query.severity) continue;
+      if (query.source && report.source !== query.source) continue;
+      if (query.projectId && report.context?.projectId !== query.projectId) continue;
+      if (query.requestId && report.context?.requestId !== query.requestId) continue;
+      if (!Number.isNaN(sinceMs) && Date.parse(report.timestamp) < sinceMs) continue;
+      matches.push(report);
+    }
 
-    return filtered.slice(0, limit);
+    return matches;
   }
 
   summary(windowHours = 24): ErrorReportSummary {
@@ -272,13 +291,57 @@ export class ErrorReportingService {
     }
   }
 
+  /**
+   * Resolve once every captured report has been written to disk.
+   */
+  async flush(): Promise<void> {
+    while (this.pendingWrite) {
+      await this.pendingWrite;
+    }
+  }
+
+  // Writes happen off the request path. Captures that arrive while a write is
+  // in flight are coalesced into the next write instead of each rewriting the
+  // whole file synchronously.
   private persist(): void {
+    this.dirty = true;
+    if (this.pendingWrite) return;
+    this.pendingWrite = this.writeReports();
+  }
+
+  private async writeReports(): Promise<void> {
     try {
-      fs.writeFileSync(this.filePath, JSON.stringify(this.reports, null, 2), 'utf8');
-    } catch {
-      // Best-effort persistence. Request flow should not fail if telemetry persistence fails.
+      while (this.dirty) {
+        this.dirty = false;
+        try {
+          await fs.promises.writeFile(this.filePath, JSON.stringify(this.reports), 'utf8');
+        } catch {
+          // Best-effort persistence. Request flow should not fail if telemetry persistence fails.
+        }
+      }
+    } finally {
+      this.pendingWrite = null;
     }
   }
 }
 
-export const errorReportingService = new ErrorReportingService();
+let defaultErrorReportingService: ErrorReportingService | null = null;
+
+/**
+ * Process-wide error reporting service. Created on first use rather than at
+ * import time, so importing this module does no disk I/O and picks up
+ * DATA_DIR / ERROR_REPORTS_FILE as configured when the first error is captured.
+ */
+export function getErrorReportingService(): ErrorReportingService {
+  if (!defaultErrorReportingService) {
+    defaultErrorReportingService = new ErrorReportingService();
+  }
+  return defaultErrorReportingService;
+}
+
+/**
+ * Wait for pending error report writes, if the service was ever used.
+ */
+export function flushErrorReportingService(): Promise<void> {
+  return defaultErrorReportingService?.flush() ?? Promise.resolve();
+}
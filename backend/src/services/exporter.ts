@@ -24,6 +24,7 @@ import type {
   System,
   ValidationReport,
 } from '../types.js';
+import { createHash } from 'node:crypto';
 import { isActiveFieldMapping } from '../utils/mappingStatus.js';
 import { buildRelationshipGraph } from './relationshipGraph.js';
 import { buildSchemaFingerprint } from './schemaFingerprint.js';
@@ -259,23 +260,102 @@ export function buildYamlExport(input: BuildInput): string {
 
 // ─── 3. CSV ───────────────────────────────────────────────────────────────────
 
+const CSV_HEADER = [
+  'project',
+  'sourceEntity',
+  'sourceField',
+  'sourceDataType',
+  'sourceRequired',
+  'targetEntity',
+  'targetField',
+  'targetDataType',
+  'transformType',
+  'transformConfig',
+  'confidence',
+  'status',
+  'rationale',
+];
+const CSV_HEADER_LINE = CSV_HEADER.join(',');
+
+/** Number of CSV rows emitted per chunk by streamCsvExport. */
+export const CSV_STREAM_BATCH_ROWS = 500;
+
 /**
  * Flat CSV export — one row per field mapping.
  * For business stakeholders who want to review mappings in Excel/Google Sheets.
  * Includes compliance notes and rationale in readable columns.
  */
 export function buildCsvExport(input: BuildInput): string {
+  let out = '';
+  for (const chunk of streamCsvExport(input)) out += chunk;
+  return out;
+}
+
+/**
+ * Incremental form of buildCsvExport — yields the header line first, then the
+ * rows in batches of `batchSize`. Concatenating every chunk produces exactly
+ * the buildCsvExport output, so callers can write chunks straight to a socket
+ * without holding the whole document in memory.
+ */
+export function* streamCsvExport(input: BuildInput, batchSize = CSV_STREAM_BATCH_ROWS): Generator<string> {
+  yield CSV_HEADER_LINE;
+
+  let batch: string[] = [];
+  for (const line of csvRowLines(input)) {
+    batch.push(line);
+    if (batch.length >= batchSize) {
+      yield '\n' + batch.join('\n');
+      batch = [];
+    }
+  }
+
+  if (batch.length > 0) yield '\n' + batch.join('\n');
+}
+
+/**
+ * Strong validator for the CSV export. Lets the streamed export answer
+ * If-None-Match with a 304. Hashes the values the rows are built from rather
+ * than rendering them (no escaping or per-row entity/field lookups), so a
+ * full export doesn't pay for CSV formatting twice. Entity names and field
+ * attributes are hashed once each, not once per row that references them.
+ */
+export function csvExportETag(input: BuildInput): string {
+  const entities = entityById(input);
+  const fields = fieldById(input);
+  const hash = createHash('sha1').update(`${CSV_HEADER_LINE}\0${input.project.id}\0${input.project.name}`);
+
+  const referencedFieldIds = new Set<string>();
+  for (const fm of input.fieldMappings) {
+    referencedFieldIds.add(fm.sourceFieldId).add(fm.targetFieldId);
+    hash.update(
+      `\n${fm.id}\0${fm.entityMappingId}\0${fm.sourceFieldId}\0${fm.targetFieldId}\0${fm.status}`
+      + `\0${fm.confidence}\0${fm.transform.type}\0${JSON.stringify(fm.transform.config)}\0${fm.rationale}`,
+    );
+  }
+  for (const em of input.entityMappings) {
+    const source = entities.get(em.sourceEntityId)?.name ?? '';
+    const target = entities.get(em.targetEntityId)?.name ?? '';
+    hash.update(`\n${em.id}\0${source}\0${target}`);
+  }
+  for (const fieldId of referencedFieldIds) {
+    const field = fields.get(fieldId);
+    if (field) hash.update(`\n${fieldId}\0${field.name}\0${field.dataType}\0${field.required ? 1 : 0}`);
+  }
+  return `"${hash.digest('base64url')}"`;
+}
+
+function* csvRowLines(input: BuildInput): Generator<string> {
   const entities = entityById(input);
   const fields = fieldById(input);
   const emById = entityMappingById(input);
 
-  const rows = input.fieldMappings.map((fm) => {
+  for (const fm of input.fieldMappings) {
     const em = emById.get(fm.entityMappingId);
     const srcEntity = em ? (entities.get(em.sourceEntityId)?.name ?? '') : '';
     const tgtEntity = em ? (entities.get(em.targetEntityId)?.name ?? '') : '';
     const sf = fields.get(fm.sourceFieldId);
     const tf = fields.get(fm.targetFieldId);
-    return [
+    yield csvLine([
       input.project.name,
       srcEntity,
       sf?.name ?? fm.sourceFieldId,
@@ -289,33 +369,25 @@ export function buildCsvExport(input: BuildInput): string {
       fm.confidence.toFixed(3),
       fm.status,
       fm.rationale.replace(/[\r\n]+/g, ' '),
-    ].map(csvEscape);
-  });
-
-  const header = [
-    'project',
-    'sourceEntity',
-    'sourceField',
-    'sourceDataType',
-    'sourceRequired',
-    'targetEntity',
-    'targetField',
-    'targetDataType',
-    'transformType',
-    'transformConfig',
-    'confidence',
-    'status',
-    'rationale',
-  ];
-
-  return [header, ...rows].map((r) => r.join(',')).join('\n');
+    ]);
+  }
 }
 
+const CSV_NEEDS_QUOTING = /[",\n]/;
+const CSV_QUOTE = /"/g;
+
 function csvEscape(value: string): string {
-  if (/[",\n]/.test(value)) return `"${value.replace(/"/g, '""')}"`;
+  if (CSV_NEEDS_QUOTING.test(value)) return `"${value.replace(CSV_QUOTE, '""')}"`;
   return value;
 }
 
+/** Escapes and joins one row in a single pass, without an intermediate mapped array. */
+function csvLine(values: string[]): string {
+  let line = csvEscape(values[0] ?? '');
+  for (let i = 1; i < values.length; i++) line += ',' + csvEscape(values[i]);
+  return line;
+}
+
 // ─── 4. MuleSoft DataWeave ────────────────────────────────────────────────────
 
 /**
@@ -778,10 +850,26 @@ export const EXPORT_FORMATS: Record<ExportFormat, { label: string; mime: string;
   },
 };
 
+const UNSAFE_FILENAME_CHARS = /[^a-z0-9_-]/gi;
+const UNSAFE_DISPOSITION_CHARS = /["\\\r\n]/g;
+
+/** Download filename for a project export, e.g. `automapper_my_project_csv.csv`. */
+export function exportFilename(format: ExportFormat, input: BuildInput): string {
+  const safeName = input.project.name.replace(UNSAFE_FILENAME_CHARS, '_').toLowerCase();
+  return `automapper_${safeName}_${format}.${EXPORT_FORMATS[format].ext}`;
+}
+
+/**
+ * Content-Disposition value for an export download. Every export response goes
+ * through here so the quoting rules live in one place.
+ */
+export function exportContentDisposition(filename: string): string {
+  return `attachment; filename="${filename.replace(UNSAFE_DISPOSITION_CHARS, '_')}"`;
+}
+
 export function buildExport(format: ExportFormat, input: BuildInput): { content: string | object; mime: string; filename: string } {
   const meta = EXPORT_FORMATS[format];
-  const safeName = input.project.name.replace(/[^a-z0-9_-]/gi, '_').toLowerCase();
-  const filename = `automapper_${safeName}_${format}.${meta.ext}`;
+  const filename = exportFilename(format, input);
 
   switch (format) {
     case 'json':
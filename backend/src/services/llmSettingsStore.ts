@@ -62,6 +62,12 @@ type PrismaClientLike = {
       success: boolean;
       error: string | null;
     }>>;
+    groupBy: (args: unknown) => Promise<Array<{
+      provider: string;
+      success: boolean;
+      _count: { _all: number };
+      _sum: { tokensUsed: number | null };
+    }>>;
   };
 };
 
@@ -152,7 +158,7 @@ function loadJsonArrayIfExists<T>(filePath: string): T[] | null {
 
 function persistJsonArray<T>(filePath: string, rows: T[]): void {
   ensureFile(filePath);
-  fs.writeFileSync(filePath, JSON.stringify(rows, null, 2), 'utf8');
+  fs.writeFileSync(filePath, JSON.stringify(rows), 'utf8');
 }
 
 function normalizeProvider(raw: unknown): RuntimeLLMProvider | undefined {
@@ -608,35 +614,55 @@ export class LLMSettingsStore {
       return events.map(toUsageEvent);
     }
 
-    return this.usageEvents
-      .filter((row) => row.userId === userId)
-      .slice(0, bounded);
+    const events: LLMUsageEvent[] = [];
+    for (const row of this.usageEvents) {
+      if (events.length >= bounded) break;
+      if (row.userId === userId) events.push(row);
+    }
+    return events;
   }
 
   async summarizeUsage(userId: string, windowHours = 24): Promise<LLMUsageSummary> {
     const boundedHours = Math.max(1, Math.min(windowHours, 24 * 30));
     const cutoff = Date.now() - boundedHours * 3_600_000;
-    const recent = this.prismaClient
-      ? (await this.prismaClient.lLMUsageEvent.findMany({
+
+    // Let the database count and sum per (provider, success) rather than
+    // loading up to 30 days of usage rows just to tally them here.
+    const groups = this.prismaClient
+      ? (await this.prismaClient.lLMUsageEvent.groupBy({
+          by: ['provider', 'success'],
           where: { userId, createdAt: { gte: new Date(cutoff) } },
-          orderBy: { createdAt: 'desc' },
-        })).map(toUsageEvent)
-      : this.usageEvents.filter((row) => row.userId === userId && Date.parse(row.createdAt) >= cutoff);
+          _count: { _all: true },
+          _sum: { tokensUsed: true },
+        })).map((group) => ({
+          provider: group.provider,
+          success: group.success,
+          calls: group._count._all,
+          tokens: group._sum.tokensUsed ?? 0,
+        }))
+      : this.usageEvents
+          .filter((row) => row.userId === userId && Date.parse(row.createdAt) >= cutoff)
+          .map((row) => ({
+            provider: row.provider,
+            success: row.success,
+            calls: 1,
+            tokens: row.tokensUsed ?? 0,
+          }));
 
     const callsByProvider: Record<string, number> = {};
     let successfulCalls = 0;
     let failedCalls = 0;
     let totalTokens = 0;
 
-    for (const event of recent) {
-      callsByProvider[event.provider] = (callsByProvider[event.provider] ?? 0) + 1;
-      if (event.success) successfulCalls += 1;
-      else failedCalls += 1;
-      totalTokens += event.tokensUsed ?? 0;
+    for (const group of groups) {
+      callsByProvider[group.provider] = (callsByProvider[group.provider] ?? 0) + group.calls;
+      if (group.success) successfulCalls += group.calls;
+      else failedCalls += group.calls;
+      totalTokens += group.tokens;
     }
 
     return {
-      totalCalls: recent.length,
+      totalCalls: successfulCalls + failedCalls,
       successfulCalls,
       failedCalls,
       totalTokens,
@@ -646,4 +672,17 @@ export class LLMSettingsStore {
   }
 }
 
-export const llmSettingsStore = new LLMSettingsStore();
+let defaultLLMSettingsStore: LLMSettingsStore | null = null;
+
+/**
+ * Process-wide settings store. Created on first use rather than at import
+ * time: the constructor reads the file-mode JSON logs synchronously (or starts
+ * the legacy-file seed in database mode), which importing a route module
+ * should not trigger.
+ */
+export function getLLMSettingsStore(): LLMSettingsStore {
+  if (!defaultLLMSettingsStore) {
+    defaultLLMSettingsStore = new LLMSettingsStore();
+  }
+  return defaultLLMSettingsStore;
+}
@@ -1,4 +1,6 @@
+import { createHash } from 'node:crypto';
 import * as XLSX from 'xlsx';
+import { TtlCache } from '../utils/ttlCache.js';
 
 export interface WorkbookFieldMappingCandidate {
   sheetName: string;
@@ -19,7 +21,24 @@ const HEADER_SCAN_LIMIT = 30;
 const SUMMARY_SHEET_PREFIXES = ['total fields', 'duplicated', 'unique'];
 const IGNORE_SOURCE_PREFIXES = ['not in', 'internal', 'not in use', 'n/a'];
 
+// Re-uploads of the same workbook (retry, or another project in the same org)
+// skip the XLSX parse; keyed by content hash so edits always re-parse.
+const parsedWorkbookCache = new TtlCache<string, WorkbookFieldMappingCandidate[]>({
+  ttlMs: 5 * 60 * 1000,
+  maxEntries: 32,
+});
+
 export function parseWorkbookFieldMappings(buffer: Buffer): WorkbookFieldMappingCandidate[] {
+  const contentHash = createHash('sha256').update(buffer).digest('hex');
+  const cached = parsedWorkbookCache.get(contentHash);
+  if (cached) return cached.map((candidate) => ({ ...candidate }));
+
+  const parsed = parseWorkbook(buffer);
+  parsedWorkbookCache.set(contentHash, parsed.map((candidate) => ({ ...candidate })));
+  return parsed;
+}
+
+function parseWorkbook(buffer: Buffer): WorkbookFieldMappingCandidate[] {
   const workbook = XLSX.read(buffer, { type: 'buffer', dense: true });
   const out: WorkbookFieldMappingCandidate[] = [];
   const seen = new Set<string>();
@@ -101,9 +101,19 @@ function rebuildCache(filePath: string): CachedDecisionState {
   };
 }
 
+function statReviewDecisionFile(filePath: string): fs.Stats {
+  // Hot path: getReviewDecisionAdjustment runs once per candidate pair, so only
+  // fall back to mkdir/exists/write when the file is actually missing.
+  try {
+    return fs.statSync(filePath);
+  } catch {
+    ensureReviewDecisionFile(filePath);
+    return fs.statSync(filePath);
+  }
+}
+
 function ensureLoaded(filePath = resolveReviewDecisionPath()): CachedDecisionState {
-  ensureReviewDecisionFile(filePath);
-  const stat = fs.statSync(filePath);
+  const stat = statReviewDecisionFile(filePath);
   if (!cached || cached.path !== filePath || cached.mtimeMs !== stat.mtimeMs) {
     cached = rebuildCache(filePath);
   }
@@ -156,9 +166,25 @@ export function appendReviewDecision(
   record: ReviewDecisionRecord,
   filePath = resolveReviewDecisionPath(),
 ): ReviewDecisionRecord {
-  ensureReviewDecisionFile(filePath);
+  const before = statReviewDecisionFile(filePath);
   fs.appendFileSync(filePath, `${JSON.stringify(record)}\n`, 'utf8');
-  cached = rebuildCache(filePath);
+
+  // Re-reading and re-parsing the whole log after every decision blocks the
+  // event loop for longer as the log grows. When the cache was current before
+  // this append and the record is the newest, extend it in place instead.
+  const last = cached?.decisions[cached.decisions.length - 1];
+  if (
+    cached
+    && cached.path === filePath
+    && cached.mtimeMs === before.mtimeMs
+    && (!last || last.ts.localeCompare(record.ts) <= 0)
+  ) {
+    cached.decisions.push(record);
+    cached.latestByPair.set(pairKey(record.sourceFieldId, record.targetFieldId), record);
+    cached.mtimeMs = fs.statSync(filePath).mtimeMs;
+  } else {
+    cached = rebuildCache(filePath);
+  }
   return record;
 }
 
@@ -65,14 +65,17 @@ function resolveEntityName(field: Field, entitiesById: Map<string, Entity>): str
   return entitiesById.get(field.entityId)?.name ?? field.entityId;
 }
 
-export function computeSchemaFingerprint(fields: Field[], entityIds: Set<string>): string {
-  const sorted = fields
-    .filter((field) => entityIds.has(field.entityId))
+function hashScopedFields(scopedFields: Field[]): string {
+  const sorted = scopedFields
     .sort((left, right) => left.id.localeCompare(right.id))
     .map((field) => `${field.id}:${field.dataType}:${field.required ?? false}`);
   return createHash('sha256').update(sorted.join('|')).digest('hex');
 }
 
+export function computeSchemaFingerprint(fields: Field[], entityIds: Set<string>): string {
+  return hashScopedFields(fields.filter((field) => entityIds.has(field.entityId)));
+}
+
 export function buildFieldsSnapshot(
   project: MappingProject,
   entities: Entity[],
@@ -92,11 +95,15 @@ export function buildSchemaFingerprint(
   computedAt = new Date().toISOString(),
 ): SchemaFingerprint {
   const scopedEntityIds = getScopedEntityIds(project, entities);
-  const sourceFields = fields.filter((field) => scopedEntityIds.source.has(field.entityId));
-  const targetFields = fields.filter((field) => scopedEntityIds.target.has(field.entityId));
+  const sourceFields: Field[] = [];
+  const targetFields: Field[] = [];
+  for (const field of fields) {
+    if (scopedEntityIds.source.has(field.entityId)) sourceFields.push(field);
+    if (scopedEntityIds.target.has(field.entityId)) targetFields.push(field);
+  }
   return {
-    sourceHash: computeSchemaFingerprint(fields, scopedEntityIds.source),
-    targetHash: computeSchemaFingerprint(fields, scopedEntityIds.target),
+    sourceHash: hashScopedFields(sourceFields),
+    targetHash: hashScopedFields(targetFields),
     computedAt,
     fieldCount: {
       source: sourceFields.length,
@@ -105,6 +112,20 @@ export function buildSchemaFingerprint(
   };
 }
 
+/**
+ * Cheap pre-check for drift detection: true when either side's fingerprint
+ * differs from the latest export. Callers can skip building a field snapshot
+ * (and the per-field diff) entirely when this is false.
+ */
+export function hasSchemaChanged(
+  latestVersion: StoredExportVersionRecord | undefined,
+  currentFingerprint: SchemaFingerprint,
+): boolean {
+  if (!latestVersion) return false;
+  return latestVersion.schemaFingerprint.sourceHash !== currentFingerprint.sourceHash
+    || latestVersion.schemaFingerprint.targetHash !== currentFingerprint.targetHash;
+}
+
 function classifyScopeDrift(
   scope: 'source' | 'target',
   previousFields: Field[],
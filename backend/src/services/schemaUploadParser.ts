@@ -60,17 +60,31 @@ function parseUploadedCsv(content: string, filename: string, systemId: string):
     throw new Error('CSV must include a header row and at least one data row');
   }
 
-  const headers = splitCsvLine(lines[0]);
-  const records: JsonRecord[] = lines.slice(1).map((line) => {
-    const cols = splitCsvLine(line);
-    const rec: JsonRecord = {};
-    for (let i = 0; i < headers.length; i += 1) {
-      rec[sanitizeName(headers[i] || `Field${i + 1}`)] = cols[i] ?? '';
-    }
-    return rec;
+  // Scan column-wise: values go straight into per-field buckets instead of
+  // materializing one record object per CSV row. Header names are sanitized
+  // once; a repeated header keeps its last column, as record keys did. Blank
+  // headers get a positional name; anything still sanitizing to '' is skipped.
+  const columnByField = new Map<string, number>();
+  splitCsvLine(lines[0]).forEach((header, i) => {
+    const fieldName = sanitizeName(header || `Field${i + 1}`);
+    if (fieldName) columnByField.set(fieldName, i);
   });
 
-  return inferSchemaFromRecords(entityNameFromFilename(filename), records, systemId);
+  const valueByField = new Map<string, unknown[]>();
+  for (const fieldName of columnByField.keys()) valueByField.set(fieldName, []);
+  for (let row = 1; row < lines.length; row += 1) {
+    const cols = splitCsvLine(lines[row]);
+    for (const [fieldName, column] of columnByField) {
+      const value = cols[column];
+      if (value) valueByField.get(fieldName)?.push(value);
+    }
+  }
+
+  const entity = createEntity(entityNameFromFilename(filename), systemId);
+  const fields = inferFieldsFromValues(valueByField, lines.length - 1, entity.id, {
+    preferLosNameInference: shouldPreferLosNameInferenceForKeys(columnByField.keys()),
+  });
+  return { entities: [entity], fields, relationships: [] };
 }
 
 function parseUploadedXml(content: string, filename: string, systemId: string): ParsedSchema {
@@ -162,10 +176,15 @@ function inferFieldsForEntity(
   options: { preferLosNameInference?: boolean } = {},
 ): Field[] {
   const valueByField = new Map<string, unknown[]>();
+  const sanitizedKeys = new Map<string, string>();
 
   for (const record of records) {
     for (const [rawKey, rawValue] of Object.entries(record)) {
-      const fieldName = sanitizeName(rawKey);
+      let fieldName = sanitizedKeys.get(rawKey);
+      if (fieldName === undefined) {
+        fieldName = sanitizeName(rawKey);
+        sanitizedKeys.set(rawKey, fieldName);
+      }
       if (!fieldName) continue;
       const bucket = valueByField.get(fieldName) ?? [];
       if (rawValue !== null && rawValue !== undefined && rawValue !== '') {
@@ -175,6 +194,15 @@ function inferFieldsForEntity(
     }
   }
 
+  return inferFieldsFromValues(valueByField, records.length, entityId, options);
+}
+
+function inferFieldsFromValues(
+  valueByField: Map<string, unknown[]>,
+  recordCount: number,
+  entityId: string,
+  options: { preferLosNameInference?: boolean } = {},
+): Field[] {
   if (valueByField.size === 0) {
     throw new Error('No field columns found in uploaded records');
   }
@@ -194,7 +222,7 @@ function inferFieldsForEntity(
       name,
       label: name,
       dataType: shouldUseLosType ? (inferredByLosName as DataType) : inferredByValues,
-      required: values.length === records.length,
+      required: values.length === recordCount,
       isKey: name.toLowerCase() === 'id' || name.toLowerCase().endsWith('id'),
     });
   }
@@ -242,11 +270,17 @@ function inferDataTypeFromLosName(fieldName: string): DataType | null {
 
 function shouldPreferLosNameInference(records: JsonRecord[]): boolean {
   if (!records.length) return false;
-  const keys = new Set<string>();
+  const rawKeys = new Set<string>();
   for (const record of records) {
-    for (const rawKey of Object.keys(record)) {
-      if (rawKey && rawKey.trim()) keys.add(rawKey.trim());
-    }
+    for (const rawKey of Object.keys(record)) rawKeys.add(rawKey);
+  }
+  return shouldPreferLosNameInferenceForKeys(rawKeys);
+}
+
+function shouldPreferLosNameInferenceForKeys(rawKeys: Iterable<string>): boolean {
+  const keys = new Set<string>();
+  for (const rawKey of rawKeys) {
+    if (rawKey && rawKey.trim()) keys.add(rawKey.trim());
   }
   if (!keys.size) return false;
 
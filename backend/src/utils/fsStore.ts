@@ -62,7 +62,9 @@ export class FsStore {
   }
 
   private persist() {
-    fs.writeFileSync(this.dbPath, JSON.stringify(this.state, null, 2), 'utf8');
+    // Rewritten on every mutation; compact JSON keeps the stringify and write
+    // cost proportional to the data rather than to indentation depth.
+    fs.writeFileSync(this.dbPath, JSON.stringify(this.state), 'utf8');
   }
 
   private versionsDir(projectId: string): string {
@@ -103,6 +105,25 @@ export class FsStore {
     return this.state;
   }
 
+  /** Project-scoped view of the state; mirrors DbStore.getProjectState. */
+  getProjectState(project: MappingProject): AppState {
+    const systemIds = new Set([project.sourceSystemId, project.targetSystemId]);
+    const entities = this.state.entities.filter((entity) => systemIds.has(entity.systemId));
+    const entityIds = new Set(entities.map((entity) => entity.id));
+    const entityMappings = this.state.entityMappings.filter((mapping) => mapping.projectId === project.id);
+    const entityMappingIds = new Set(entityMappings.map((mapping) => mapping.id));
+    return {
+      systems: this.state.systems.filter((system) => systemIds.has(system.id)),
+      entities,
+      fields: this.state.fields.filter((field) => entityIds.has(field.entityId)),
+      relationships: this.state.relationships.filter((relationship) => entityIds.has(relationship.fromEntityId)),
+      projects: [project],
+      entityMappings,
+      fieldMappings: this.state.fieldMappings.filter((mapping) => entityMappingIds.has(mapping.entityMappingId)),
+      auditEntries: [],
+    };
+  }
+
   appendAuditEntry(entry: AuditEntry) {
     this.state.auditEntries.push(entry);
     this.persist();
@@ -356,25 +377,19 @@ export class FsStore {
     const filePath = path.join(dir, `${timestamp}-v${versionNumber}.automapper.json`);
     fs.writeFileSync(filePath, JSON.stringify(stored, null, 2), 'utf8');
 
+    // Parse each version file once and remember its path, so pruning does not
+    // re-read and re-parse the whole directory for every file it removes.
     const files = fs.readdirSync(dir)
       .map((name) => path.join(dir, name))
       .filter((candidate) => candidate.endsWith('.automapper.json'))
-      .map((candidate) => this.readStoredExportVersion(candidate))
-      .filter((candidate): candidate is StoredExportVersionRecord => Boolean(candidate))
-      .sort((left, right) => left.version - right.version);
+      .map((candidate) => ({ filePath: candidate, version: this.readStoredExportVersion(candidate) }))
+      .filter((candidate): candidate is { filePath: string; version: StoredExportVersionRecord } => Boolean(candidate.version))
+      .sort((left, right) => left.version.version - right.version.version);
 
     while (files.length > 10) {
       const oldest = files.shift();
       if (!oldest) break;
-      const oldestFile = fs.readdirSync(dir)
-        .map((name) => path.join(dir, name))
-        .find((candidate) => {
-          const parsed = this.readStoredExportVersion(candidate);
-          return parsed?.id === oldest.id;
-        });
-      if (oldestFile && fs.existsSync(oldestFile)) {
-        fs.rmSync(oldestFile, { force: true });
-      }
+      fs.rmSync(oldest.filePath, { force: true });
     }
 
     return this.toExportVersionRecord(stored);
@@ -449,6 +464,22 @@ export class FsStore {
     return mapping;
   }
 
+  /** Apply one status/confidence patch to many field mappings with a single persist. */
+  patchFieldMappings(
+    fieldMappingIds: string[],
+    patch: Partial<Pick<FieldMapping, 'status' | 'confidence'>>,
+  ): string[] {
+    const ids = new Set(fieldMappingIds);
+    const updated: string[] = [];
+    for (const mapping of this.state.fieldMappings) {
+      if (!ids.has(mapping.id)) continue;
+      Object.assign(mapping, patch);
+      updated.push(mapping.id);
+    }
+    if (updated.length) this.persist();
+    return updated;
+  }
+
   patchField(
     fieldId: string,
     patch: Partial<Pick<Field, 'required' | 'complianceTags'>>,
@@ -464,6 +495,17 @@ export class FsStore {
     this.persist();
     return field;
   }
+
+  addFieldComplianceTag(fieldId: string, tag: string): Field | undefined {
+    const field = this.state.fields.find((candidate) => candidate.id === fieldId);
+    if (!field) return undefined;
+    const tags = field.complianceTags ?? [];
+    if (!tags.includes(tag)) {
+      field.complianceTags = [...tags, tag];
+      this.persist();
+    }
+    return field;
+  }
 }
 
 function inferSystemType(name: string, fieldNames: string[] = []): System['type'] {
@@ -1,7 +1,7 @@
 import { randomUUID } from 'node:crypto';
 import type { Request, Response } from 'express';
 import {
-  errorReportingService,
+  getErrorReportingService,
   type ErrorReportContext,
   type ErrorSeverity,
   type ErrorSource,
@@ -63,7 +63,7 @@ export function captureException(
   } = {},
 ): string {
   const normalized = normalizeError(error);
-  const report = errorReportingService.capture({
+  const report = getErrorReportingService().capture({
     source,
     severity: options.severity ?? 'error',
     code: options.code ?? 'UNHANDLED_EXCEPTION',
@@ -85,7 +85,7 @@ export function sendHttpError(
   source: ErrorSource = 'api',
 ): void {
   const requestId = resolveRequestId(req, res);
-  const report = errorReportingService.capture({
+  const report = getErrorReportingService().capture({
     severity: statusToSeverity(status),
     source,
     code,
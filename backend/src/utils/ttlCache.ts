@@ -0,0 +1,64 @@
+/**
+ * TtlCache — small in-process cache with per-entry expiry and a size bound.
+ *
+ * Entries expire `ttlMs` after they are written. When the cache is full the
+ * least recently used entry is evicted (Map insertion order doubles as the
+ * recency list: reads re-insert the entry at the end).
+ */
+export interface TtlCacheOptions {
+  ttlMs: number;
+  maxEntries: number;
+  now?: () => number;
+}
+
+interface TtlCacheEntry<V> {
+  value: V;
+  expiresAt: number;
+}
+
+export class TtlCache<K, V> {
+  private readonly entries = new Map<K, TtlCacheEntry<V>>();
+  private readonly ttlMs: number;
+  private readonly maxEntries: number;
+  private readonly now: () => number;
+
+  constructor(options: TtlCacheOptions) {
+    this.ttlMs = options.ttlMs;
+    this.maxEntries = Math.max(1, options.maxEntries);
+    this.now = options.now ?? Date.now;
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+    if (entry.expiresAt <= this.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key: K, value: V): void {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: this.now() + this.ttlMs });
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next();
+      if (oldest.done) break;
+      this.entries.delete(oldest.value);
+    }
+  }
+
+  delete(key: K): boolean {
+    return this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
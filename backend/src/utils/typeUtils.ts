@@ -38,15 +38,20 @@ export function normalizeODataType(input: string): DataType {
   return ODATA_TO_INTERNAL[input] ?? 'unknown';
 }
 
-export function typeCompatibilityScore(source: DataType, target: DataType): number {
-  if (source === target) return 1;
-  const groups: DataType[][] = [
+// Types in the same group are interchangeable enough to score 0.75. Built once
+// as type → group index because this runs for every candidate field pair.
+const TYPE_COMPATIBILITY_GROUP = new Map<DataType, number>(
+  ([
     ['string', 'text', 'email', 'phone', 'id', 'picklist'],
     ['number', 'integer', 'decimal'],
     ['date', 'datetime', 'time'],
-  ];
-  const sameGroup = groups.some((g) => g.includes(source) && g.includes(target));
-  if (sameGroup) return 0.75;
+  ] as DataType[][]).flatMap((group, index) => group.map((type): [DataType, number] => [type, index])),
+);
+
+export function typeCompatibilityScore(source: DataType, target: DataType): number {
+  if (source === target) return 1;
+  const sourceGroup = TYPE_COMPATIBILITY_GROUP.get(source);
+  if (sourceGroup !== undefined && sourceGroup === TYPE_COMPATIBILITY_GROUP.get(target)) return 0.75;
   if (source === 'unknown' || target === 'unknown') return 0.45;
   return 0.2;
 }
@@ -23,6 +23,14 @@ export interface ConnectorMeta {
 
 export type ConnectorFactory = (credentials?: ConnectorCredentials) => IConnector;
 
+/** Default connector id per SystemType; built once rather than per lookup. */
+const SYSTEM_TYPE_CONNECTOR_IDS: Readonly<Record<string, string>> = {
+  salesforce: 'salesforce',
+  sap: 'sap',
+  jackhenry: 'jackhenry-silverlake', // default JH connector
+  generic: 'sap',
+};
+
 /**
  * ConnectorRegistry — maps connector IDs to factory functions and metadata.
  *
@@ -74,13 +82,7 @@ export class ConnectorRegistry {
 
   /** Map a SystemType to the primary connector ID for that type. */
   resolveSystemType(systemType: SystemType | string): string | undefined {
-    const typeMap: Record<string, string> = {
-      salesforce: 'salesforce',
-      sap: 'sap',
-      jackhenry: 'jackhenry-silverlake', // default JH connector
-      generic: 'sap',
-    };
-    return typeMap[systemType];
+    return SYSTEM_TYPE_CONNECTOR_IDS[systemType];
   }
 }
 
@@ -122,4 +122,10 @@ export interface IConnector {
    * Return human-readable metadata about this connector and the connected system.
    */
   getSystemInfo(): Promise<ConnectorSystemInfo>;
+
+  /**
+   * Drop any metadata (object lists, describes) the connector caches for its
+   * current connection so the next read goes to the remote system.
+   */
+  clearMetadataCache?(): void;
 }
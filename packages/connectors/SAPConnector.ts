@@ -25,6 +25,17 @@ import type {
 import type { Entity, Relationship } from './types.js';
 import { normalizeODataType } from './utils/typeUtils.js';
 
+// Checked for every property in fetchSchema(), so built once here.
+const SAP_FINANCIAL_OBJECTS = new Set(['GLAccount', 'CostCenter', 'ProfitCenter']);
+const SAP_FINANCIAL_FIELD_MARKERS = ['Amount', 'Balance', 'Debit', 'Credit', 'Rate', 'Value', 'Cost'];
+
+interface SAPEntityTypeIndex {
+  /** EntityType names in listObjects() order. */
+  names: string[];
+  /** Properties per EntityType; types declared without properties are omitted. */
+  properties: Map<string, Array<{ Name: string; Type: string }>>;
+}
+
 interface SAPCredentials {
   baseUrl?: string;
   username?: string;
@@ -36,6 +47,11 @@ interface SAPCredentials {
 export class SAPConnector implements IConnector {
   private mode: 'live' | 'mock' = 'mock';
   private credentials: SAPCredentials = {};
+  /** $metadata XML from connect(); listObjects/fetchSchema reuse it instead of re-fetching. */
+  private metadataXml: string | null = null;
+  private parsedMetadata: ReturnType<XMLParser['parse']> | null = null;
+  /** EntityType lookup built once from parsedMetadata and shared by reads. */
+  private entityTypeIndex: SAPEntityTypeIndex | null = null;
 
   constructor(credentials?: ConnectorCredentials) {
     if (credentials) {
@@ -66,8 +82,10 @@ export class SAPConnector implements IConnector {
     }
 
     try {
-      // Test connection to $metadata endpoint
-      await this.fetchMetadata(creds);
+      // Test connection to $metadata endpoint and keep the document for reads
+      this.metadataXml = await this.fetchMetadata(creds);
+      this.parsedMetadata = null;
+      this.entityTypeIndex = null;
       this.mode = 'live';
       this.credentials = creds;
     } catch {
@@ -77,37 +95,10 @@ export class SAPConnector implements IConnector {
 
   async listObjects(): Promise<string[]> {
     if (this.mode === 'live' && this.credentials.baseUrl) {
-      try {
-        const metadata = await this.fetchMetadata(this.credentials);
-        const parser = new XMLParser();
-        const parsed = parser.parse(metadata);
-
-        // Navigate to EntityType definitions
-        const schema = parsed['edmx:Edmx']?.['edmx:DataServices']?.Schema;
-        if (!schema) {
-          return ['BusinessPartner', 'Customer', 'Supplier', 'GLAccount', 'CostCenter'];
-        }
-
-        // Handle single or multiple Schema elements
-        const schemas = Array.isArray(schema) ? schema : [schema];
-        const entityTypes = new Set<string>();
-
-        for (const s of schemas) {
-          const entities = s.EntityType;
-          if (entities) {
-            const entityArray = Array.isArray(entities) ? entities : [entities];
-            for (const entity of entityArray) {
-              if (entity.Name) {
-                entityTypes.add(entity.Name);
-              }
-            }
-          }
-        }
-
-        return Array.from(entityTypes).sort();
-      } catch {
-        return ['BusinessPartner', 'Customer', 'Supplier', 'GLAccount', 'CostCenter'];
-      }
+      // A failed $metadata fetch throws rather than returning the default list,
+      // so a live session is never reported with mock objects.
+      const index = await this.loadEntityTypeIndex();
+      if (index) return [...index.names];
     }
 
     return ['BusinessPartner', 'Customer', 'Supplier', 'GLAccount', 'CostCenter'];
@@ -123,37 +114,12 @@ export class SAPConnector implements IConnector {
     const relationships: Relationship[] = [];
 
     if (this.mode === 'live' && this.credentials.baseUrl) {
-      try {
-        const metadata = await this.fetchMetadata(this.credentials);
-        const parser = new XMLParser();
-        const parsed = parser.parse(metadata);
-
-        const schema = parsed['edmx:Edmx']?.['edmx:DataServices']?.Schema;
-        if (!schema) {
-          return buildMockSAPSchema(objects);
-        }
-
-        // Handle single or multiple Schema elements
-        const schemas = Array.isArray(schema) ? schema : [schema];
-        const entityTypeMap = new Map<string, { properties: Array<{ Name: string; Type: string }> }>();
-
-        for (const s of schemas) {
-          const entityTypes = s.EntityType;
-          if (entityTypes) {
-            const entityArray = Array.isArray(entityTypes) ? entityTypes : [entityTypes];
-            for (const et of entityArray) {
-              if (et.Name && et.Property) {
-                const props = Array.isArray(et.Property) ? et.Property : [et.Property];
-                entityTypeMap.set(et.Name, { properties: props });
-              }
-            }
-          }
-        }
-
+      const index = await this.tryLoadEntityTypeIndex();
+      if (index) {
         // Build entities and fields from requested objects
         for (const objectName of objects) {
-          const entityDef = entityTypeMap.get(objectName);
-          if (!entityDef) continue;
+          const properties = index.properties.get(objectName);
+          if (!properties) continue;
 
           const entityId = uuidv4();
           entities.push({
@@ -164,7 +130,7 @@ export class SAPConnector implements IConnector {
             description: `SAP ${objectName} entity`,
           });
 
-          for (const prop of entityDef.properties) {
+          for (const prop of properties) {
             const field: ConnectorField = {
               id: uuidv4(),
               entityId,
@@ -184,8 +150,6 @@ export class SAPConnector implements IConnector {
         }
 
         return { entities, fields, relationships, mode: 'live' };
-      } catch {
-        // Fall through to mock
       }
     }
 
@@ -239,6 +203,12 @@ export class SAPConnector implements IConnector {
     }
   }
 
+  clearMetadataCache(): void {
+    this.metadataXml = null;
+    this.parsedMetadata = null;
+    this.entityTypeIndex = null;
+  }
+
   async getSystemInfo(): Promise<ConnectorSystemInfo> {
     return {
       displayName: 'SAP S/4HANA',
@@ -257,6 +227,61 @@ export class SAPConnector implements IConnector {
 
   // ─── Private Helpers ───────────────────────────────────────────────────────────
 
+  private async loadParsedMetadata(): Promise<ReturnType<XMLParser['parse']>> {
+    if (this.parsedMetadata) return this.parsedMetadata;
+    if (!this.metadataXml) {
+      this.metadataXml = await this.fetchMetadata(this.credentials);
+    }
+    this.parsedMetadata = new XMLParser().parse(this.metadataXml);
+    return this.parsedMetadata;
+  }
+
+  /**
+   * Index EntityType definitions across all Schema elements once per metadata
+   * document. Returns null when the document has no Schema.
+   */
+  private async loadEntityTypeIndex(): Promise<SAPEntityTypeIndex | null> {
+    if (this.entityTypeIndex) return this.entityTypeIndex;
+
+    const parsed = await this.loadParsedMetadata();
+    const schema = parsed['edmx:Edmx']?.['edmx:DataServices']?.Schema;
+    if (!schema) return null;
+
+    // Handle single or multiple Schema elements
+    const schemas = Array.isArray(schema) ? schema : [schema];
+    const names = new Set<string>();
+    const properties = new Map<string, Array<{ Name: string; Type: string }>>();
+
+    for (const s of schemas) {
+      const entityTypes = s.EntityType;
+      if (!entityTypes) continue;
+      const entityArray = Array.isArray(entityTypes) ? entityTypes : [entityTypes];
+      for (const et of entityArray) {
+        if (!et.Name) continue;
+        names.add(et.Name);
+        if (et.Property) {
+          properties.set(et.Name, Array.isArray(et.Property) ? et.Property : [et.Property]);
+        }
+      }
+    }
+
+    this.entityTypeIndex = { names: Array.from(names).sort(), properties };
+    return this.entityTypeIndex;
+  }
+
+  /**
+   * loadEntityTypeIndex, with request and parse failures mapped to null so
+   * callers fall back to mock data. Only the $metadata round trip is guarded;
+   * errors while building entities from the index still surface.
+   */
+  private async tryLoadEntityTypeIndex(): Promise<SAPEntityTypeIndex | null> {
+    try {
+      return await this.loadEntityTypeIndex();
+    } catch {
+      return null;
+    }
+  }
+
   private async fetchMetadata(creds: SAPCredentials): Promise<string> {
     const url = `${creds.baseUrl}/sap/opu/odata4/sap/api_business_partner/srvd_a2x/sap/business_partner/0001/$metadata`;
     const response = await fetch(url, {
@@ -282,71 +307,68 @@ export class SAPConnector implements IConnector {
   }
 
   private isFinancialField(objectName: string, fieldName: string): boolean {
-    const financialObjects = ['GLAccount', 'CostCenter', 'ProfitCenter'];
-    const financialFields = ['Amount', 'Balance', 'Debit', 'Credit', 'Rate', 'Value', 'Cost'];
-
-    if (!financialObjects.includes(objectName)) {
+    if (!SAP_FINANCIAL_OBJECTS.has(objectName)) {
       return false;
     }
 
-    return financialFields.some((f) => fieldName.includes(f));
+    return SAP_FINANCIAL_FIELD_MARKERS.some((f) => fieldName.includes(f));
   }
 }
 
 // ─── Mock Schema and Data ──────────────────────────────────────────────────────
 
-function buildMockSAPSchema(objectNames: string[]): ConnectorSchema {
-  const templates: Record<string, Array<Omit<ConnectorField, 'id' | 'entityId'>>> = {
-    BusinessPartner: [
-      { name: 'Partner', label: 'Partner Number', dataType: 'string', isKey: true, required: true },
-      { name: 'Name1', label: 'Name', dataType: 'string', length: 80, required: true },
-      { name: 'SearchTerm1', label: 'Search Term', dataType: 'string', length: 20 },
-      { name: 'Street', label: 'Street', dataType: 'string', length: 60 },
-      { name: 'City', label: 'City', dataType: 'string', length: 40 },
-      { name: 'PostalCode', label: 'Postal Code', dataType: 'string', length: 10 },
-      { name: 'Country', label: 'Country', dataType: 'string', length: 3 },
-      { name: 'Phone', label: 'Phone Number', dataType: 'phone' },
-      { name: 'Email', label: 'Email Address', dataType: 'email' },
-      { name: 'Industry', label: 'Industry', dataType: 'string', length: 4 },
-    ],
-    Customer: [
-      { name: 'Customer', label: 'Customer Number', dataType: 'string', isKey: true, required: true },
-      { name: 'Name', label: 'Customer Name', dataType: 'string', length: 80, required: true },
-      { name: 'Currency', label: 'Currency Code', dataType: 'string', length: 5 },
-      { name: 'PaymentTerms', label: 'Payment Terms', dataType: 'string', length: 4 },
-      { name: 'PriceGroup', label: 'Price Group', dataType: 'string', length: 2 },
-    ],
-    Supplier: [
-      { name: 'Supplier', label: 'Supplier Number', dataType: 'string', isKey: true, required: true },
-      { name: 'Name', label: 'Supplier Name', dataType: 'string', length: 80, required: true },
-      { name: 'PaymentTerms', label: 'Payment Terms', dataType: 'string', length: 4 },
-      { name: 'Currency', label: 'Currency Code', dataType: 'string', length: 5 },
-      { name: 'TaxNumber', label: 'Tax Number', dataType: 'string', length: 20 },
-    ],
-    GLAccount: [
-      { name: 'ChartOfAccounts', label: 'Chart of Accounts', dataType: 'string', isKey: true, required: true },
-      { name: 'GLAccount', label: 'GL Account Number', dataType: 'string', isKey: true, required: true, complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
-      { name: 'AccountName', label: 'Account Name', dataType: 'string', length: 50, complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
-      { name: 'AccountType', label: 'Account Type', dataType: 'picklist', picklistValues: ['A', 'B', 'C', 'D', 'E'], complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
-      { name: 'Currency', label: 'Currency', dataType: 'string', length: 5, complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
-      { name: 'DebitCredit', label: 'Debit/Credit Indicator', dataType: 'string', length: 1, complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
-    ],
-    CostCenter: [
-      { name: 'ControllingArea', label: 'Controlling Area', dataType: 'string', isKey: true, required: true },
-      { name: 'CostCenter', label: 'Cost Center', dataType: 'string', isKey: true, required: true, complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
-      { name: 'Name', label: 'Cost Center Name', dataType: 'string', length: 50, complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
-      { name: 'ResponsiblePerson', label: 'Responsible Person', dataType: 'string', length: 20 },
-      { name: 'Department', label: 'Department', dataType: 'string', length: 4 },
-    ],
-  };
+const SAP_MOCK_TEMPLATES: Record<string, Array<Omit<ConnectorField, 'id' | 'entityId'>>> = {
+  BusinessPartner: [
+    { name: 'Partner', label: 'Partner Number', dataType: 'string', isKey: true, required: true },
+    { name: 'Name1', label: 'Name', dataType: 'string', length: 80, required: true },
+    { name: 'SearchTerm1', label: 'Search Term', dataType: 'string', length: 20 },
+    { name: 'Street', label: 'Street', dataType: 'string', length: 60 },
+    { name: 'City', label: 'City', dataType: 'string', length: 40 },
+    { name: 'PostalCode', label: 'Postal Code', dataType: 'string', length: 10 },
+    { name: 'Country', label: 'Country', dataType: 'string', length: 3 },
+    { name: 'Phone', label: 'Phone Number', dataType: 'phone' },
+    { name: 'Email', label: 'Email Address', dataType: 'email' },
+    { name: 'Industry', label: 'Industry', dataType: 'string', length: 4 },
+  ],
+  Customer: [
+    { name: 'Customer', label: 'Customer Number', dataType: 'string', isKey: true, required: true },
+    { name: 'Name', label: 'Customer Name', dataType: 'string', length: 80, required: true },
+    { name: 'Currency', label: 'Currency Code', dataType: 'string', length: 5 },
+    { name: 'PaymentTerms', label: 'Payment Terms', dataType: 'string', length: 4 },
+    { name: 'PriceGroup', label: 'Price Group', dataType: 'string', length: 2 },
+  ],
+  Supplier: [
+    { name: 'Supplier', label: 'Supplier Number', dataType: 'string', isKey: true, required: true },
+    { name: 'Name', label: 'Supplier Name', dataType: 'string', length: 80, required: true },
+    { name: 'PaymentTerms', label: 'Payment Terms', dataType: 'string', length: 4 },
+    { name: 'Currency', label: 'Currency Code', dataType: 'string', length: 5 },
+    { name: 'TaxNumber', label: 'Tax Number', dataType: 'string', length: 20 },
+  ],
+  GLAccount: [
+    { name: 'ChartOfAccounts', label: 'Chart of Accounts', dataType: 'string', isKey: true, required: true },
+    { name: 'GLAccount', label: 'GL Account Number', dataType: 'string', isKey: true, required: true, complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
+    { name: 'AccountName', label: 'Account Name', dataType: 'string', length: 50, complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
+    { name: 'AccountType', label: 'Account Type', dataType: 'picklist', picklistValues: ['A', 'B', 'C', 'D', 'E'], complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
+    { name: 'Currency', label: 'Currency', dataType: 'string', length: 5, complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
+    { name: 'DebitCredit', label: 'Debit/Credit Indicator', dataType: 'string', length: 1, complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
+  ],
+  CostCenter: [
+    { name: 'ControllingArea', label: 'Controlling Area', dataType: 'string', isKey: true, required: true },
+    { name: 'CostCenter', label: 'Cost Center', dataType: 'string', isKey: true, required: true, complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
+    { name: 'Name', label: 'Cost Center Name', dataType: 'string', length: 50, complianceTags: ['SOX_FINANCIAL'] as ComplianceTag[] },
+    { name: 'ResponsiblePerson', label: 'Responsible Person', dataType: 'string', length: 20 },
+    { name: 'Department', label: 'Department', dataType: 'string', length: 4 },
+  ],
+};
 
+function buildMockSAPSchema(objectNames: string[]): ConnectorSchema {
   const entities: Entity[] = [];
   const fields: ConnectorField[] = [];
 
   for (const objectName of objectNames) {
     const entityId = uuidv4();
     entities.push({ id: entityId, systemId: '', name: objectName, label: objectName });
-    for (const template of templates[objectName] ?? []) {
+    for (const template of SAP_MOCK_TEMPLATES[objectName] ?? []) {
       fields.push({ id: uuidv4(), entityId, ...template });
     }
   }
@@ -354,29 +376,29 @@ function buildMockSAPSchema(objectNames: string[]): ConnectorSchema {
   return { entities, fields, relationships: [], mode: 'mock' };
 }
 
+const SAP_MOCK_SAMPLES: Record<string, SampleRow[]> = {
+  BusinessPartner: [
+    { Partner: '0000100001', Name1: 'Acme Manufacturing Ltd', SearchTerm1: 'ACME', Street: '123 Industrial Blvd', City: 'Frankfurt', PostalCode: '60311', Country: 'DE', Phone: '+49-69-123456', Email: 'info@acme.de', Industry: '2824' },
+    { Partner: '0000100002', Name1: 'Global Trade Inc', SearchTerm1: 'GLOBAL', Street: '456 Commerce Ave', City: 'Hamburg', PostalCode: '20095', Country: 'DE', Phone: '+49-40-987654', Email: 'sales@global.de', Industry: '5110' },
+  ],
+  Customer: [
+    { Customer: '0000100001', Name: 'Premium Corp', Currency: 'EUR', PaymentTerms: 'Z030', PriceGroup: 'A1' },
+    { Customer: '0000100002', Name: 'Standard Ltd', Currency: 'EUR', PaymentTerms: 'Z045', PriceGroup: 'A2' },
+  ],
+  Supplier: [
+    { Supplier: '0000100001', Name: 'Parts & Components GmbH', PaymentTerms: 'Z060', Currency: 'EUR', TaxNumber: 'DE123456789' },
+    { Supplier: '0000100002', Name: 'Industrial Supplies AG', PaymentTerms: 'Z030', Currency: 'EUR', TaxNumber: 'DE987654321' },
+  ],
+  GLAccount: [
+    { ChartOfAccounts: 'INT', GLAccount: '110000', AccountName: 'Cash and Cash Equivalents', AccountType: 'A', Currency: 'EUR', DebitCredit: 'D' },
+    { ChartOfAccounts: 'INT', GLAccount: '200000', AccountName: 'Accounts Payable', AccountType: 'B', Currency: 'EUR', DebitCredit: 'C' },
+  ],
+  CostCenter: [
+    { ControllingArea: 'A000', CostCenter: 'CC001', Name: 'Manufacturing', ResponsiblePerson: 'MUELLER', Department: '0001' },
+    { ControllingArea: 'A000', CostCenter: 'CC002', Name: 'Sales', ResponsiblePerson: 'SCHNEIDER', Department: '0002' },
+  ],
+};
+
 function buildMockSAPData(objectName: string, limit: number): SampleRow[] {
-  const samples: Record<string, SampleRow[]> = {
-    BusinessPartner: [
-      { Partner: '0000100001', Name1: 'Acme Manufacturing Ltd', SearchTerm1: 'ACME', Street: '123 Industrial Blvd', City: 'Frankfurt', PostalCode: '60311', Country: 'DE', Phone: '+49-69-123456', Email: 'info@acme.de', Industry: '2824' },
-      { Partner: '0000100002', Name1: 'Global Trade Inc', SearchTerm1: 'GLOBAL', Street: '456 Commerce Ave', City: 'Hamburg', PostalCode: '20095', Country: 'DE', Phone: '+49-40-987654', Email: 'sales@global.de', Industry: '5110' },
-    ],
-    Customer: [
-      { Customer: '0000100001', Name: 'Premium Corp', Currency: 'EUR', PaymentTerms: 'Z030', PriceGroup: 'A1' },
-      { Customer: '0000100002', Name: 'Standard Ltd', Currency: 'EUR', PaymentTerms: 'Z045', PriceGroup: 'A2' },
-    ],
-    Supplier: [
-      { Supplier: '0000100001', Name: 'Parts & Components GmbH', PaymentTerms: 'Z060', Currency: 'EUR', TaxNumber: 'DE123456789' },
-      { Supplier: '0000100002', Name: 'Industrial Supplies AG', PaymentTerms: 'Z030', Currency: 'EUR', TaxNumber: 'DE987654321' },
-    ],
-    GLAccount: [
-      { ChartOfAccounts: 'INT', GLAccount: '110000', AccountName: 'Cash and Cash Equivalents', AccountType: 'A', Currency: 'EUR', DebitCredit: 'D' },
-      { ChartOfAccounts: 'INT', GLAccount: '200000', AccountName: 'Accounts Payable', AccountType: 'B', Currency: 'EUR', DebitCredit: 'C' },
-    ],
-    CostCenter: [
-      { ControllingArea: 'A000', CostCenter: 'CC001', Name: 'Manufacturing', ResponsiblePerson: 'MUELLER', Department: '0001' },
-      { ControllingArea: 'A000', CostCenter: 'CC002', Name: 'Sales', ResponsiblePerson: 'SCHNEIDER', Department: '0002' },
-    ],
-  };
-
-  return (samples[objectName] ?? []).slice(0, limit);
+  return (SAP_MOCK_SAMPLES[objectName] ?? []).slice(0, limit);
 }
@@ -18,13 +18,12 @@ import type {
   ConnectorSystemInfo,
   SampleRow,
 } from './IConnector.js';
-import type { Entity, Relationship } from './types.js';
-import { normalizeSalesforceType } from './utils/typeUtils.js';
+import type { Entity } from './types.js';
 import {
   getSalesforceMockObjectTemplatesForConnector,
   listSalesforceMockObjectNames,
 } from './salesforceMockCatalog.js';
-import { loadSalesforceValidationRuleIndex } from './salesforceValidationRules.js';
+import { clearSalesforceDescribeCache, loadSalesforceSchema } from './salesforceDescribe.js';
 
 interface SalesforceCredentials {
   accessToken?: string;
@@ -36,31 +35,14 @@ interface SalesforceCredentials {
   loginUrl?: string;
 }
 
-interface SalesforceDescribeField {
-  name: string;
-  label?: string;
-  type: string;
-  length?: number;
-  precision?: number;
-  scale?: number;
-  nillable?: boolean;
-  defaultedOnCreate?: boolean;
-  externalId?: boolean;
-  picklistValues?: Array<{ value?: string | null }> | null;
-  referenceTo?: string[];
-}
-
-interface SalesforceObjectDescribe {
-  name: string;
-  label: string;
-  labelPlural?: string;
-  fields: SalesforceDescribeField[];
-}
-
 export class SalesforceConnector implements IConnector {
   private mode: 'live' | 'mock' = 'mock';
   private credentials: SalesforceCredentials = {};
   private conn: InstanceType<typeof jsforce.Connection> | null = null;
+  // describeGlobal result for the live connection; pooled instances reuse it
+  // across listObjects() and full-org fetchSchema() calls.
+  private globalObjectNames: { names: string[]; expiresAt: number } | null = null;
+  private static readonly GLOBAL_DESCRIBE_TTL_MS = 60 * 60_000;
   private static readonly DEFAULT_MOCK_OBJECTS = [
     'Account',
     'Contact',
@@ -103,6 +85,7 @@ export class SalesforceConnector implements IConnector {
     const hasOAuthToken = creds.accessToken && creds.instanceUrl;
     const hasUserPass = creds.username && creds.password;
 
+    this.globalObjectNames = null;
     if (!hasOAuthToken && !hasUserPass) {
       this.mode = 'mock';
       return;
@@ -132,17 +115,23 @@ export class SalesforceConnector implements IConnector {
 
   async listObjects(): Promise<string[]> {
     if (this.mode === 'live' && this.conn) {
-      try {
-        const result = await this.conn.describeGlobal();
-        const sobjects = (result as { sobjects: Array<{ queryable?: boolean; name: string }> }).sobjects;
-        // Filter to queryable objects
-        return sobjects
-          .filter((obj) => obj.queryable)
-          .map((obj) => obj.name);
-      } catch {
-        // Fallback to mock on error
-        return this.getMockObjectList();
+      if (this.globalObjectNames && this.globalObjectNames.expiresAt > Date.now()) {
+        return [...this.globalObjectNames.names];
       }
+      // No mock fallback here: a live session that can't describeGlobal (expired
+      // or revoked token) must fail so callers don't pool or cache a mock list
+      // under live credentials.
+      const result = await this.conn.describeGlobal();
+      const sobjects = (result as { sobjects: Array<{ queryable?: boolean; name: string }> }).sobjects;
+      // Filter to queryable objects
+      const names = sobjects
+        .filter((obj) => obj.queryable)
+        .map((obj) => obj.name);
+      this.globalObjectNames = {
+        names,
+        expiresAt: Date.now() + SalesforceConnector.GLOBAL_DESCRIBE_TTL_MS,
+      };
+      return [...names];
     }
     return this.getMockObjectList();
   }
@@ -160,83 +149,10 @@ export class SalesforceConnector implements IConnector {
       ? objectNames
       : await this.listObjects();
 
-    const entities: Entity[] = [];
-    const fields: ConnectorField[] = [];
-    const pendingRelationships: Array<{ fromEntityId: string; referenceTo: string; viaField: string }> = [];
-
     if (this.mode === 'live' && this.conn) {
       try {
-        const describedObjects: Array<{
-          objectName: string;
-          entityId: string;
-          desc: SalesforceObjectDescribe;
-        }> = [];
-
-        for (const objectName of objects) {
-          const desc = await this.conn.sobject(objectName).describe() as unknown as SalesforceObjectDescribe;
-          const entityId = uuidv4();
-          describedObjects.push({ objectName, entityId, desc });
-          entities.push({
-            id: entityId,
-            systemId: '', // Set by the route handler
-            name: desc.name,
-            label: desc.label,
-            description: desc.labelPlural,
-          });
-        }
-
-        const validationRuleIndex = await loadSalesforceValidationRuleIndex({
-          conn: this.conn,
-          objectFieldNames: new Map(
-            describedObjects.map(({ objectName, desc }) => [objectName, desc.fields.map((field) => field.name)]),
-          ),
-        });
-
-        for (const { objectName, entityId, desc } of describedObjects) {
-          const objectValidationRules = validationRuleIndex.get(objectName);
-          for (const f of desc.fields) {
-            const picklistValues = Array.isArray(f.picklistValues)
-              ? f.picklistValues
-                .map((p: { value?: string | null }) => p.value)
-                .filter((value): value is string => Boolean(value))
-              : undefined;
-
-            fields.push({
-              id: uuidv4(),
-              entityId,
-              name: f.name,
-              label: f.label,
-              dataType: normalizeSalesforceType(f.type),
-              length: f.length,
-              precision: f.precision,
-              scale: f.scale,
-              required: !f.nillable && !f.defaultedOnCreate,
-              isKey: f.type === 'id',
-              isExternalId: !!f.externalId,
-              picklistValues,
-              validationRules: objectValidationRules?.get(f.name),
-            });
-
-            if (f.referenceTo?.length) {
-              pendingRelationships.push({
-                fromEntityId: entityId,
-                referenceTo: String(f.referenceTo[0]),
-                viaField: f.name,
-              });
-            }
-          }
-        }
-
-        // Build name → id map for relationships
-        const nameToEntityId = new Map(entities.map((e) => [e.name, e.id]));
-        const relationships: Relationship[] = pendingRelationships.map((pr) => ({
-          fromEntityId: pr.fromEntityId,
-          toEntityId: nameToEntityId.get(pr.referenceTo) ?? pr.fromEntityId,
-          type: 'lookup',
-          viaField: pr.viaField,
-        }));
-
-        return { entities, fields, relationships, mode: 'live' };
+        const schema = await loadSalesforceSchema(this.conn, objects, ''); // systemId set by the route handler
+        return { ...schema, mode: 'live' };
       } catch {
         // Fall through to mock
       }
@@ -286,6 +202,11 @@ export class SalesforceConnector implements IConnector {
     }
   }
 
+  clearMetadataCache(): void {
+    this.globalObjectNames = null;
+    if (this.conn) clearSalesforceDescribeCache(this.conn);
+  }
+
   async getSystemInfo(): Promise<ConnectorSystemInfo> {
     return {
       displayName: 'Salesforce CRM',
@@ -303,149 +224,146 @@ export class SalesforceConnector implements IConnector {
 
 // ─── Mock Schema and Data ──────────────────────────────────────────────────────
 
-function buildMockSalesforceSchema(objectNames: string[]): ConnectorSchema {
-  const seededTemplates: Record<string, Array<Omit<ConnectorField, 'id' | 'entityId'>>> = {
-    Account: [
-      { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
-      { name: 'Name', label: 'Account Name', dataType: 'string', length: 255, required: true, isExternalId: false },
-      { name: 'BillingStreet', label: 'Billing Street', dataType: 'string', length: 255 },
-      { name: 'BillingCity', label: 'Billing City', dataType: 'string', length: 40 },
-      { name: 'BillingState', label: 'Billing State', dataType: 'string', length: 20 },
-      { name: 'BillingPostalCode', label: 'Billing Zip/Postal Code', dataType: 'string', length: 20 },
-      { name: 'BillingCountry', label: 'Billing Country', dataType: 'string', length: 40 },
-      { name: 'Phone', label: 'Account Phone', dataType: 'phone' },
-      { name: 'Fax', label: 'Account Fax', dataType: 'phone' },
-      { name: 'Website', label: 'Website', dataType: 'string', length: 255 },
-    ],
-    Contact: [
-      { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
-      { name: 'FirstName', label: 'First Name', dataType: 'string', length: 40 },
-      { name: 'LastName', label: 'Last Name', dataType: 'string', length: 80, required: true },
-      { name: 'Email', label: 'Email', dataType: 'email' },
-      { name: 'Phone', label: 'Phone', dataType: 'phone' },
-      { name: 'Title', label: 'Title', dataType: 'string', length: 128 },
-      { name: 'Department', label: 'Department', dataType: 'string', length: 80 },
-      { name: 'AccountId', label: 'Account ID', dataType: 'reference' },
-    ],
-    Opportunity: [
-      { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
-      { name: 'Name', label: 'Opportunity Name', dataType: 'string', length: 120, required: true },
-      {
-        name: 'Amount',
-        label: 'Amount',
-        dataType: 'decimal',
-        precision: 18,
-        scale: 2,
-        validationRules: [{
-          name: 'Closed_Won_Requires_Amount_And_CloseDate',
-          entityName: 'Opportunity',
-          errorMessage: 'Closed Won opportunities require Amount and CloseDate.',
-          referencedFields: ['StageName', 'Amount', 'CloseDate'],
-        }],
-      },
-      {
-        name: 'StageName',
-        label: 'Stage',
-        dataType: 'picklist',
-        picklistValues: ['Prospecting', 'Qualification', 'Negotiation/Review', 'Closed Won', 'Closed Lost'],
-        required: true,
-        validationRules: [{
-          name: 'Closed_Won_Requires_Amount_And_CloseDate',
-          entityName: 'Opportunity',
-          errorMessage: 'Closed Won opportunities require Amount and CloseDate.',
-          referencedFields: ['StageName', 'Amount', 'CloseDate'],
-        }],
-      },
-      {
-        name: 'CloseDate',
-        label: 'Close Date',
-        dataType: 'date',
-        required: true,
-        validationRules: [{
-          name: 'Closed_Won_Requires_Amount_And_CloseDate',
-          entityName: 'Opportunity',
-          errorMessage: 'Closed Won opportunities require Amount and CloseDate.',
-          referencedFields: ['StageName', 'Amount', 'CloseDate'],
-        }],
-      },
-      { name: 'Probability', label: 'Probability', dataType: 'number' },
-      { name: 'AccountId', label: 'Account ID', dataType: 'reference', required: true },
-    ],
-    Lead: [
-      { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
-      { name: 'FirstName', label: 'First Name', dataType: 'string', length: 40 },
-      { name: 'LastName', label: 'Last Name', dataType: 'string', length: 80, required: true },
-      { name: 'Email', label: 'Email', dataType: 'email' },
-      { name: 'Phone', label: 'Phone', dataType: 'phone' },
-      { name: 'Company', label: 'Company', dataType: 'string', length: 255, required: true },
-      { name: 'Title', label: 'Title', dataType: 'string', length: 128 },
-      { name: 'Status', label: 'Status', dataType: 'picklist', picklistValues: ['Open', 'Contacted', 'Qualified', 'Unqualified'], required: true },
-    ],
-    Case: [
-      { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
-      { name: 'CaseNumber', label: 'Case Number', dataType: 'string', length: 255, required: true },
-      { name: 'Subject', label: 'Subject', dataType: 'string', length: 255 },
-      { name: 'Description', label: 'Description', dataType: 'text' },
-      { name: 'Status', label: 'Status', dataType: 'picklist', picklistValues: ['New', 'In Progress', 'On Hold', 'Resolved', 'Closed'], required: true },
-      { name: 'Priority', label: 'Priority', dataType: 'picklist', picklistValues: ['Low', 'Medium', 'High'], required: true },
-      { name: 'AccountId', label: 'Account ID', dataType: 'reference' },
-      { name: 'ContactId', label: 'Contact ID', dataType: 'reference' },
-    ],
-    FinancialAccount: [
-      { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
-      { name: 'Name', label: 'Financial Account Name', dataType: 'string', length: 255, required: true },
-      { name: 'FinancialAccountNumber', label: 'Financial Account Number', dataType: 'string', length: 34, required: true },
-      { name: 'CurrentBalance', label: 'Current Balance', dataType: 'decimal', precision: 18, scale: 2 },
-      { name: 'AvailableBalance', label: 'Available Balance', dataType: 'decimal', precision: 18, scale: 2 },
-      { name: 'OpenDate', label: 'Open Date', dataType: 'date' },
-      { name: 'Status', label: 'Status', dataType: 'picklist', picklistValues: ['Open', 'Inactive', 'Closed'] },
-      { name: 'FinancialAccountType', label: 'Financial Account Type', dataType: 'picklist', picklistValues: ['Checking', 'Savings', 'Loan', 'Certificate', 'Line of Credit'] },
-      { name: 'PrimaryOwnerId', label: 'Primary Owner ID', dataType: 'reference' },
-    ],
-    AccountParticipant: [
-      { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
-      { name: 'FinancialAccountId', label: 'Financial Account ID', dataType: 'reference', required: true },
-      { name: 'PartyProfileId', label: 'Party Profile ID', dataType: 'reference', required: true },
-      { name: 'ParticipantRole', label: 'Participant Role', dataType: 'picklist', picklistValues: ['Primary Owner', 'Joint Owner', 'Authorized Signer', 'Beneficiary'] },
-      { name: 'StartDate', label: 'Start Date', dataType: 'date' },
-      { name: 'EndDate', label: 'End Date', dataType: 'date' },
-    ],
-    PartyProfile: [
-      { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
-      { name: 'CIFNumber', label: 'CIF Number', dataType: 'string', length: 20, isExternalId: true },
-      { name: 'LegalName', label: 'Legal Name', dataType: 'string', length: 255, required: true },
-      { name: 'TaxId', label: 'Tax ID', dataType: 'string', length: 20 },
-      { name: 'BirthDate', label: 'Birth Date', dataType: 'date' },
-      { name: 'PrimaryEmail', label: 'Primary Email', dataType: 'email' },
-      { name: 'PrimaryPhone', label: 'Primary Phone', dataType: 'phone' },
-      { name: 'AddressLine1', label: 'Address Line 1', dataType: 'string', length: 255 },
-      { name: 'City', label: 'City', dataType: 'string', length: 100 },
-      { name: 'StateCode', label: 'State Code', dataType: 'string', length: 10 },
-      { name: 'PostalCode', label: 'Postal Code', dataType: 'string', length: 20 },
-      { name: 'CountryCode', label: 'Country Code', dataType: 'string', length: 5 },
-    ],
-    IndividualApplication: [
-      { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
-      { name: 'ApplicationNumber', label: 'Application Number', dataType: 'string', length: 30, required: true },
-      { name: 'Status', label: 'Application Status', dataType: 'picklist', picklistValues: ['Draft', 'Submitted', 'Under Review', 'Approved', 'Declined'] },
-      { name: 'ApplicantPartyProfileId', label: 'Applicant Party Profile ID', dataType: 'reference' },
-      { name: 'RequestedAmount', label: 'Requested Amount', dataType: 'decimal', precision: 18, scale: 2 },
-      { name: 'SubmittedDate', label: 'Submitted Date', dataType: 'date' },
-    ],
-    FinancialGoal: [
-      { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
-      { name: 'Name', label: 'Goal Name', dataType: 'string', required: true },
-      { name: 'TargetAmount', label: 'Target Amount', dataType: 'decimal', precision: 18, scale: 2 },
-      { name: 'TargetDate', label: 'Target Date', dataType: 'date' },
-      { name: 'Status', label: 'Goal Status', dataType: 'picklist', picklistValues: ['Planned', 'In Progress', 'Achieved', 'Cancelled'] },
-      { name: 'OwnerPartyProfileId', label: 'Owner Party Profile ID', dataType: 'reference' },
-    ],
-  };
+const SALESFORCE_SEEDED_TEMPLATES: Record<string, Array<Omit<ConnectorField, 'id' | 'entityId'>>> = {
+  Account: [
+    { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
+    { name: 'Name', label: 'Account Name', dataType: 'string', length: 255, required: true, isExternalId: false },
+    { name: 'BillingStreet', label: 'Billing Street', dataType: 'string', length: 255 },
+    { name: 'BillingCity', label: 'Billing City', dataType: 'string', length: 40 },
+    { name: 'BillingState', label: 'Billing State', dataType: 'string', length: 20 },
+    { name: 'BillingPostalCode', label: 'Billing Zip/Postal Code', dataType: 'string', length: 20 },
+    { name: 'BillingCountry', label: 'Billing Country', dataType: 'string', length: 40 },
+    { name: 'Phone', label: 'Account Phone', dataType: 'phone' },
+    { name: 'Fax', label: 'Account Fax', dataType: 'phone' },
+    { name: 'Website', label: 'Website', dataType: 'string', length: 255 },
+  ],
+  Contact: [
+    { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
+    { name: 'FirstName', label: 'First Name', dataType: 'string', length: 40 },
+    { name: 'LastName', label: 'Last Name', dataType: 'string', length: 80, required: true },
+    { name: 'Email', label: 'Email', dataType: 'email' },
+    { name: 'Phone', label: 'Phone', dataType: 'phone' },
+    { name: 'Title', label: 'Title', dataType: 'string', length: 128 },
+    { name: 'Department', label: 'Department', dataType: 'string', length: 80 },
+    { name: 'AccountId', label: 'Account ID', dataType: 'reference' },
+  ],
+  Opportunity: [
+    { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
+    { name: 'Name', label: 'Opportunity Name', dataType: 'string', length: 120, required: true },
+    {
+      name: 'Amount',
+      label: 'Amount',
+      dataType: 'decimal',
+      precision: 18,
+      scale: 2,
+      validationRules: [{
+        name: 'Closed_Won_Requires_Amount_And_CloseDate',
+        entityName: 'Opportunity',
+        errorMessage: 'Closed Won opportunities require Amount and CloseDate.',
+        referencedFields: ['StageName', 'Amount', 'CloseDate'],
+      }],
+    },
+    {
+      name: 'StageName',
+      label: 'Stage',
+      dataType: 'picklist',
+      picklistValues: ['Prospecting', 'Qualification', 'Negotiation/Review', 'Closed Won', 'Closed Lost'],
+      required: true,
+      validationRules: [{
+        name: 'Closed_Won_Requires_Amount_And_CloseDate',
+        entityName: 'Opportunity',
+        errorMessage: 'Closed Won opportunities require Amount and CloseDate.',
+        referencedFields: ['StageName', 'Amount', 'CloseDate'],
+      }],
+    },
+    {
+      name: 'CloseDate',
+      label: 'Close Date',
+      dataType: 'date',
+      required: true,
+      validationRules: [{
+        name: 'Closed_Won_Requires_Amount_And_CloseDate',
+        entityName: 'Opportunity',
+        errorMessage: 'Closed Won opportunities require Amount and CloseDate.',
+        referencedFields: ['StageName', 'Amount', 'CloseDate'],
+      }],
+    },
+    { name: 'Probability', label: 'Probability', dataType: 'number' },
+    { name: 'AccountId', label: 'Account ID', dataType: 'reference', required: true },
+  ],
+  Lead: [
+    { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
+    { name: 'FirstName', label: 'First Name', dataType: 'string', length: 40 },
+    { name: 'LastName', label: 'Last Name', dataType: 'string', length: 80, required: true },
+    { name: 'Email', label: 'Email', dataType: 'email' },
+    { name: 'Phone', label: 'Phone', dataType: 'phone' },
+    { name: 'Company', label: 'Company', dataType: 'string', length: 255, required: true },
+    { name: 'Title', label: 'Title', dataType: 'string', length: 128 },
+    { name: 'Status', label: 'Status', dataType: 'picklist', picklistValues: ['Open', 'Contacted', 'Qualified', 'Unqualified'], required: true },
+  ],
+  Case: [
+    { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
+    { name: 'CaseNumber', label: 'Case Number', dataType: 'string', length: 255, required: true },
+    { name: 'Subject', label: 'Subject', dataType: 'string', length: 255 },
+    { name: 'Description', label: 'Description', dataType: 'text' },
+    { name: 'Status', label: 'Status', dataType: 'picklist', picklistValues: ['New', 'In Progress', 'On Hold', 'Resolved', 'Closed'], required: true },
+    { name: 'Priority', label: 'Priority', dataType: 'picklist', picklistValues: ['Low', 'Medium', 'High'], required: true },
+    { name: 'AccountId', label: 'Account ID', dataType: 'reference' },
+    { name: 'ContactId', label: 'Contact ID', dataType: 'reference' },
+  ],
+  FinancialAccount: [
+    { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
+    { name: 'Name', label: 'Financial Account Name', dataType: 'string', length: 255, required: true },
+    { name: 'FinancialAccountNumber', label: 'Financial Account Number', dataType: 'string', length: 34, required: true },
+    { name: 'CurrentBalance', label: 'Current Balance', dataType: 'decimal', precision: 18, scale: 2 },
+    { name: 'AvailableBalance', label: 'Available Balance', dataType: 'decimal', precision: 18, scale: 2 },
+    { name: 'OpenDate', label: 'Open Date', dataType: 'date' },
+    { name: 'Status', label: 'Status', dataType: 'picklist', picklistValues: ['Open', 'Inactive', 'Closed'] },
+    { name: 'FinancialAccountType', label: 'Financial Account Type', dataType: 'picklist', picklistValues: ['Checking', 'Savings', 'Loan', 'Certificate', 'Line of Credit'] },
+    { name: 'PrimaryOwnerId', label: 'Primary Owner ID', dataType: 'reference' },
+  ],
+  AccountParticipant: [
+    { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
+    { name: 'FinancialAccountId', label: 'Financial Account ID', dataType: 'reference', required: true },
+    { name: 'PartyProfileId', label: 'Party Profile ID', dataType: 'reference', required: true },
+    { name: 'ParticipantRole', label: 'Participant Role', dataType: 'picklist', picklistValues: ['Primary Owner', 'Joint Owner', 'Authorized Signer', 'Beneficiary'] },
+    { name: 'StartDate', label: 'Start Date', dataType: 'date' },
+    { name: 'EndDate', label: 'End Date', dataType: 'date' },
+  ],
+  PartyProfile: [
+    { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
+    { name: 'CIFNumber', label: 'CIF Number', dataType: 'string', length: 20, isExternalId: true },
+    { name: 'LegalName', label: 'Legal Name', dataType: 'string', length: 255, required: true },
+    { name: 'TaxId', label: 'Tax ID', dataType: 'string', length: 20 },
+    { name: 'BirthDate', label: 'Birth Date', dataType: 'date' },
+    { name: 'PrimaryEmail', label: 'Primary Email', dataType: 'email' },
+    { name: 'PrimaryPhone', label: 'Primary Phone', dataType: 'phone' },
+    { name: 'AddressLine1', label: 'Address Line 1', dataType: 'string', length: 255 },
+    { name: 'City', label: 'City', dataType: 'string', length: 100 },
+    { name: 'StateCode', label: 'State Code', dataType: 'string', length: 10 },
+    { name: 'PostalCode', label: 'Postal Code', dataType: 'string', length: 20 },
+    { name: 'CountryCode', label: 'Country Code', dataType: 'string', length: 5 },
+  ],
+  IndividualApplication: [
+    { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
+    { name: 'ApplicationNumber', label: 'Application Number', dataType: 'string', length: 30, required: true },
+    { name: 'Status', label: 'Application Status', dataType: 'picklist', picklistValues: ['Draft', 'Submitted', 'Under Review', 'Approved', 'Declined'] },
+    { name: 'ApplicantPartyProfileId', label: 'Applicant Party Profile ID', dataType: 'reference' },
+    { name: 'RequestedAmount', label: 'Requested Amount', dataType: 'decimal', precision: 18, scale: 2 },
+    { name: 'SubmittedDate', label: 'Submitted Date', dataType: 'date' },
+  ],
+  FinancialGoal: [
+    { name: 'Id', label: 'ID', dataType: 'id', isKey: true, required: true },
+    { name: 'Name', label: 'Goal Name', dataType: 'string', required: true },
+    { name: 'TargetAmount', label: 'Target Amount', dataType: 'decimal', precision: 18, scale: 2 },
+    { name: 'TargetDate', label: 'Target Date', dataType: 'date' },
+    { name: 'Status', label: 'Goal Status', dataType: 'picklist', picklistValues: ['Planned', 'In Progress', 'Achieved', 'Cancelled'] },
+    { name: 'OwnerPartyProfileId', label: 'Owner Party Profile ID', dataType: 'reference' },
+  ],
+};
 
-  const templates = {
-    ...seededTemplates,
-    ...getSalesforceMockObjectTemplatesForConnector(objectNames),
-  };
+function buildMockSalesforceSchema(objectNames: string[]): ConnectorSchema {
+  const generatedTemplates = getSalesforceMockObjectTemplatesForConnector(objectNames);
 
   const entities: Entity[] = [];
   const fields: ConnectorField[] = [];
@@ -453,7 +371,8 @@ function buildMockSalesforceSchema(objectNames: string[]): ConnectorSchema {
   for (const objectName of objectNames) {
     const entityId = uuidv4();
     entities.push({ id: entityId, systemId: '', name: objectName, label: objectName });
-    for (const template of templates[objectName] ?? []) {
+    const templates = generatedTemplates[objectName] ?? SALESFORCE_SEEDED_TEMPLATES[objectName] ?? [];
+    for (const template of templates) {
       fields.push({ id: uuidv4(), entityId, ...template });
     }
   }
@@ -461,29 +380,29 @@ function buildMockSalesforceSchema(objectNames: string[]): ConnectorSchema {
   return { entities, fields, relationships: [], mode: 'mock' };
 }
 
-function buildMockSalesforceData(objectName: string, limit: number): SampleRow[] {
-  const samples: Record<string, SampleRow[]> = {
-    Account: [
-      { Id: '001D000000IRFmaIAH', Name: 'Acme Corp', BillingCity: 'San Francisco', BillingCountry: 'USA', Phone: '415-555-1234' },
-      { Id: '001D000000IRFmbIAH', Name: 'Global Tech Inc', BillingCity: 'New York', BillingCountry: 'USA', Phone: '212-555-5678' },
-    ],
-    Contact: [
-      { Id: '003D000000IZ3SIAW1', FirstName: 'Jane', LastName: 'Smith', Email: 'jane@acme.com', Phone: '415-555-1234' },
-      { Id: '003D000000IZ3SJAW1', FirstName: 'John', LastName: 'Doe', Email: 'john@tech.com', Phone: '212-555-5678' },
-    ],
-    Opportunity: [
-      { Id: '006D000000I0OcIAV', Name: 'Enterprise License Agreement', Amount: 250000, StageName: 'Negotiation/Review', CloseDate: '2026-03-31' },
-      { Id: '006D000000I0OdIAV', Name: 'SMB Package Deal', Amount: 50000, StageName: 'Prospecting', CloseDate: '2026-04-15' },
-    ],
-    Lead: [
-      { Id: '00QD0000002STQKMA4', FirstName: 'Sarah', LastName: 'Johnson', Company: 'TechStart Inc', Email: 'sarah@techstart.com', Status: 'Open' },
-      { Id: '00QD0000002STQLMA4', FirstName: 'Michael', LastName: 'Chen', Company: 'Finance Corp', Email: 'michael@finance.com', Status: 'Contacted' },
-    ],
-    Case: [
-      { Id: '500D0000003BVfIAW', CaseNumber: 'CS-00001', Subject: 'License activation issue', Status: 'Open', Priority: 'High', Description: 'Customer cannot activate license' },
-      { Id: '500D0000003BVgIAW', CaseNumber: 'CS-00002', Subject: 'Billing question', Status: 'Resolved', Priority: 'Medium', Description: 'Inquiry about renewal pricing' },
-    ],
-  };
+const SALESFORCE_MOCK_SAMPLES: Record<string, SampleRow[]> = {
+  Account: [
+    { Id: '001D000000IRFmaIAH', Name: 'Acme Corp', BillingCity: 'San Francisco', BillingCountry: 'USA', Phone: '415-555-1234' },
+    { Id: '001D000000IRFmbIAH', Name: 'Global Tech Inc', BillingCity: 'New York', BillingCountry: 'USA', Phone: '212-555-5678' },
+  ],
+  Contact: [
+    { Id: '003D000000IZ3SIAW1', FirstName: 'Jane', LastName: 'Smith', Email: 'jane@acme.com', Phone: '415-555-1234' },
+    { Id: '003D000000IZ3SJAW1', FirstName: 'John', LastName: 'Doe', Email: 'john@tech.com', Phone: '212-555-5678' },
+  ],
+  Opportunity: [
+    { Id: '006D000000I0OcIAV', Name: 'Enterprise License Agreement', Amount: 250000, StageName: 'Negotiation/Review', CloseDate: '2026-03-31' },
+    { Id: '006D000000I0OdIAV', Name: 'SMB Package Deal', Amount: 50000, StageName: 'Prospecting', CloseDate: '2026-04-15' },
+  ],
+  Lead: [
+    { Id: '00QD0000002STQKMA4', FirstName: 'Sarah', LastName: 'Johnson', Company: 'TechStart Inc', Email: 'sarah@techstart.com', Status: 'Open' },
+    { Id: '00QD0000002STQLMA4', FirstName: 'Michael', LastName: 'Chen', Company: 'Finance Corp', Email: 'michael@finance.com', Status: 'Contacted' },
+  ],
+  Case: [
+    { Id: '500D0000003BVfIAW', CaseNumber: 'CS-00001', Subject: 'License activation issue', Status: 'Open', Priority: 'High', Description: 'Customer cannot activate license' },
+    { Id: '500D0000003BVgIAW', CaseNumber: 'CS-00002', Subject: 'Billing question', Status: 'Resolved', Priority: 'Medium', Description: 'Inquiry about renewal pricing' },
+  ],
+};
 
-  return (samples[objectName] ?? []).slice(0, limit);
+function buildMockSalesforceData(objectName: string, limit: number): SampleRow[] {
+  return (SALESFORCE_MOCK_SAMPLES[objectName] ?? []).slice(0, limit);
 }
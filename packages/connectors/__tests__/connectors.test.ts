@@ -4,6 +4,7 @@ import { CoreDirectorConnector } from '../jackhenry/CoreDirectorConnector.js';
 import { SymitarConnector } from '../jackhenry/SymitarConnector.js';
 import { ConnectorRegistry } from '../ConnectorRegistry.js';
 import type { ConnectorField } from '../IConnector.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
 
 // ─── SilverLakeConnector (mock mode) ─────────────────────────────────────────
 
@@ -380,3 +381,31 @@ describe('Compliance tag completeness', () => {
     expect(fieldsWithNotes.length).toBeGreaterThan(0);
   });
 });
+
+// ─── mapWithConcurrency ──────────────────────────────────────────────────────
+
+describe('mapWithConcurrency', () => {
+  it('keeps input order and never exceeds the concurrency limit', async () => {
+    let inFlight = 0;
+    let peak = 0;
+    const results = await mapWithConcurrency([30, 10, 20, 0, 5], 2, async (delay, index) => {
+      inFlight += 1;
+      peak = Math.max(peak, inFlight);
+      await new Promise((resolve) => setTimeout(resolve, delay));
+      inFlight -= 1;
+      return `${index}:${delay}`;
+    });
+
+    expect(results).toEqual(['0:30', '1:10', '2:20', '3:0', '4:5']);
+    expect(peak).toBe(2);
+  });
+
+  it('rejects when any call fails', async () => {
+    await expect(
+      mapWithConcurrency(['ok', 'bad'], 4, async (value) => {
+        if (value === 'bad') throw new Error('describe failed');
+        return value;
+      }),
+    ).rejects.toThrow('describe failed');
+  });
+});
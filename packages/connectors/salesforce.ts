@@ -1,9 +1,9 @@
+import { createHash } from 'node:crypto';
 import { v4 as uuidv4 } from 'uuid';
-import jsforce from 'jsforce';
+import jsforce, { type Connection } from 'jsforce';
 import type { Entity, Field, Relationship } from './types.js';
-import { normalizeSalesforceType } from './utils/typeUtils.js';
 import { getSalesforceMockObjectTemplates } from './salesforceMockCatalog.js';
-import { loadSalesforceValidationRuleIndex } from './salesforceValidationRules.js';
+import { loadSalesforceSchema } from './salesforceDescribe.js';
 
 export interface SalesforceConnectionInput {
   objects: string[];
@@ -17,25 +17,53 @@ export interface SalesforceConnectionInput {
   };
 }
 
-interface SalesforceDescribeField {
-  name: string;
-  label?: string;
-  type: string;
-  length?: number;
-  precision?: number;
-  scale?: number;
-  nillable?: boolean;
-  defaultedOnCreate?: boolean;
-  externalId?: boolean;
-  picklistValues?: Array<{ value?: string | null }> | null;
-  referenceTo?: string[];
+type SalesforceSessionCredentials = NonNullable<SalesforceConnectionInput['credentials']>;
+
+const SESSION_IDLE_TTL_MS = 5 * 60_000;
+const MAX_CACHED_SESSIONS = 50;
+
+// Logged-in connections keyed by a digest of the resolved credentials, so
+// repeated schema loads reuse the session (and its describe cache) instead of
+// logging in again. Entries expire after an idle window; a failed fetch evicts.
+const sessions = new Map<string, { conn: Promise<Connection>; expiresAt: number }>();
+
+async function openConnection(creds: SalesforceSessionCredentials): Promise<Connection> {
+  const conn = new jsforce.Connection(
+    creds.accessToken && creds.instanceUrl
+      ? { accessToken: creds.accessToken, instanceUrl: creds.instanceUrl }
+      : { loginUrl: creds.loginUrl },
+  );
+
+  if (!creds.accessToken && creds.username && creds.password) {
+    await conn.login(creds.username, `${creds.password}${creds.securityToken ?? ''}`);
+  }
+  return conn;
 }
 
-interface SalesforceObjectDescribe {
-  name: string;
-  label: string;
-  labelPlural?: string;
-  fields: SalesforceDescribeField[];
+function acquireSession(creds: SalesforceSessionCredentials): { key: string; conn: Promise<Connection> } {
+  const key = createHash('sha256')
+    .update(JSON.stringify([
+      creds.loginUrl,
+      creds.username,
+      creds.password,
+      creds.securityToken,
+      creds.accessToken,
+      creds.instanceUrl,
+    ]))
+    .digest('base64url');
+  const now = Date.now();
+  const cached = sessions.get(key);
+  const conn = cached && cached.expiresAt > now ? cached.conn : openConnection(creds);
+
+  // Re-insert so Map order tracks recency for eviction.
+  sessions.delete(key);
+  sessions.set(key, { conn, expiresAt: now + SESSION_IDLE_TTL_MS });
+  while (sessions.size > MAX_CACHED_SESSIONS) {
+    const oldest = sessions.keys().next();
+    if (oldest.done) break;
+    sessions.delete(oldest.value);
+  }
+  return { key, conn };
 }
 
 export async function fetchSalesforceSchema(
@@ -51,187 +79,110 @@ export async function fetchSalesforceSchema(
     instanceUrl: input.credentials?.instanceUrl || process.env.SF_INSTANCE_URL,
   };
 
+  const session = acquireSession(creds);
   try {
-    const conn = new jsforce.Connection(
-      creds.accessToken && creds.instanceUrl
-        ? { accessToken: creds.accessToken, instanceUrl: creds.instanceUrl }
-        : { loginUrl: creds.loginUrl },
-    );
-
-    if (!creds.accessToken && creds.username && creds.password) {
-      await conn.login(creds.username, `${creds.password}${creds.securityToken ?? ''}`);
-    }
-
-    const entities: Entity[] = [];
-    const fields: Field[] = [];
-    // Collect pending relationships to resolve after all entities are known
-    const pendingRelationships: Array<{ fromEntityId: string; referenceTo: string; viaField: string }> = [];
-    const describedObjects: Array<{
-      objectName: string;
-      entityId: string;
-      desc: SalesforceObjectDescribe;
-    }> = [];
-
-    for (const objectName of input.objects) {
-      const desc = await conn.sobject(objectName).describe() as unknown as SalesforceObjectDescribe;
-      const entityId = uuidv4();
-      describedObjects.push({ objectName, entityId, desc });
-      entities.push({
-        id: entityId,
-        systemId,
-        name: desc.name,
-        label: desc.label,
-        description: desc.labelPlural,
-      });
-    }
-
-    const validationRuleIndex = await loadSalesforceValidationRuleIndex({
-      conn,
-      objectFieldNames: new Map(
-        describedObjects.map(({ objectName, desc }) => [objectName, desc.fields.map((field) => field.name)]),
-      ),
-    });
-
-    for (const { objectName, entityId, desc } of describedObjects) {
-      const objectValidationRules = validationRuleIndex.get(objectName);
-      for (const f of desc.fields) {
-        fields.push({
-          id: uuidv4(),
-          entityId,
-          name: f.name,
-          label: f.label,
-          dataType: normalizeSalesforceType(f.type),
-          length: f.length,
-          precision: f.precision,
-          scale: f.scale,
-          required: !f.nillable && !f.defaultedOnCreate,
-          isExternalId: !!f.externalId,
-          picklistValues: f.picklistValues?.map((p) => p.value).filter((value): value is string => Boolean(value)),
-          validationRules: objectValidationRules?.get(f.name),
-        });
-
-        if (f.referenceTo?.length) {
-          pendingRelationships.push({
-            fromEntityId: entityId,
-            referenceTo: String(f.referenceTo[0]),
-            viaField: f.name,
-          });
-        }
-      }
-    }
-
-    // Build name → id map after all entities have been collected
-    const nameToEntityId = new Map(entities.map((e) => [e.name, e.id]));
-
-    const relationships: Relationship[] = pendingRelationships.map((pr) => ({
-      fromEntityId: pr.fromEntityId,
-      toEntityId: nameToEntityId.get(pr.referenceTo) ?? pr.fromEntityId,
-      type: 'lookup',
-      viaField: pr.viaField,
-    }));
-
-    return { entities, fields, relationships, mode: 'live' };
+    const conn = await session.conn;
+    const schema = await loadSalesforceSchema(conn, input.objects, systemId);
+    return { ...schema, mode: 'live' };
   } catch {
+    sessions.delete(session.key);
     return buildMockSalesforceSchema(systemId, input.objects);
   }
 }
 
+const SALESFORCE_SEEDED_TEMPLATES: Record<string, Array<Omit<Field, 'id' | 'entityId'>>> = {
+  Account: [
+    { name: 'External_ID__c', dataType: 'string', isExternalId: true },
+    { name: 'Name', dataType: 'string', required: true },
+    { name: 'BillingStreet', dataType: 'string' },
+    { name: 'BillingCity', dataType: 'string' },
+    { name: 'BillingPostalCode', dataType: 'string' },
+    { name: 'BillingCountry', dataType: 'string' },
+  ],
+  Contact: [
+    { name: 'FirstName', dataType: 'string' },
+    { name: 'LastName', dataType: 'string', required: true },
+    { name: 'Email', dataType: 'email' },
+    { name: 'Phone', dataType: 'phone' },
+    { name: 'AccountId', dataType: 'reference' },
+  ],
+  Sales_Area__c: [
+    {
+      name: 'Sales_Org__c',
+      dataType: 'picklist',
+      picklistValues: ['1000', '2000', '3000'],
+    },
+    { name: 'Account__c', dataType: 'reference' },
+  ],
+  FinancialAccount: [
+    { name: 'FinancialAccountNumber', dataType: 'string', required: true },
+    { name: 'CurrentBalance', dataType: 'decimal' },
+    { name: 'AvailableBalance', dataType: 'decimal' },
+    { name: 'OpenDate', dataType: 'date' },
+    { name: 'Status', dataType: 'picklist', picklistValues: ['Open', 'Inactive', 'Closed'] },
+    { name: 'FinancialAccountType', dataType: 'picklist', picklistValues: ['Checking', 'Savings', 'Loan', 'Certificate', 'Line of Credit'] },
+  ],
+  PartyProfile: [
+    { name: 'CIFNumber', dataType: 'string', isExternalId: true },
+    { name: 'LegalName', dataType: 'string', required: true },
+    { name: 'TaxId', dataType: 'string' },
+    { name: 'BirthDate', dataType: 'date' },
+    { name: 'PrimaryEmail', dataType: 'email' },
+    { name: 'PrimaryPhone', dataType: 'phone' },
+    { name: 'AddressLine1', dataType: 'string' },
+    { name: 'City', dataType: 'string' },
+    { name: 'StateCode', dataType: 'string' },
+    { name: 'PostalCode', dataType: 'string' },
+    { name: 'CountryCode', dataType: 'string' },
+  ],
+  AccountParticipant: [
+    { name: 'FinancialAccountId', dataType: 'reference', required: true },
+    { name: 'PartyProfileId', dataType: 'reference', required: true },
+    { name: 'ParticipantRole', dataType: 'picklist', picklistValues: ['Primary Owner', 'Joint Owner', 'Authorized Signer', 'Beneficiary'] },
+    { name: 'StartDate', dataType: 'date' },
+    { name: 'EndDate', dataType: 'date' },
+  ],
+  Opportunity: [
+    { name: 'Name', dataType: 'string', required: true },
+    {
+      name: 'StageName',
+      dataType: 'picklist',
+      picklistValues: ['Prospecting', 'Qualification', 'Closed Won', 'Closed Lost'],
+      validationRules: [{
+        name: 'Closed_Won_Requires_Amount_And_CloseDate',
+        entityName: 'Opportunity',
+        errorMessage: 'Closed Won opportunities require Amount and CloseDate.',
+        referencedFields: ['StageName', 'Amount', 'CloseDate'],
+      }],
+    },
+    {
+      name: 'Amount',
+      dataType: 'decimal',
+      validationRules: [{
+        name: 'Closed_Won_Requires_Amount_And_CloseDate',
+        entityName: 'Opportunity',
+        errorMessage: 'Closed Won opportunities require Amount and CloseDate.',
+        referencedFields: ['StageName', 'Amount', 'CloseDate'],
+      }],
+    },
+    {
+      name: 'CloseDate',
+      dataType: 'date',
+      validationRules: [{
+        name: 'Closed_Won_Requires_Amount_And_CloseDate',
+        entityName: 'Opportunity',
+        errorMessage: 'Closed Won opportunities require Amount and CloseDate.',
+        referencedFields: ['StageName', 'Amount', 'CloseDate'],
+      }],
+    },
+  ],
+};
+
 function buildMockSalesforceSchema(
   systemId: string,
   objects: string[],
 ): { entities: Entity[]; fields: Field[]; relationships: Relationship[]; mode: 'mock' } {
-  const seededTemplates: Record<string, Array<Omit<Field, 'id' | 'entityId'>>> = {
-    Account: [
-      { name: 'External_ID__c', dataType: 'string', isExternalId: true },
-      { name: 'Name', dataType: 'string', required: true },
-      { name: 'BillingStreet', dataType: 'string' },
-      { name: 'BillingCity', dataType: 'string' },
-      { name: 'BillingPostalCode', dataType: 'string' },
-      { name: 'BillingCountry', dataType: 'string' },
-    ],
-    Contact: [
-      { name: 'FirstName', dataType: 'string' },
-      { name: 'LastName', dataType: 'string', required: true },
-      { name: 'Email', dataType: 'email' },
-      { name: 'Phone', dataType: 'phone' },
-      { name: 'AccountId', dataType: 'reference' },
-    ],
-    Sales_Area__c: [
-      {
-        name: 'Sales_Org__c',
-        dataType: 'picklist',
-        picklistValues: ['1000', '2000', '3000'],
-      },
-      { name: 'Account__c', dataType: 'reference' },
-    ],
-    FinancialAccount: [
-      { name: 'FinancialAccountNumber', dataType: 'string', required: true },
-      { name: 'CurrentBalance', dataType: 'decimal' },
-      { name: 'AvailableBalance', dataType: 'decimal' },
-      { name: 'OpenDate', dataType: 'date' },
-      { name: 'Status', dataType: 'picklist', picklistValues: ['Open', 'Inactive', 'Closed'] },
-      { name: 'FinancialAccountType', dataType: 'picklist', picklistValues: ['Checking', 'Savings', 'Loan', 'Certificate', 'Line of Credit'] },
-    ],
-    PartyProfile: [
-      { name: 'CIFNumber', dataType: 'string', isExternalId: true },
-      { name: 'LegalName', dataType: 'string', required: true },
-      { name: 'TaxId', dataType: 'string' },
-      { name: 'BirthDate', dataType: 'date' },
-      { name: 'PrimaryEmail', dataType: 'email' },
-      { name: 'PrimaryPhone', dataType: 'phone' },
-      { name: 'AddressLine1', dataType: 'string' },
-      { name: 'City', dataType: 'string' },
-      { name: 'StateCode', dataType: 'string' },
-      { name: 'PostalCode', dataType: 'string' },
-      { name: 'CountryCode', dataType: 'string' },
-    ],
-    AccountParticipant: [
-      { name: 'FinancialAccountId', dataType: 'reference', required: true },
-      { name: 'PartyProfileId', dataType: 'reference', required: true },
-      { name: 'ParticipantRole', dataType: 'picklist', picklistValues: ['Primary Owner', 'Joint Owner', 'Authorized Signer', 'Beneficiary'] },
-      { name: 'StartDate', dataType: 'date' },
-      { name: 'EndDate', dataType: 'date' },
-    ],
-    Opportunity: [
-      { name: 'Name', dataType: 'string', required: true },
-      {
-        name: 'StageName',
-        dataType: 'picklist',
-        picklistValues: ['Prospecting', 'Qualification', 'Closed Won', 'Closed Lost'],
-        validationRules: [{
-          name: 'Closed_Won_Requires_Amount_And_CloseDate',
-          entityName: 'Opportunity',
-          errorMessage: 'Closed Won opportunities require Amount and CloseDate.',
-          referencedFields: ['StageName', 'Amount', 'CloseDate'],
-        }],
-      },
-      {
-        name: 'Amount',
-        dataType: 'decimal',
-        validationRules: [{
-          name: 'Closed_Won_Requires_Amount_And_CloseDate',
-          entityName: 'Opportunity',
-          errorMessage: 'Closed Won opportunities require Amount and CloseDate.',
-          referencedFields: ['StageName', 'Amount', 'CloseDate'],
-        }],
-      },
-      {
-        name: 'CloseDate',
-        dataType: 'date',
-        validationRules: [{
-          name: 'Closed_Won_Requires_Amount_And_CloseDate',
-          entityName: 'Opportunity',
-          errorMessage: 'Closed Won opportunities require Amount and CloseDate.',
-          referencedFields: ['StageName', 'Amount', 'CloseDate'],
-        }],
-      },
-    ],
-  };
-
-  const templates = {
-    ...seededTemplates,
-    ...getSalesforceMockObjectTemplates(objects),
-  };
+  const generatedTemplates = getSalesforceMockObjectTemplates(objects);
 
   const entities: Entity[] = [];
   const fields: Field[] = [];
@@ -239,7 +190,8 @@ function buildMockSalesforceSchema(
   for (const objectName of objects) {
     const entityId = uuidv4();
     entities.push({ id: entityId, systemId, name: objectName, label: objectName });
-    for (const template of templates[objectName] ?? []) {
+    const templates = generatedTemplates[objectName] ?? SALESFORCE_SEEDED_TEMPLATES[objectName] ?? [];
+    for (const template of templates) {
       fields.push({ id: uuidv4(), entityId, ...template });
     }
   }
@@ -0,0 +1,239 @@
+import { v4 as uuidv4 } from 'uuid';
+import type { Connection } from 'jsforce';
+import type { Entity, Field, FieldValidationRule, Relationship } from './types.js';
+import { mapWithConcurrency, METADATA_FETCH_CONCURRENCY } from './utils/concurrency.js';
+import { normalizeSalesforceType } from './utils/typeUtils.js';
+import {
+  loadSalesforceValidationRuleIndex,
+  querySalesforceValidationRules,
+} from './salesforceValidationRules.js';
+
+/** Salesforce accepts at most 25 subrequests per composite batch call. */
+export const SALESFORCE_COMPOSITE_BATCH_LIMIT = 25;
+
+/**
+ * How long a describe result is reused for the same connection. sObject
+ * schemas change rarely; override with SALESFORCE_DESCRIBE_CACHE_TTL_MS.
+ */
+export const SALESFORCE_DESCRIBE_CACHE_TTL_MS = Number(process.env.SALESFORCE_DESCRIBE_CACHE_TTL_MS) || 10 * 60_000;
+
+interface CachedDescribe {
+  value: unknown;
+  expiresAt: number;
+}
+
+// Keyed by connection rather than org so entries follow the pooled session
+// (and that user's field-level security) and are collected along with it.
+const describeCache = new WeakMap<Connection, Map<string, CachedDescribe>>();
+
+export interface SalesforceDescribeField {
+  name: string;
+  label?: string;
+  type: string;
+  length?: number;
+  precision?: number;
+  scale?: number;
+  nillable?: boolean;
+  defaultedOnCreate?: boolean;
+  externalId?: boolean;
+  picklistValues?: Array<{ value?: string | null }> | null;
+  referenceTo?: string[];
+}
+
+export interface SalesforceObjectDescribe {
+  name: string;
+  label: string;
+  labelPlural?: string;
+  fields: SalesforceDescribeField[];
+}
+
+interface CompositeBatchError {
+  errorCode?: string;
+  message?: string;
+}
+
+interface CompositeBatchResponse<T> {
+  hasErrors: boolean;
+  results: Array<{
+    statusCode: number;
+    result: T | CompositeBatchError[] | null;
+  }>;
+}
+
+function chunk<T>(items: readonly T[], size: number): T[][] {
+  const chunks: T[][] = [];
+  for (let index = 0; index < items.length; index += size) {
+    chunks.push(items.slice(index, index + size));
+  }
+  return chunks;
+}
+
+/**
+ * Forget cached describes for `conn`, e.g. after fields were added in the org.
+ */
+export function clearSalesforceDescribeCache(conn: Connection): void {
+  describeCache.delete(conn);
+}
+
+/**
+ * Describe many sObjects with one composite batch request per 25 objects
+ * instead of one REST call per object. Results keep the input order; a failed
+ * subrequest throws, matching what a single sobject().describe() would do.
+ * Describes fetched on the same connection within the cache TTL are reused,
+ * so only uncached objects go over the wire.
+ */
+export async function describeSalesforceObjects<T>(
+  conn: Connection,
+  objectNames: readonly string[],
+  options: { now?: () => number } = {},
+): Promise<T[]> {
+  const now = options.now ?? Date.now;
+  const entries = describeCache.get(conn) ?? new Map<string, CachedDescribe>();
+  describeCache.set(conn, entries);
+
+  const startedAt = now();
+  const missing = [...new Set(objectNames)].filter((name) => {
+    const entry = entries.get(name);
+    return !entry || entry.expiresAt <= startedAt;
+  });
+
+  const batches = chunk(missing, SALESFORCE_COMPOSITE_BATCH_LIMIT);
+  await mapWithConcurrency(batches, METADATA_FETCH_CONCURRENCY, async (names) => {
+    const response = await conn.requestPost<CompositeBatchResponse<T>>('/composite/batch', {
+      batchRequests: names.map((name) => ({
+        method: 'GET',
+        url: `v${conn.version}/sobjects/${encodeURIComponent(name)}/describe`,
+      })),
+    });
+
+    names.forEach((name, index) => {
+      const entry = response.results[index];
+      if (!entry || entry.statusCode >= 400 || !entry.result || Array.isArray(entry.result)) {
+        const detail = Array.isArray(entry?.result) ? entry.result[0]?.message : undefined;
+        throw new Error(`Salesforce describe failed for ${name}: ${detail ?? `HTTP ${entry?.statusCode ?? 'no result'}`}`);
+      }
+      entries.set(name, { value: entry.result, expiresAt: now() + SALESFORCE_DESCRIBE_CACHE_TTL_MS });
+    });
+  });
+
+  return objectNames.map((name) => entries.get(name)!.value as T);
+}
+
+/**
+ * Collect picklist values in one pass. Large picklists (countries, status
+ * codes) can carry hundreds of entries, so skip the map/filter intermediate.
+ * Non-picklist fields describe as [] and stay [], which schema fingerprints
+ * rely on.
+ */
+function picklistValuesOf(entries: SalesforceDescribeField['picklistValues']): string[] | undefined {
+  if (!Array.isArray(entries)) return undefined;
+  const values: string[] = [];
+  for (const entry of entries) {
+    if (entry.value) values.push(entry.value);
+  }
+  return values;
+}
+
+/**
+ * Field names per requested object, in the shape the validation rule index
+ * expects.
+ */
+export function describedFieldNames(
+  objectNames: readonly string[],
+  describes: readonly SalesforceObjectDescribe[],
+): Map<string, string[]> {
+  return new Map(describes.map((desc, index) => [objectNames[index], desc.fields.map((field) => field.name)]));
+}
+
+/**
+ * Turn describe results into entities, fields and lookup relationships.
+ * `describes` must be in the same order as `objectNames`, as returned by
+ * describeSalesforceObjects. Lookups to objects outside the set point back at
+ * the referencing entity.
+ */
+export function buildSalesforceSchema(input: {
+  systemId: string;
+  objectNames: readonly string[];
+  describes: readonly SalesforceObjectDescribe[];
+  validationRuleIndex: Map<string, Map<string, FieldValidationRule[]>>;
+}): { entities: Entity[]; fields: Field[]; relationships: Relationship[] } {
+  const entities: Entity[] = [];
+  const fields: Field[] = [];
+  // Collect pending relationships to resolve after all entities are known
+  const pendingRelationships: Array<{ fromEntityId: string; referenceTo: string; viaField: string }> = [];
+
+  input.describes.forEach((desc, index) => {
+    const entityId = uuidv4();
+    entities.push({
+      id: entityId,
+      systemId: input.systemId,
+      name: desc.name,
+      label: desc.label,
+      description: desc.labelPlural,
+    });
+
+    const objectValidationRules = input.validationRuleIndex.get(input.objectNames[index]);
+    for (const f of desc.fields) {
+      fields.push({
+        id: uuidv4(),
+        entityId,
+        name: f.name,
+        label: f.label,
+        dataType: normalizeSalesforceType(f.type),
+        length: f.length,
+        precision: f.precision,
+        scale: f.scale,
+        required: !f.nillable && !f.defaultedOnCreate,
+        isKey: f.type === 'id',
+        isExternalId: !!f.externalId,
+        picklistValues: picklistValuesOf(f.picklistValues),
+        validationRules: objectValidationRules?.get(f.name),
+      });
+
+      if (f.referenceTo?.length) {
+        pendingRelationships.push({
+          fromEntityId: entityId,
+          referenceTo: String(f.referenceTo[0]),
+          viaField: f.name,
+        });
+      }
+    }
+  });
+
+  // Build name → id map after all entities have been collected
+  const nameToEntityId = new Map(entities.map((e) => [e.name, e.id]));
+  const relationships: Relationship[] = pendingRelationships.map((pr) => ({
+    fromEntityId: pr.fromEntityId,
+    toEntityId: nameToEntityId.get(pr.referenceTo) ?? pr.fromEntityId,
+    type: 'lookup',
+    viaField: pr.viaField,
+  }));
+
+  return { entities, fields, relationships };
+}
+
+/**
+ * Describe `objectNames` and build the schema, validation rules included.
+ * Shared by SalesforceConnector and fetchSalesforceSchema; describe failures
+ * reject so callers can fall back to mock data.
+ */
+export async function loadSalesforceSchema(
+  conn: Connection,
+  objectNames: readonly string[],
+  systemId: string,
+): Promise<{ entities: Entity[]; fields: Field[]; relationships: Relationship[] }> {
+  // The tooling query only needs object names, so it runs alongside the
+  // describe batches instead of after them.
+  const pendingValidationRules = querySalesforceValidationRules(conn, objectNames);
+
+  // One composite batch call per 25 objects; results come back in request
+  // order so entity output stays deterministic.
+  const describes = await describeSalesforceObjects<SalesforceObjectDescribe>(conn, objectNames);
+  const validationRuleIndex = await loadSalesforceValidationRuleIndex({
+    conn,
+    objectFieldNames: describedFieldNames(objectNames, describes),
+    pendingRecords: pendingValidationRules,
+  });
+
+  return buildSalesforceSchema({ systemId, objectNames, describes, validationRuleIndex });
+}
@@ -107,12 +107,16 @@ export function buildValidationRuleIndex(input: {
   return byObject;
 }
 
-export async function loadSalesforceValidationRuleIndex(input: {
-  conn: Connection;
-  objectFieldNames: Map<string, string[]>;
-}): Promise<Map<string, Map<string, FieldValidationRule[]>>> {
-  const objectNames = [...input.objectFieldNames.keys()];
-  if (!objectNames.length) return new Map();
+/**
+ * Run the active ValidationRule tooling query for `objectNames`. Resolves to
+ * null instead of rejecting so callers can start it alongside the describe
+ * batches and only wait for it once field names are known.
+ */
+export async function querySalesforceValidationRules(
+  conn: Connection,
+  objectNames: readonly string[],
+): Promise<ValidationRuleRecord[] | null> {
+  if (!objectNames.length) return [];
 
   try {
     const soql = [
@@ -123,12 +127,26 @@ export async function loadSalesforceValidationRuleIndex(input: {
       `AND EntityDefinition.QualifiedApiName IN (${objectNames.map((name) => `'${escapeSoqlString(name)}'`).join(', ')})`,
     ].join(' ');
 
-    const result = await input.conn.tooling.query<ValidationRuleRecord>(soql);
-    return buildValidationRuleIndex({
-      objectFieldNames: input.objectFieldNames,
-      records: result.records ?? [],
-    });
+    const result = await conn.tooling.query<ValidationRuleRecord>(soql);
+    return result.records ?? [];
   } catch {
-    return buildUnavailableValidationRuleIndex(input.objectFieldNames);
+    return null;
   }
 }
+
+export async function loadSalesforceValidationRuleIndex(input: {
+  conn: Connection;
+  objectFieldNames: Map<string, string[]>;
+  /** Result of an earlier querySalesforceValidationRules call, if one is in flight. */
+  pendingRecords?: Promise<ValidationRuleRecord[] | null>;
+}): Promise<Map<string, Map<string, FieldValidationRule[]>>> {
+  const objectNames = [...input.objectFieldNames.keys()];
+  if (!objectNames.length) return new Map();
+
+  const records = await (input.pendingRecords ?? querySalesforceValidationRules(input.conn, objectNames));
+  if (!records) return buildUnavailableValidationRuleIndex(input.objectFieldNames);
+  return buildValidationRuleIndex({
+    objectFieldNames: input.objectFieldNames,
+    records,
+  });
+}
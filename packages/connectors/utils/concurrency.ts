@@ -0,0 +1,43 @@
+/**
+ * Bounded-concurrency helpers for connector I/O.
+ *
+ * Metadata calls (describe, $metadata, catalog lookups) are independent
+ * round trips, so running them one at a time makes schema fetches scale with
+ * N × RTT. These helpers fan them out while capping how many are in flight so
+ * we stay inside the remote system's concurrent-request limits.
+ */
+
+/**
+ * Default cap on concurrent metadata calls per schema fetch. Salesforce and
+ * SAP both throttle long-running concurrent requests per org/user, so keep
+ * this modest; override with CONNECTOR_METADATA_CONCURRENCY.
+ */
+export const METADATA_FETCH_CONCURRENCY = Math.max(
+  1,
+  Number(process.env.CONNECTOR_METADATA_CONCURRENCY) || 5,
+);
+
+/**
+ * Map `items` through `fn` with at most `limit` calls in flight.
+ * Results keep the input order; the first rejection rejects the whole call.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>,
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  const workerCount = Math.max(1, Math.min(Math.floor(limit) || 1, items.length));
+  let next = 0;
+
+  const worker = async (): Promise<void> => {
+    while (next < items.length) {
+      const index = next;
+      next += 1;
+      results[index] = await fn(items[index], index);
+    }
+  };
+
+  await Promise.all(Array.from({ length: workerCount }, () => worker()));
+  return results;
+}